@@ -42,6 +42,38 @@ class PodcastAnythingStack(cdk.Stack):
         elevenlabs_duo_voice_id = os.environ.get("ELEVENLABS_DUO_VOICE_ID", elevenlabs_voice_id)
         elevenlabs_model_id = os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
         elevenlabs_output_format = os.environ.get("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")
+        tts_max_concurrency = os.environ.get("TTS_MAX_CONCURRENCY", "4")
+        tts_cache_backend = os.environ.get("TTS_CACHE_BACKEND", "off")
+        tts_cache_max_age_sec = os.environ.get("TTS_CACHE_MAX_AGE_SEC", "604800")
+        tts_max_attempts = os.environ.get("TTS_MAX_ATTEMPTS", "4")
+        tts_requests_per_sec = os.environ.get("TTS_REQUESTS_PER_SEC", "")
+        tts_chars_per_sec = os.environ.get("TTS_CHARS_PER_SEC", "")
+        audio_upload_mode = os.environ.get("AUDIO_UPLOAD_MODE", "put")
+        audio_checkpoints = os.environ.get("AUDIO_CHECKPOINTS", "false")
+        voice_pace_calibration = os.environ.get("VOICE_PACE_CALIBRATION", "false")
+        rewrite_strategy = os.environ.get("REWRITE_STRATEGY", "direct")
+        rewrite_section_tokens = os.environ.get("REWRITE_SECTION_TOKENS", "6000")
+        rewrite_max_concurrency = os.environ.get("REWRITE_MAX_CONCURRENCY", "4")
+        script_cache_backend = os.environ.get("SCRIPT_CACHE_BACKEND", "off")
+        script_cache_max_age_sec = os.environ.get("SCRIPT_CACHE_MAX_AGE_SEC", "2592000")
+        bedrock_prompt_cache = os.environ.get("BEDROCK_PROMPT_CACHE", "false")
+        bedrock_model_routes = os.environ.get("BEDROCK_MODEL_ROUTES", "")
+        script_target_minutes = os.environ.get("SCRIPT_TARGET_MINUTES", "8")
+        script_generation = os.environ.get("SCRIPT_GENERATION", "whole")
+        script_segment_count = os.environ.get("SCRIPT_SEGMENT_COUNT", "4")
+        source_compression_tokens = os.environ.get("SOURCE_COMPRESSION_TOKENS", "")
+        article_extractor = os.environ.get("ARTICLE_EXTRACTOR", "auto")
+        article_max_bytes = os.environ.get("ARTICLE_MAX_BYTES", "5242880")
+        article_cache_backend = os.environ.get("ARTICLE_CACHE_BACKEND", "off")
+        article_cache_max_age_sec = os.environ.get("ARTICLE_CACHE_MAX_AGE_SEC", "604800")
+        cache_sweep_interval_sec = os.environ.get("CACHE_SWEEP_INTERVAL_SEC", "3600")
+        fetch_max_concurrency = os.environ.get("FETCH_MAX_CONCURRENCY", "8")
+        fetch_max_per_host = os.environ.get("FETCH_MAX_PER_HOST", "2")
+        fetch_budget_sec = os.environ.get("FETCH_BUDGET_SEC", "60")
+        audio_synthesis_mode = os.environ.get("AUDIO_SYNTHESIS_MODE", "lambda").strip().lower()
+        if audio_synthesis_mode not in {"lambda", "map", "streaming"}:
+            raise ValueError("AUDIO_SYNTHESIS_MODE must be one of 'lambda', 'map', 'streaming'.")
+        audio_map_max_concurrency = int(os.environ.get("AUDIO_MAP_MAX_CONCURRENCY", "10"))
 
         bucket = s3.Bucket(
             self,
@@ -52,6 +84,20 @@ class PodcastAnythingStack(cdk.Stack):
             enforce_ssl=True,
             auto_delete_objects=True,
             removal_policy=cdk.RemovalPolicy.DESTROY,
+            # S3 expires cache entries so the Lambdas never list a cache prefix to age them
+            # out; expiry rounds the configured max age up to whole days.
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    id=f"Expire{name}Cache",
+                    prefix=prefix,
+                    expiration=cdk.Duration.days(max(1, -(-int(max_age_sec) // 86400))),
+                )
+                for name, prefix, max_age_sec in (
+                    ("Tts", "cache/tts/", tts_cache_max_age_sec),
+                    ("Script", "cache/scripts/", script_cache_max_age_sec),
+                    ("Article", "cache/articles/", article_cache_max_age_sec),
+                )
+            ],
         )
 
         common_env = {
@@ -65,6 +111,34 @@ class PodcastAnythingStack(cdk.Stack):
             "ELEVENLABS_DUO_VOICE_ID": elevenlabs_duo_voice_id,
             "ELEVENLABS_MODEL_ID": elevenlabs_model_id,
             "ELEVENLABS_OUTPUT_FORMAT": elevenlabs_output_format,
+            "TTS_MAX_CONCURRENCY": tts_max_concurrency,
+            "TTS_CACHE_BACKEND": tts_cache_backend,
+            "TTS_CACHE_MAX_AGE_SEC": tts_cache_max_age_sec,
+            "TTS_MAX_ATTEMPTS": tts_max_attempts,
+            "TTS_REQUESTS_PER_SEC": tts_requests_per_sec,
+            "TTS_CHARS_PER_SEC": tts_chars_per_sec,
+            "AUDIO_UPLOAD_MODE": audio_upload_mode,
+            "AUDIO_CHECKPOINTS": audio_checkpoints,
+            "VOICE_PACE_CALIBRATION": voice_pace_calibration,
+            "REWRITE_STRATEGY": rewrite_strategy,
+            "REWRITE_SECTION_TOKENS": rewrite_section_tokens,
+            "REWRITE_MAX_CONCURRENCY": rewrite_max_concurrency,
+            "SCRIPT_CACHE_BACKEND": script_cache_backend,
+            "SCRIPT_CACHE_MAX_AGE_SEC": script_cache_max_age_sec,
+            "BEDROCK_PROMPT_CACHE": bedrock_prompt_cache,
+            "BEDROCK_MODEL_ROUTES": bedrock_model_routes,
+            "SCRIPT_TARGET_MINUTES": script_target_minutes,
+            "SCRIPT_GENERATION": script_generation,
+            "SCRIPT_SEGMENT_COUNT": script_segment_count,
+            "SOURCE_COMPRESSION_TOKENS": source_compression_tokens,
+            "ARTICLE_EXTRACTOR": article_extractor,
+            "ARTICLE_MAX_BYTES": article_max_bytes,
+            "ARTICLE_CACHE_BACKEND": article_cache_backend,
+            "ARTICLE_CACHE_MAX_AGE_SEC": article_cache_max_age_sec,
+            "CACHE_SWEEP_INTERVAL_SEC": cache_sweep_interval_sec,
+            "FETCH_MAX_CONCURRENCY": fetch_max_concurrency,
+            "FETCH_MAX_PER_HOST": fetch_max_per_host,
+            "FETCH_BUDGET_SEC": fetch_budget_sec,
         }
 
         deps_layer = lambda_.LayerVersion(
@@ -92,7 +166,9 @@ class PodcastAnythingStack(cdk.Stack):
             handler="podcast_anything.handlers.fetch_article.handler",
             code=lambda_.Code.from_asset(str(src_path)),
             memory_size=512,
-            timeout=cdk.Duration.seconds(30),
+            # Multi-source reads stop at FETCH_BUDGET_SEC; the margin covers merging the
+            # sources and writing them to S3.
+            timeout=cdk.Duration.seconds(int(fetch_budget_sec) + 30),
             environment=common_env,
             layers=[deps_layer],
         )
@@ -104,7 +180,8 @@ class PodcastAnythingStack(cdk.Stack):
             handler="podcast_anything.handlers.rewrite_script.handler",
             code=lambda_.Code.from_asset(str(src_path)),
             memory_size=512,
-            timeout=cdk.Duration.seconds(60),
+            # Map-reduce rewrites make one round of section calls before the script call.
+            timeout=cdk.Duration.minutes(3),
             environment=common_env,
         )
 
@@ -120,22 +197,76 @@ class PodcastAnythingStack(cdk.Stack):
             layers=[deps_layer],
         )
 
+        audio_fns = [generate_audio_fn]
+        if audio_synthesis_mode == "map":
+            plan_audio_fn = lambda_.Function(
+                self,
+                "PlanAudioFn",
+                runtime=lambda_.Runtime.PYTHON_3_11,
+                handler="podcast_anything.handlers.generate_audio.plan_handler",
+                code=lambda_.Code.from_asset(str(src_path)),
+                memory_size=512,
+                timeout=cdk.Duration.seconds(30),
+                environment=common_env,
+                layers=[deps_layer],
+            )
+            synthesize_chunk_fn = lambda_.Function(
+                self,
+                "SynthesizeAudioChunkFn",
+                runtime=lambda_.Runtime.PYTHON_3_11,
+                handler="podcast_anything.handlers.generate_audio.chunk_handler",
+                code=lambda_.Code.from_asset(str(src_path)),
+                memory_size=512,
+                timeout=cdk.Duration.seconds(60),
+                environment=common_env,
+                layers=[deps_layer],
+            )
+            assemble_audio_fn = lambda_.Function(
+                self,
+                "AssembleAudioFn",
+                runtime=lambda_.Runtime.PYTHON_3_11,
+                handler="podcast_anything.handlers.generate_audio.assemble_handler",
+                code=lambda_.Code.from_asset(str(src_path)),
+                memory_size=1024,
+                timeout=cdk.Duration.minutes(2),
+                environment=common_env,
+                layers=[deps_layer],
+            )
+            audio_fns.extend([plan_audio_fn, synthesize_chunk_fn, assemble_audio_fn])
+        if audio_synthesis_mode == "streaming":
+            rewrite_and_generate_fn = lambda_.Function(
+                self,
+                "RewriteAndGenerateAudioFn",
+                runtime=lambda_.Runtime.PYTHON_3_11,
+                handler="podcast_anything.handlers.generate_audio.streaming_handler",
+                code=lambda_.Code.from_asset(str(src_path)),
+                memory_size=2048,
+                timeout=cdk.Duration.minutes(4),
+                environment=common_env,
+                layers=[deps_layer],
+            )
+            audio_fns.append(rewrite_and_generate_fn)
+
         bucket.grant_read_write(fetch_article_fn)
         bucket.grant_read_write(rewrite_script_fn)
-        bucket.grant_read_write(generate_audio_fn)
+        for audio_fn in audio_fns:
+            bucket.grant_read_write(audio_fn)
 
         bedrock_policy = iam.PolicyStatement(
             actions=["bedrock:InvokeModel", "bedrock:InvokeModelWithResponseStream"],
             resources=["*"],
         )
         rewrite_script_fn.add_to_role_policy(bedrock_policy)
+        if audio_synthesis_mode == "streaming":
+            rewrite_and_generate_fn.add_to_role_policy(bedrock_policy)
 
         if tts_provider == "polly":
             polly_policy = iam.PolicyStatement(
                 actions=["polly:SynthesizeSpeech"],
                 resources=["*"],
             )
-            generate_audio_fn.add_to_role_policy(polly_policy)
+            for audio_fn in audio_fns:
+                audio_fn.add_to_role_policy(polly_policy)
 
         fetch_step = sfn_tasks.LambdaInvoke(
             self,
@@ -158,13 +289,89 @@ class PodcastAnythingStack(cdk.Stack):
             payload=sfn.TaskInput.from_json_path_at("$"),
             output_path="$.Payload",
         )
+        # A retry only synthesizes chunks missing from jobs/<job_id>/chunks/. Without
+        # checkpoints it would voice the whole episode again, so it is not retried.
+        checkpoints_enabled = audio_checkpoints.strip().lower() in {"1", "true", "yes", "on"}
+        if checkpoints_enabled:
+            generate_step.add_retry(
+                errors=["TTSError", "Sandbox.Timedout", "States.Timeout"],
+                interval=cdk.Duration.seconds(5),
+                max_attempts=2,
+                backoff_rate=2,
+            )
+
+        audio_chain: sfn.IChainable = generate_step
+        if audio_synthesis_mode == "map":
+            plan_step = sfn_tasks.LambdaInvoke(
+                self,
+                "PlanAudioStep",
+                lambda_function=plan_audio_fn,
+                payload=sfn.TaskInput.from_json_path_at("$"),
+                output_path="$.Payload",
+            )
+            chunk_step = sfn_tasks.LambdaInvoke(
+                self,
+                "SynthesizeAudioChunkStep",
+                lambda_function=synthesize_chunk_fn,
+                payload=sfn.TaskInput.from_json_path_at("$"),
+                output_path="$.Payload",
+            )
+            # Each iteration synthesizes one planned chunk; finished chunks are skipped on retry.
+            chunk_step.add_retry(
+                errors=["TTSError", "Sandbox.Timedout", "States.Timeout"],
+                interval=cdk.Duration.seconds(2),
+                max_attempts=3,
+                backoff_rate=2,
+            )
+            synthesize_chunks = sfn.Map(
+                self,
+                "SynthesizeAudioChunks",
+                items_path="$.audio_chunk_items",
+                item_selector={
+                    "job_id.$": "$.job_id",
+                    "bucket.$": "$.bucket",
+                    "audio_plan_s3_key.$": "$.audio_plan_s3_key",
+                    "chunk_index.$": "$$.Map.Item.Value.chunk_index",
+                },
+                max_concurrency=audio_map_max_concurrency,
+                result_path=sfn.JsonPath.DISCARD,
+            ).item_processor(chunk_step)
+            assemble_step = sfn_tasks.LambdaInvoke(
+                self,
+                "AssembleAudioStep",
+                lambda_function=assemble_audio_fn,
+                payload=sfn.TaskInput.from_json_path_at("$"),
+                output_path="$.Payload",
+            )
+            audio_chain = plan_step.next(synthesize_chunks).next(assemble_step)
+
+        script_chain: sfn.IChainable
+        if audio_synthesis_mode != "streaming":
+            script_chain = rewrite_step.next(audio_chain)
+        else:
+            # One step streams the script from Bedrock straight into TTS.
+            streaming_step = sfn_tasks.LambdaInvoke(
+                self,
+                "RewriteAndGenerateAudioStep",
+                lambda_function=rewrite_and_generate_fn,
+                payload=sfn.TaskInput.from_json_path_at("$"),
+                output_path="$.Payload",
+            )
+            # With checkpoints a retry replays the checkpointed script and reuses its
+            # chunks; without them it would write and voice a different script.
+            if checkpoints_enabled:
+                streaming_step.add_retry(
+                    errors=["TTSError", "Sandbox.Timedout", "States.Timeout"],
+                    interval=cdk.Duration.seconds(5),
+                    max_attempts=2,
+                    backoff_rate=2,
+                )
+            script_chain = streaming_step
 
         state_machine = sfn.StateMachine(
             self,
             "PipelineStateMachine",
-            definition_body=sfn.DefinitionBody.from_chainable(
-                fetch_step.next(rewrite_step).next(generate_step)
-            ),
+            definition_body=sfn.DefinitionBody.from_chainable(fetch_step.next(script_chain)),
             timeout=cdk.Duration.minutes(10),
         )
 
@@ -229,6 +436,18 @@ class PodcastAnythingStack(cdk.Stack):
         cdk.CfnOutput(self, "FetchArticleFnName", value=fetch_article_fn.function_name)
         cdk.CfnOutput(self, "RewriteScriptFnName", value=rewrite_script_fn.function_name)
         cdk.CfnOutput(self, "GenerateAudioFnName", value=generate_audio_fn.function_name)
+        if audio_synthesis_mode == "map":
+            cdk.CfnOutput(self, "PlanAudioFnName", value=plan_audio_fn.function_name)
+            cdk.CfnOutput(
+                self, "SynthesizeAudioChunkFnName", value=synthesize_chunk_fn.function_name
+            )
+            cdk.CfnOutput(self, "AssembleAudioFnName", value=assemble_audio_fn.function_name)
+        if audio_synthesis_mode == "streaming":
+            cdk.CfnOutput(
+                self,
+                "RewriteAndGenerateAudioFnName",
+                value=rewrite_and_generate_fn.function_name,
+            )
         cdk.CfnOutput(self, "PipelineStateMachineArn", value=state_machine.state_machine_arn)
         cdk.CfnOutput(self, "StartExecutionApiFnName", value=start_execution_api_fn.function_name)
         cdk.CfnOutput(self, "GetExecutionApiFnName", value=get_execution_api_fn.function_name)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Micro-benchmark article extraction engines over a directory of HTML pages.
+
+Runs every engine over each page in the corpus (default: the hand-built pages in
+`tests/fixtures/synthetic_pages`; pass `--corpus` to measure saved real-world pages) and
+reports best-of-N time, throughput, Python peak memory, and output parity with the
+BeautifulSoup engine. Resident memory is measured per engine in a fresh subprocess.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from podcast_anything.article import extract_text, resolve_engine
+
+_DEFAULT_CORPUS = (
+    Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "synthetic_pages"
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark article extraction engines.")
+    parser.add_argument("--corpus", type=Path, default=_DEFAULT_CORPUS, help="Directory of .html")
+    parser.add_argument("--engines", default="bs4,lxml,stream", help="Comma-separated engines")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page; best time is kept")
+    parser.add_argument("--rss-only", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def _load_pages(corpus: Path) -> dict[str, str]:
+    pages = {path.name: path.read_text(encoding="utf-8") for path in sorted(corpus.glob("*.html"))}
+    if not pages:
+        raise SystemExit(f"No .html pages found in {corpus}")
+    return pages
+
+
+def _measure(engine: str, html: str, repeat: int) -> tuple[float, int, str]:
+    best = float("inf")
+    text = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = extract_text(html, engine=engine)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    extract_text(html, engine=engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, text
+
+
+def _max_rss_kib(engine: str, corpus: Path) -> int:
+    """Peak RSS of a fresh interpreter that extracts the whole corpus with ``engine``."""
+    completed = subprocess.run(
+        [sys.executable, __file__, "--corpus", str(corpus), "--rss-only", engine],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(completed.stdout.strip())
+
+
+def main() -> None:
+    args = _parse_args()
+    pages = _load_pages(args.corpus)
+    if args.rss_only:
+        for html in pages.values():
+            extract_text(html, engine=args.rss_only)
+        print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        return
+
+    engines = [resolve_engine(engine.strip()) for engine in args.engines.split(",")]
+    header = ("page", "engine", "KiB", "ms", "MiB/s", "peak KiB", "parity")
+    widths = (31, 6, 7, 8, 7, 9, 7)
+    print(" ".join(f"{name:>{width}}" for name, width in zip(header, widths)))
+    totals = {engine: 0.0 for engine in engines}
+    for name, html in pages.items():
+        size = len(html.encode("utf-8"))
+        reference = extract_text(html, engine="bs4")
+        for engine in engines:
+            elapsed, peak, text = _measure(engine, html, args.repeat)
+            totals[engine] += elapsed
+            parity = difflib.SequenceMatcher(None, reference, text, autojunk=False).ratio()
+            print(
+                f"{name:>31} {engine:>6} {size / 1024:>7.0f} {elapsed * 1000:>8.2f} "
+                f"{size / elapsed / 2**20:>7.1f} {peak / 1024:>9.0f} {parity:>7.3f}"
+            )
+
+    total_size = sum(len(html.encode("utf-8")) for html in pages.values())
+    print()
+    for engine in engines:
+        print(
+            f"{engine:>6}: {totals[engine] * 1000:.1f} ms for {total_size / 1024:.0f} KiB "
+            f"({total_size / totals[engine] / 2**20:.1f} MiB/s), "
+            f"max RSS {_max_rss_kib(engine, args.corpus) / 1024:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
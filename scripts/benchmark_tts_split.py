@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Micro-benchmark TTS text chunking over large generated scripts.
+
+Compares `split_text_for_tts` with the previous greedy `rfind`-based splitter on run
+time and chunk-size balance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable
+
+from podcast_anything.tts import split_text_for_tts
+
+_WORDS = (
+    "the model listens while a host explains how sound travels through cables and air "
+    "before reaching an audience that expects clear pacing and natural pauses"
+).split()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark TTS text chunking.")
+    parser.add_argument(
+        "--sizes",
+        default="10000,100000,1000000",
+        help="Comma-separated script sizes in characters",
+    )
+    parser.add_argument("--max-text-chars", type=int, default=1800)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; best time is kept")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _generate_script(size: int, rng: random.Random) -> str:
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 28)))
+        sentence = sentence.capitalize() + rng.choice([".", ".", ".", "?", "!", ";", ","])
+        if rng.random() < 0.08:
+            sentence += "\n"
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)
+
+
+def _greedy_split(text: str, max_text_chars: int) -> list[str]:
+    """The previous splitter: reslices the remainder and rescans it per chunk."""
+    chunks: list[str] = []
+    remaining = text.strip()
+    while remaining:
+        if len(remaining) <= max_text_chars:
+            chunks.append(remaining)
+            break
+        window = remaining[:max_text_chars]
+        split_at = max(
+            window.rfind("\n"),
+            window.rfind(". "),
+            window.rfind("! "),
+            window.rfind("? "),
+            window.rfind("; "),
+            window.rfind(", "),
+            window.rfind(" "),
+        )
+        if split_at < int(max_text_chars * 0.6):
+            split_at = max_text_chars
+        chunk = remaining[:split_at].strip()
+        if not chunk:
+            split_at = max_text_chars
+            chunk = remaining[:split_at].strip()
+        chunks.append(chunk)
+        remaining = remaining[split_at:].lstrip()
+    return chunks
+
+
+def _measure(
+    splitter: Callable[[str, int], list[str]], text: str, max_text_chars: int, repeat: int
+) -> tuple[float, list[str]]:
+    best = float("inf")
+    chunks: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = splitter(text, max_text_chars)
+        best = min(best, time.perf_counter() - started)
+    return best, chunks
+
+
+def main() -> None:
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    splitters: dict[str, Callable[[str, int], list[str]]] = {
+        "greedy": _greedy_split,
+        "balanced": lambda text, limit: split_text_for_tts(text, max_text_chars=limit),
+    }
+
+    header = ("chars", "splitter", "ms", "chunks", "min", "max", "stdev")
+    widths = (10, 9, 9, 7, 6, 6, 7)
+    print(" ".join(f"{name:>{width}}" for name, width in zip(header, widths)))
+    for size in (int(value) for value in args.sizes.split(",")):
+        text = _generate_script(size, rng)
+        for name, splitter in splitters.items():
+            elapsed, chunks = _measure(splitter, text, args.max_text_chars, args.repeat)
+            lengths = [len(chunk) for chunk in chunks]
+            stdev = statistics.pstdev(lengths) if len(lengths) > 1 else 0.0
+            print(
+                f"{len(text):>10} {name:>9} {elapsed * 1000:>9.1f} {len(chunks):>7} "
+                f"{min(lengths):>6} {max(lengths):>6} {stdev:>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@ def start_execution_handler(event: dict[str, Any], _context: Any) -> dict[str, A
             source_text=source_text,
             source_file_name=payload.get("source_file_name"),
             source_file_base64=payload.get("source_file_base64"),
+            sources=payload.get("sources"),
             job_id=payload.get("job_id"),
             style=payload.get("style", "podcast"),
             script_mode=payload.get("script_mode", "single"),
@@ -12,6 +12,7 @@ from typing import Any
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from podcast_anything.event_schema import EventSchemaError, SourceSpec, parse_sources
 from podcast_anything.youtube import is_youtube_url
 
 
@@ -78,11 +79,29 @@ def _validate_source_inputs(
     source_text: str | None,
     source_file_name: str | None,
     source_file_base64: str | None,
+    sources: tuple[SourceSpec, ...] | None = None,
 ) -> None:
     has_source_url = source_url is not None
     has_source_file = source_file_base64 is not None
-    if has_source_url == has_source_file:
-        raise PipelineApiError("provide exactly one of source_url or source_file_base64")
+    has_sources = sources is not None
+    if has_source_url + has_source_file + has_sources != 1:
+        raise PipelineApiError(
+            "provide exactly one of source_url, source_file_base64, or sources"
+        )
+    if has_sources and source_text is not None:
+        raise PipelineApiError("source_text cannot be used with sources")
+    for position, spec in enumerate(sources or ()):
+        if spec.file_base64:
+            try:
+                base64.b64decode(spec.file_base64, validate=True)
+            except ValueError as exc:
+                raise PipelineApiError(
+                    f"sources[{position}].file_base64 must be valid base64"
+                ) from exc
+        if spec.url and is_youtube_url(spec.url) and not spec.text:
+            raise PipelineApiError(
+                f"sources[{position}]: YouTube URLs require transcript text in `text`."
+            )
 
     if has_source_file and not source_file_name:
         raise PipelineApiError("source_file_name is required when source_file_base64 is provided")
@@ -161,6 +180,7 @@ def start_pipeline_execution(
     source_text: str | None = None,
     source_file_name: str | None = None,
     source_file_base64: str | None = None,
+    sources: list[dict[str, Any]] | None = None,
     job_id: str | None = None,
     style: str = "podcast",
     script_mode: str = "single",
@@ -180,6 +200,10 @@ def start_pipeline_execution(
         if isinstance(source_file_base64, str) and source_file_base64.strip()
         else None
     )
+    try:
+        cleaned_sources = parse_sources(sources)
+    except EventSchemaError as exc:
+        raise PipelineApiError(str(exc)) from exc
     cleaned_job_id = job_id.strip() if isinstance(job_id, str) and job_id.strip() else None
     cleaned_style = style.strip() if isinstance(style, str) and style.strip() else "podcast"
     cleaned_script_mode = _normalize_script_mode(script_mode)
@@ -203,10 +227,11 @@ def start_pipeline_execution(
         source_text=cleaned_source_text,
         source_file_name=cleaned_source_file_name,
         source_file_base64=cleaned_source_file_base64,
+        sources=cleaned_sources,
     )
 
     resolved_job_id = cleaned_job_id or _generate_job_id()
-    payload = {
+    payload: dict[str, Any] = {
         "job_id": resolved_job_id,
         "style": cleaned_style,
         "script_mode": cleaned_script_mode,
@@ -219,6 +244,8 @@ def start_pipeline_execution(
         payload["source_file_name"] = cleaned_source_file_name
     if cleaned_source_file_base64:
         payload["source_file_base64"] = cleaned_source_file_base64
+    if cleaned_sources:
+        payload["sources"] = [spec.to_dict() for spec in cleaned_sources]
     if cleaned_voice_id:
         payload["voice_id"] = cleaned_voice_id
     if cleaned_voice_id_b:
@@ -245,6 +272,7 @@ def start_pipeline_execution(
         "job_id": resolved_job_id,
         "source_url": cleaned_source_url,
         "source_file_name": cleaned_source_file_name,
+        "source_count": len(cleaned_sources) if cleaned_sources else None,
         "style": cleaned_style,
         "script_mode": cleaned_script_mode,
         "voice_id": cleaned_voice_id,
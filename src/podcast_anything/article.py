@@ -2,31 +2,122 @@
 
 from __future__ import annotations
 
+import codecs
+import logging
 import re
-from typing import Iterable
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from io import BytesIO
+from typing import Any, Callable, Iterable, Iterator
 
 import requests
 from bs4 import BeautifulSoup
+from urllib3.util import make_headers
+
+try:
+    from lxml import etree
+except ModuleNotFoundError:  # pragma: no cover - exercised via the BeautifulSoup engine
+    etree = None
+
+logger = logging.getLogger(__name__)
 
 
 class ArticleError(RuntimeError):
     pass
 
 
-def fetch_html(url: str, timeout_sec: int = 20) -> str:
+# Page chrome whose text never belongs to the article body.
+_EXCLUDED_TAGS = frozenset(["script", "style", "noscript", "header", "footer", "nav", "aside"])
+EXTRACTION_ENGINES = ("auto", "lxml", "bs4", "stream")
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+# Browsers look for <meta charset> in the first 1024 bytes of a page.
+_SNIFF_BYTES = 1024
+_HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_REQUEST_HEADERS = {
+    "User-Agent": "podcast-anything-bot",
+    # gzip and deflate, plus br/zstd when urllib3 has a decoder for them.
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+}
+
+
+def _check_url(url: str) -> None:
     if not url.startswith(("http://", "https://")):
         raise ArticleError("source_url must start with http:// or https://")
 
+
+def detect_encoding(content_type: str | None, head: bytes) -> str:
+    """Codec for an HTML body: the ``Content-Type`` charset, a ``<meta charset>`` in ``head``,
+    else UTF-8.
+
+    Unlike ``requests``, this never assumes ISO-8859-1 or runs statistical detection over the
+    whole body.
+    """
+    header_match = _HEADER_CHARSET_RE.search(content_type or "")
+    meta_match = _META_CHARSET_RE.search(head[:_SNIFF_BYTES])
+    candidates = [
+        header_match.group(1) if header_match else None,
+        meta_match.group(1).decode("ascii") if meta_match else None,
+    ]
+    for candidate in candidates:
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                continue
+    return "utf-8"
+
+
+def _get(
+    url: str,
+    timeout_sec: int,
+    extra_headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
+) -> requests.Response:
+    headers = {**_REQUEST_HEADERS, **(extra_headers or {})}
+    get = session.get if session is not None else requests.get
+    return get(url, timeout=timeout_sec, headers=headers, stream=True)
+
+
+def build_session(max_per_host: int) -> requests.Session:
+    """Session that reuses connections per host and opens at most ``max_per_host`` to each.
+
+    Requests beyond the cap wait for a pooled connection instead of opening another one.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_per_host, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _read_body(resp: requests.Response, url: str, max_bytes: int) -> Iterator[bytes]:
+    """Yield decompressed body chunks, stopping once ``max_bytes`` have been read."""
+    remaining = max_bytes
+    for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+        if len(chunk) >= remaining:
+            yield chunk[:remaining]
+            logger.warning(
+                "Article body truncated", extra={"source_url": url, "max_bytes": max_bytes}
+            )
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def fetch_html(url: str, timeout_sec: int = 20, max_bytes: int = DEFAULT_MAX_BYTES) -> str:
+    """Download at most ``max_bytes`` of ``url`` (after decompression) and decode it."""
+    _check_url(url)
+
     try:
-        resp = requests.get(
-            url,
-            timeout=timeout_sec,
-            headers={"User-Agent": "podcast-anything-bot"},
-        )
-        resp.raise_for_status()
-        return resp.text
+        with _get(url, timeout_sec) as resp:
+            resp.raise_for_status()
+            body = b"".join(_read_body(resp, url, max_bytes))
+            content_type = resp.headers.get("Content-Type")
     except requests.RequestException as exc:
         raise ArticleError(f"Failed to fetch article from {url}: {exc}") from exc
+    return body.decode(detect_encoding(content_type, body), errors="replace")
 
 
 def _clean_text(lines: Iterable[str]) -> str:
@@ -35,10 +126,20 @@ def _clean_text(lines: Iterable[str]) -> str:
     return re.sub(r"\n{3,}", "\n\n", joined).strip()
 
 
-def extract_text(html: str) -> str:
+def _pick_paragraphs(article_paragraphs: list[str], page_paragraphs: list[str]) -> str:
+    text = _clean_text(article_paragraphs)
+    if text:
+        return text
+    text = _clean_text(page_paragraphs)
+    if not text:
+        raise ArticleError("No readable text found in the article.")
+    return text
+
+
+def _extract_with_bs4(html: str) -> str:
     soup = BeautifulSoup(html, "html.parser")
 
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
+    for tag in soup(list(_EXCLUDED_TAGS)):
         tag.decompose()
 
     article = soup.find("article")
@@ -48,8 +149,344 @@ def extract_text(html: str) -> str:
         if text:
             return text
 
-    paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
-    text = _clean_text(paragraphs)
-    if not text:
-        raise ArticleError("No readable text found in the article.")
-    return text
+    return _pick_paragraphs([], [p.get_text(" ", strip=True) for p in soup.find_all("p")])
+
+
+def _paragraph_text(element: etree._Element) -> str:
+    """Text of ``element`` like BeautifulSoup's ``get_text(" ", strip=True)``.
+
+    Excluded descendants are skipped (their tail text is kept); comments are not text.
+    """
+    pieces: list[str] = []
+
+    def walk(node: etree._Element) -> None:
+        if node.text:
+            pieces.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in _EXCLUDED_TAGS:
+                walk(child)
+            if child.tail:
+                pieces.append(child.tail)
+
+    walk(element)
+    return " ".join(stripped for piece in pieces if (stripped := piece.strip()))
+
+
+def _extract_with_lxml(html: str) -> str:
+    """Single streaming pass with libxml2 that keeps only paragraph text.
+
+    Excluded subtrees are skipped by depth, paragraphs are read as they close, and finished
+    elements are cleared so the full tree never stays in memory.
+    """
+    article_paragraphs: list[str] = []
+    page_paragraphs: list[str] = []
+    excluded_depth = 0
+    paragraph_depth = 0
+    # ``None`` before the first <article>, then its nesting depth, then -1 once it closed.
+    article_depth: int | None = None
+    events = etree.iterparse(
+        BytesIO(html.encode("utf-8")),
+        events=("start", "end"),
+        html=True,
+        encoding="utf-8",
+        remove_comments=True,
+        huge_tree=True,
+    )
+    try:
+        for event, element in events:
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            if event == "start":
+                if excluded_depth or tag in _EXCLUDED_TAGS:
+                    excluded_depth += 1
+                elif tag == "article" and (article_depth is None or article_depth > 0):
+                    article_depth = (article_depth or 0) + 1
+                elif tag == "p":
+                    paragraph_depth += 1
+                continue
+
+            if excluded_depth:
+                excluded_depth -= 1
+            elif tag == "p":
+                paragraph_depth -= 1
+                text = _paragraph_text(element)
+                page_paragraphs.append(text)
+                if article_depth is not None and article_depth > 0:
+                    article_paragraphs.append(text)
+            elif tag == "article" and article_depth is not None and article_depth > 0:
+                article_depth = article_depth - 1 or -1
+            if not paragraph_depth:
+                # Nothing open still needs this subtree's text.
+                element.clear(keep_tail=False)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+    except etree.XMLSyntaxError:
+        # libxml2 only gives up on empty or undecodable input; keep what was read.
+        pass
+    return _pick_paragraphs(article_paragraphs, page_paragraphs)
+
+
+class _ParagraphCollector:
+    """Parser target that keeps paragraph text from start/end/data events, building no tree.
+
+    Text runs are stripped and joined with single spaces like BeautifulSoup's
+    ``get_text(" ", strip=True)``. Paragraphs are kept in the order they open, so nested or
+    unclosed ``<p>`` tags give the same text as a tree walk.
+    """
+
+    def __init__(self) -> None:
+        self._run: list[str] = []
+        self._excluded_depth = 0
+        # ``None`` before the first <article>, then its nesting depth, then -1 once it closed.
+        self._article_depth: int | None = None
+        self._open: list[int] = []
+        self._paragraphs: list[list[str]] = []
+        self._in_article: list[bool] = []
+
+    def _flush_run(self) -> None:
+        text = "".join(self._run).strip()
+        self._run.clear()
+        if text and not self._excluded_depth:
+            for index in self._open:
+                self._paragraphs[index].append(text)
+
+    def start(self, tag: str, _attrib: Any = None) -> None:
+        self._flush_run()
+        if tag in _EXCLUDED_TAGS:
+            self._excluded_depth += 1
+        elif self._excluded_depth:
+            return
+        elif tag == "article" and (self._article_depth is None or self._article_depth > 0):
+            self._article_depth = (self._article_depth or 0) + 1
+        elif tag == "p":
+            self._open.append(len(self._paragraphs))
+            self._paragraphs.append([])
+            self._in_article.append(bool(self._article_depth and self._article_depth > 0))
+
+    def end(self, tag: str) -> None:
+        self._flush_run()
+        if tag in _EXCLUDED_TAGS:
+            self._excluded_depth = max(self._excluded_depth - 1, 0)
+        elif self._excluded_depth:
+            return
+        elif tag == "article" and self._article_depth is not None and self._article_depth > 0:
+            self._article_depth = self._article_depth - 1 or -1
+        elif tag == "p" and self._open:
+            self._open.pop()
+
+    def data(self, text: str) -> None:
+        if not self._excluded_depth and self._open:
+            self._run.append(text)
+
+    def comment(self, _text: str) -> None:
+        # A comment splits the surrounding text into two strings, as in a tree.
+        self._flush_run()
+
+    def close(self) -> str:
+        self._flush_run()
+        texts = [" ".join(pieces) for pieces in self._paragraphs]
+        return _pick_paragraphs(
+            [text for text, in_article in zip(texts, self._in_article) if in_article], texts
+        )
+
+
+class _StdlibEventParser(HTMLParser):
+    """Feeds ``html.parser`` tokenizer events into a ``_ParagraphCollector``."""
+
+    def __init__(self, collector: _ParagraphCollector) -> None:
+        super().__init__(convert_charrefs=True)
+        self._collector = collector
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._collector.start(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._collector.end(tag)
+
+    def handle_data(self, data: str) -> None:
+        self._collector.data(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._collector.comment(data)
+
+
+class StreamingExtractor:
+    """Extract article text from HTML bytes as they arrive, without building a document tree.
+
+    Feed chunks with ``feed`` and call ``close`` for the text. Only the current text run and
+    the paragraphs found so far are held, so memory does not grow with page markup. Uses
+    libxml2's event parser when ``lxml`` is installed, otherwise ``html.parser``. The first
+    1 KiB is held back until the codec is chosen by ``detect_encoding`` from
+    ``content_type`` and that prefix.
+    """
+
+    def __init__(self, content_type: str | None = None) -> None:
+        self._content_type = content_type
+        self._collector = _ParagraphCollector()
+        self._head = bytearray()
+        self._parser: Any = None
+        self._decoder: codecs.IncrementalDecoder | None = None
+
+    def _start_with(self, head: bytes) -> None:
+        encoding = detect_encoding(self._content_type, head)
+        if etree is not None:
+            self._parser = etree.HTMLParser(
+                target=self._collector, encoding=encoding, remove_comments=False, huge_tree=True
+            )
+        else:
+            self._parser = _StdlibEventParser(self._collector)
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._feed_parser(head)
+
+    def _feed_parser(self, chunk: bytes) -> None:
+        if self._decoder is None:
+            self._parser.feed(chunk)
+        else:
+            self._parser.feed(self._decoder.decode(chunk))
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        if self._parser is not None:
+            self._feed_parser(chunk)
+            return
+        self._head += chunk
+        if len(self._head) >= _SNIFF_BYTES:
+            head, self._head = bytes(self._head), bytearray()
+            self._start_with(head)
+
+    def close(self) -> str:
+        if self._parser is None and self._head:
+            head, self._head = bytes(self._head), bytearray()
+            self._start_with(head)
+        if self._decoder is not None:
+            self._parser.feed(self._decoder.decode(b"", final=True))
+            self._parser.close()
+        elif self._parser is not None:
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError:
+                # libxml2 only gives up on empty or undecodable input; keep what was read.
+                pass
+        return self._collector.close()
+
+
+def extract_text_from_chunks(chunks: Iterable[bytes], content_type: str | None = None) -> str:
+    """Run ``chunks`` of HTML bytes through a ``StreamingExtractor``."""
+    extractor = StreamingExtractor(content_type)
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.close()
+
+
+def fetch_text(url: str, timeout_sec: int = 20, max_bytes: int = DEFAULT_MAX_BYTES) -> str:
+    """Fetch ``url`` and extract its text while the body downloads.
+
+    The response is streamed into a ``StreamingExtractor`` chunk by chunk, so parsing
+    overlaps the network read and the raw page is never held in memory. Reading stops after
+    ``max_bytes`` of decompressed body.
+    """
+    return fetch_article(url, engine="stream", timeout_sec=timeout_sec, max_bytes=max_bytes).text
+
+
+_ENGINES: dict[str, Callable[[str], str]] = {
+    "lxml": _extract_with_lxml,
+    "bs4": _extract_with_bs4,
+    "stream": lambda html: extract_text_from_chunks(
+        [html.encode("utf-8")], "text/html; charset=utf-8"
+    ),
+}
+
+
+def resolve_engine(engine: str = "auto") -> str:
+    """Map ``auto`` to ``lxml`` when it is installed, else ``bs4``."""
+    if engine not in EXTRACTION_ENGINES:
+        supported = ", ".join(EXTRACTION_ENGINES)
+        raise ArticleError(f"Unknown extraction engine '{engine}'. Use: {supported}")
+    if engine == "auto":
+        return "lxml" if etree is not None else "bs4"
+    if engine == "lxml" and etree is None:
+        raise ArticleError("The lxml extraction engine requires the `lxml` package.")
+    return engine
+
+
+def extract_text(html: str, engine: str = "auto") -> str:
+    """Return the readable paragraphs of ``html``, preferring those inside ``<article>``.
+
+    ``engine`` selects the parser: ``lxml`` streams the page through libxml2 and keeps only
+    paragraph text, ``bs4`` builds a full BeautifulSoup tree, ``stream`` runs the tree-free
+    ``StreamingExtractor``, and ``auto`` uses ``lxml`` when installed. All of them drop
+    scripts, styles, and page chrome (header, footer, nav, aside).
+    """
+    return _ENGINES[resolve_engine(engine)](html)
+
+
+@dataclass(frozen=True)
+class FetchedArticle:
+    """Extracted text of a page and the validators to revalidate it with later.
+
+    ``not_modified`` is set (and ``text`` is empty) when a conditional request got a 304.
+    """
+
+    text: str
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+
+
+def fetch_article(
+    url: str,
+    *,
+    engine: str = "auto",
+    timeout_sec: int = 20,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    session: requests.Session | None = None,
+) -> FetchedArticle:
+    """Fetch and extract ``url``, conditionally when ``etag`` or ``last_modified`` is given.
+
+    On a 304 the body is neither downloaded nor extracted. The ``stream`` engine extracts
+    while the body downloads; other engines extract the bounded body once it is read. Pass a
+    ``session`` (see ``build_session``) to share pooled connections across fetches.
+    """
+    _check_url(url)
+    resolved = resolve_engine(engine)
+    conditional = {}
+    if etag:
+        conditional["If-None-Match"] = etag
+    if last_modified:
+        conditional["If-Modified-Since"] = last_modified
+
+    try:
+        with _get(url, timeout_sec, conditional, session) as resp:
+            if resp.status_code == 304:
+                if not conditional:
+                    raise ArticleError(f"Unexpected 304 Not Modified from {url}")
+                return FetchedArticle(
+                    "",
+                    etag=resp.headers.get("ETag") or etag,
+                    last_modified=resp.headers.get("Last-Modified") or last_modified,
+                    not_modified=True,
+                )
+            resp.raise_for_status()
+            new_etag = resp.headers.get("ETag")
+            new_last_modified = resp.headers.get("Last-Modified")
+            content_type = resp.headers.get("Content-Type")
+            if resolved == "stream":
+                extractor = StreamingExtractor(content_type)
+                for chunk in _read_body(resp, url, max_bytes):
+                    extractor.feed(chunk)
+            else:
+                body = b"".join(_read_body(resp, url, max_bytes))
+    except requests.RequestException as exc:
+        raise ArticleError(f"Failed to fetch article from {url}: {exc}") from exc
+
+    if resolved == "stream":
+        text = extractor.close()
+    else:
+        html = body.decode(detect_encoding(content_type, body), errors="replace")
+        text = extract_text(html, resolved)
+    return FetchedArticle(text, etag=new_etag, last_modified=new_last_modified)
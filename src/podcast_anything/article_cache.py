@@ -0,0 +1,166 @@
+"""Article text cache revalidated with HTTP conditional GETs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from podcast_anything import article
+from podcast_anything.cache import CacheBackend, CacheError, build_cache, hash_key
+from podcast_anything.config import Settings
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_CACHE_VERSION = "article-cache-v1"
+_ARTICLE_CACHE_PREFIX = "cache/articles/"
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Query parameters that only track where a click came from.
+_TRACKING_PARAMS = frozenset(["fbclid", "gclid", "mc_cid", "mc_eid", "ref_src"])
+
+
+@dataclass(frozen=True)
+class CachedArticle:
+    """Extracted text of one page plus the validators the server sent with it."""
+
+    url: str
+    text: str
+    etag: str | None
+    last_modified: str | None
+    validated_at: float
+
+    def to_bytes(self) -> bytes:
+        return json.dumps(asdict(self)).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CachedArticle:
+        payload: dict[str, Any] = json.loads(data.decode("utf-8"))
+        return cls(
+            url=payload["url"],
+            text=payload["text"],
+            etag=payload.get("etag"),
+            last_modified=payload.get("last_modified"),
+            validated_at=float(payload["validated_at"]),
+        )
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of ``url`` for cache keys.
+
+    Lowercases the scheme and host, drops default ports, fragments, and tracking parameters
+    (``utm_*``, ``fbclid``, ...), and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS
+        )
+    )
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def article_cache_key(url: str, *, engine: str, max_bytes: int) -> str:
+    """Hash the normalized URL with the settings that shape the extracted text."""
+    return hash_key(
+        ARTICLE_CACHE_VERSION,
+        normalize_url(url),
+        article.resolve_engine(engine),
+        str(max_bytes),
+    )
+
+
+def build_article_cache(settings: Settings, bucket: str) -> CacheBackend | None:
+    return build_cache(
+        settings.article_cache_backend,
+        bucket=bucket,
+        prefix=_ARTICLE_CACHE_PREFIX,
+        local_dir=settings.article_cache_dir,
+        max_age_sec=settings.article_cache_max_age_sec,
+        max_bytes=settings.article_cache_max_bytes,
+        sweep_interval_sec=settings.cache_sweep_interval_sec,
+    )
+
+
+def _read_entry(cache: CacheBackend, key: str, *, job_id: str) -> CachedArticle | None:
+    try:
+        data = cache.get(key)
+        return None if data is None else CachedArticle.from_bytes(data)
+    except (CacheError, ValueError, KeyError) as exc:
+        logger.warning("Article cache read failed", extra={"job_id": job_id, "error": str(exc)})
+        return None
+
+
+def _write_entry(cache: CacheBackend, key: str, entry: CachedArticle, *, job_id: str) -> None:
+    try:
+        cache.put(key, entry.to_bytes())
+        evicted = cache.evict()
+    except CacheError as exc:
+        logger.warning("Article cache write failed", extra={"job_id": job_id, "error": str(exc)})
+        return
+    logger.info(
+        "Evicted article cache entries", extra={"job_id": job_id, "evicted_count": evicted}
+    )
+
+
+def fetch_article_text(
+    url: str,
+    *,
+    cache: CacheBackend | None,
+    engine: str = "auto",
+    max_bytes: int = article.DEFAULT_MAX_BYTES,
+    job_id: str,
+    session: requests.Session | None = None,
+) -> str:
+    """Return the extracted text of ``url``, revalidating a cached copy when there is one.
+
+    A cached entry's ``ETag`` / ``Last-Modified`` are sent as ``If-None-Match`` /
+    ``If-Modified-Since``; on a 304 the cached text is reused without downloading or
+    extracting the page. Pages served without either validator are not cached. Cache
+    failures are logged and treated as misses.
+    """
+    if cache is None:
+        return article.fetch_article(url, engine=engine, max_bytes=max_bytes, session=session).text
+
+    key = article_cache_key(url, engine=engine, max_bytes=max_bytes)
+    cached = _read_entry(cache, key, job_id=job_id)
+    fetched = article.fetch_article(
+        url,
+        engine=engine,
+        max_bytes=max_bytes,
+        etag=cached.etag if cached else None,
+        last_modified=cached.last_modified if cached else None,
+        session=session,
+    )
+    if cached is None:
+        status = "miss"
+    elif fetched.not_modified:
+        status = "not_modified"
+    else:
+        status = "modified"
+    logger.info("Article cache lookup", extra={"job_id": job_id, "cache_status": status})
+
+    text = cached.text if cached is not None and fetched.not_modified else fetched.text
+    if fetched.etag or fetched.last_modified:
+        entry = CachedArticle(
+            url=normalize_url(url),
+            text=text,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+            validated_at=time.time(),
+        )
+        # Rewriting on a 304 too restarts the entry's age for TTL eviction.
+        _write_entry(cache, key, entry, job_id=job_id)
+    return text
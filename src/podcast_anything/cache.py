@@ -0,0 +1,278 @@
+"""Content-addressed byte caches backed by local disk or an S3 prefix."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Protocol
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from podcast_anything import s3
+
+
+class CacheError(RuntimeError):
+    """Raised when a cache backend cannot read or write an entry."""
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+    def evict(self) -> int: ...
+
+
+_ALLOWED_BACKENDS = {"off", "local", "s3"}
+
+
+def hash_key(*parts: str) -> str:
+    """Build a stable cache key from ordered string parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _select_evictions(
+    entries: list[tuple[str, int, float]],
+    *,
+    now: float,
+    max_age_sec: int | None,
+    max_bytes: int | None,
+) -> list[str]:
+    """Pick expired entries first, then the oldest-modified ones until under ``max_bytes``."""
+    expired = [
+        name for name, _, modified in entries if max_age_sec and now - modified > max_age_sec
+    ]
+    expired_set = set(expired)
+    live = sorted(
+        (entry for entry in entries if entry[0] not in expired_set),
+        key=lambda entry: entry[2],
+    )
+    selected = list(expired)
+    if max_bytes is not None:
+        total = sum(size for _, size, _ in live)
+        for name, size, _ in live:
+            if total <= max_bytes:
+                break
+            selected.append(name)
+            total -= size
+    return selected
+
+
+class LocalDiskCache:
+    """Cache entries as files under ``root``; reads refresh mtime for LRU eviction."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_age_sec: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.max_age_sec = max_age_sec
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            modified = path.stat().st_mtime
+            if self.max_age_sec and time.time() - modified > self.max_age_sec:
+                path.unlink(missing_ok=True)
+                return None
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            raise CacheError(f"Failed to read cache entry {key}: {exc}") from exc
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as handle:
+                handle.write(data)
+            os.replace(handle.name, path)
+        except OSError as exc:
+            raise CacheError(f"Failed to write cache entry {key}: {exc}") from exc
+
+    def evict(self) -> int:
+        if not self.root.exists():
+            return 0
+        entries = []
+        try:
+            for path in self.root.glob("*/*"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    # Removed or renamed by a concurrent writer since the listing.
+                    continue
+                entries.append((str(path), stat.st_size, stat.st_mtime))
+            selected = _select_evictions(
+                entries,
+                now=time.time(),
+                max_age_sec=self.max_age_sec,
+                max_bytes=self.max_bytes,
+            )
+            for name in selected:
+                Path(name).unlink(missing_ok=True)
+        except OSError as exc:
+            raise CacheError(f"Failed to evict cache entries under {self.root}: {exc}") from exc
+        return len(selected)
+
+
+class S3Cache:
+    """Cache entries as objects under ``s3://<bucket>/<prefix>``.
+
+    Reads do not refresh an object's ``LastModified``, so size eviction removes the oldest
+    written entries first (FIFO), not the least recently read. Listing the prefix costs one
+    request per 1,000 entries, so ``evict`` sweeps at most once per ``sweep_interval_sec``
+    across all workers, tracked by a marker object; a bucket lifecycle rule handles expiry.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str,
+        *,
+        max_age_sec: int | None = None,
+        max_bytes: int | None = None,
+        sweep_interval_sec: int | None = None,
+    ) -> None:
+        self.bucket = bucket
+        self.prefix = prefix if prefix.endswith("/") else f"{prefix}/"
+        self.max_age_sec = max_age_sec
+        self.max_bytes = max_bytes
+        self.sweep_interval_sec = sweep_interval_sec
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    @property
+    def _sweep_marker_key(self) -> str:
+        # Entry keys are hex digests, so the marker cannot collide with one.
+        return f"{self.prefix}_last-sweep"
+
+    def _claim_sweep(self) -> bool:
+        """Return whether a sweep is due, recording this one so other workers skip theirs."""
+        if self.sweep_interval_sec:
+            swept_at = s3.last_modified(self.bucket, self._sweep_marker_key)
+            if swept_at is not None:
+                age_sec = (datetime.now(timezone.utc) - swept_at).total_seconds()
+                if age_sec < self.sweep_interval_sec:
+                    return False
+            s3.put_bytes(
+                self.bucket, self._sweep_marker_key, b"", content_type="application/octet-stream"
+            )
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            found = s3.get_bytes_if_exists(self.bucket, self._object_key(key))
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to read cache entry {key}: {exc}") from exc
+        if found is None:
+            return None
+        data, last_modified = found
+        age_sec = (datetime.now(timezone.utc) - last_modified).total_seconds()
+        if self.max_age_sec and age_sec > self.max_age_sec:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        try:
+            s3.put_bytes(
+                self.bucket,
+                self._object_key(key),
+                data,
+                content_type="application/octet-stream",
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to write cache entry {key}: {exc}") from exc
+
+    def evict(self) -> int:
+        try:
+            if not self._claim_sweep():
+                return 0
+            entries = [
+                (item["Key"], item["Size"], item["LastModified"].timestamp())
+                for item in s3.list_objects(self.bucket, self.prefix)
+                if item["Key"] != self._sweep_marker_key
+            ]
+            selected = _select_evictions(
+                entries,
+                now=time.time(),
+                max_age_sec=self.max_age_sec,
+                max_bytes=self.max_bytes,
+            )
+            s3.delete_keys(self.bucket, selected)
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to evict cache entries under {self.prefix}: {exc}") from exc
+        return len(selected)
+
+
+class TieredCache:
+    """Read through backends in order, backfilling earlier tiers on a later-tier hit."""
+
+    def __init__(self, *backends: CacheBackend) -> None:
+        self.backends = backends
+
+    def get(self, key: str) -> bytes | None:
+        for position, backend in enumerate(self.backends):
+            data = backend.get(key)
+            if data is not None:
+                for earlier in self.backends[:position]:
+                    earlier.put(key, data)
+                return data
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        for backend in self.backends:
+            backend.put(key, data)
+
+    def evict(self) -> int:
+        return sum(backend.evict() for backend in self.backends)
+
+
+def build_cache(
+    backend: str,
+    *,
+    bucket: str,
+    prefix: str,
+    local_dir: str,
+    max_age_sec: int | None = None,
+    max_bytes: int | None = None,
+    sweep_interval_sec: int | None = None,
+) -> CacheBackend | None:
+    """Return the configured cache backend, or ``None`` when caching is off.
+
+    ``sweep_interval_sec`` only applies to S3, where an eviction sweep lists the prefix.
+    """
+    normalized = backend.strip().lower()
+    if normalized not in _ALLOWED_BACKENDS:
+        allowed = ", ".join(sorted(_ALLOWED_BACKENDS))
+        raise CacheError(f"cache backend must be one of: {allowed}")
+    if normalized == "local":
+        return LocalDiskCache(local_dir, max_age_sec=max_age_sec, max_bytes=max_bytes)
+    if normalized == "s3":
+        return S3Cache(
+            bucket,
+            prefix,
+            max_age_sec=max_age_sec,
+            max_bytes=max_bytes,
+            sweep_interval_sec=sweep_interval_sec,
+        )
+    return None
@@ -0,0 +1,118 @@
+"""Per-job chunk checkpoints so audio generation can resume after a failure."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from podcast_anything import s3
+from podcast_anything.cache import CacheError
+
+logger = logging.getLogger(__name__)
+
+
+def chunks_prefix(job_id: str) -> str:
+    return f"jobs/{job_id}/chunks/"
+
+
+class JobChunkCheckpoint:
+    """Persist chunk audio under ``jobs/<job_id>/chunks/<hash>.mp3``.
+
+    Implements the cache backend protocol keyed by chunk content hash, so it can sit in
+    front of the shared TTS cache. Each chunk object is its own completion marker (an S3
+    PUT is all-or-nothing), so concurrent workers write independently; a rerun of the same
+    job lists the prefix once and only synthesizes chunks that have no object yet.
+    """
+
+    def __init__(self, bucket: str, job_id: str) -> None:
+        self.bucket = bucket
+        self.job_id = job_id
+        self._lock = threading.Lock()
+        self._complete: set[str] = self._list_complete()
+
+    def _list_complete(self) -> set[str]:
+        prefix = chunks_prefix(self.job_id)
+        try:
+            objects = s3.list_objects(self.bucket, prefix)
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(
+                f"Failed to list checkpointed chunks for {self.job_id}: {exc}"
+            ) from exc
+        complete = {
+            item["Key"][len(prefix) : -len(".mp3")]
+            for item in objects
+            if item["Key"].endswith(".mp3")
+        }
+        if complete:
+            logger.info(
+                "Found checkpointed audio chunks",
+                extra={"job_id": self.job_id, "complete_count": len(complete)},
+            )
+        return complete
+
+    def _chunk_key(self, key: str) -> str:
+        return f"{chunks_prefix(self.job_id)}{key}.mp3"
+
+    @property
+    def completed_count(self) -> int:
+        with self._lock:
+            return len(self._complete)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._complete:
+                return None
+        try:
+            found = s3.get_bytes_if_exists(self.bucket, self._chunk_key(key))
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to read checkpointed chunk {key}: {exc}") from exc
+        return found[0] if found else None
+
+    def put(self, key: str, data: bytes) -> None:
+        try:
+            s3.put_bytes(self.bucket, self._chunk_key(key), data, content_type="audio/mpeg")
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to checkpoint chunk {key}: {exc}") from exc
+        with self._lock:
+            self._complete.add(key)
+
+    def evict(self) -> int:
+        # Checkpoints live for the job; they are not subject to cache eviction.
+        return 0
+
+
+class JobScriptCheckpoint:
+    """Persist a streamed script under ``jobs/<job_id>/chunks/script-<key>.txt``.
+
+    Implements the cache backend protocol for the streaming step: a retry replays the
+    script the first attempt generated, so its segments, and therefore its chunk hashes,
+    match the chunk objects that attempt already wrote.
+    """
+
+    def __init__(self, bucket: str, job_id: str) -> None:
+        self.bucket = bucket
+        self.job_id = job_id
+
+    def _script_key(self, key: str) -> str:
+        return f"{chunks_prefix(self.job_id)}script-{key}.txt"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            found = s3.get_bytes_if_exists(self.bucket, self._script_key(key))
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to read checkpointed script {key}: {exc}") from exc
+        return found[0] if found else None
+
+    def put(self, key: str, data: bytes) -> None:
+        try:
+            s3.put_bytes(
+                self.bucket, self._script_key(key), data, content_type="text/plain; charset=utf-8"
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise CacheError(f"Failed to checkpoint script {key}: {exc}") from exc
+
+    def evict(self) -> int:
+        # Checkpoints live for the job; they are not subject to cache eviction.
+        return 0
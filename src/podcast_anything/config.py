@@ -23,6 +23,40 @@ class Settings:
     elevenlabs_duo_voice_id: str = "JBFqnCBsd6RMkjVDRZzb"
     elevenlabs_model_id: str = "eleven_multilingual_v2"
     elevenlabs_output_format: str = "mp3_44100_128"
+    tts_max_concurrency: int = 4
+    tts_cache_backend: str = "off"
+    tts_cache_dir: str = "/tmp/podcast-anything/tts-cache"
+    tts_cache_max_age_sec: int = 7 * 24 * 3600
+    tts_cache_max_bytes: int = 256 * 1024 * 1024
+    audio_upload_mode: str = "put"
+    audio_checkpoints: bool = False
+    tts_max_attempts: int = 4
+    tts_requests_per_sec: float | None = None
+    tts_chars_per_sec: float | None = None
+    voice_pace_calibration: bool = False
+    rewrite_strategy: str = "direct"
+    rewrite_section_tokens: int = 6000
+    rewrite_max_concurrency: int = 4
+    script_cache_backend: str = "off"
+    script_cache_dir: str = "/tmp/podcast-anything/script-cache"
+    script_cache_max_age_sec: int = 30 * 24 * 3600
+    script_cache_max_bytes: int = 64 * 1024 * 1024
+    bedrock_prompt_cache: bool = False
+    bedrock_model_routes: tuple[tuple[int, str], ...] = ()
+    script_target_minutes: int = 8
+    script_generation: str = "whole"
+    script_segment_count: int = 4
+    source_compression_tokens: int | None = None
+    article_extractor: str = "auto"
+    article_max_bytes: int = 5 * 1024 * 1024
+    article_cache_backend: str = "off"
+    article_cache_dir: str = "/tmp/podcast-anything/article-cache"
+    article_cache_max_age_sec: int = 7 * 24 * 3600
+    article_cache_max_bytes: int = 64 * 1024 * 1024
+    cache_sweep_interval_sec: int = 3600
+    fetch_max_concurrency: int = 8
+    fetch_max_per_host: int = 2
+    fetch_budget_sec: int = 60
 
 
 def _require_env(name: str) -> str:
@@ -32,6 +66,68 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _read_positive_int_env(name: str, default: int) -> int:
+    raw_value = (os.environ.get(name) or "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError as exc:
+        raise ConfigError(f"{name} must be a positive integer") from exc
+    if value < 1:
+        raise ConfigError(f"{name} must be a positive integer")
+    return value
+
+
+def _read_optional_positive_float_env(name: str) -> float | None:
+    raw_value = (os.environ.get(name) or "").strip()
+    if not raw_value:
+        return None
+    try:
+        value = float(raw_value)
+    except ValueError as exc:
+        raise ConfigError(f"{name} must be a positive number") from exc
+    if value <= 0:
+        raise ConfigError(f"{name} must be a positive number")
+    return value
+
+
+def _read_optional_positive_int_env(name: str) -> int | None:
+    raw_value = (os.environ.get(name) or "").strip()
+    if not raw_value:
+        return None
+    return _read_positive_int_env(name, 0)
+
+
+def _read_model_routes_env(name: str) -> tuple[tuple[int, str], ...]:
+    """Parse ``<max_input_tokens>=<model_id>`` pairs separated by commas, sorted by limit."""
+    raw_value = (os.environ.get(name) or "").strip()
+    routes: list[tuple[int, str]] = []
+    for entry in filter(None, (part.strip() for part in raw_value.split(","))):
+        limit, separator, model_id = entry.partition("=")
+        try:
+            max_input_tokens = int(limit.strip())
+        except ValueError:
+            max_input_tokens = 0
+        if not separator or max_input_tokens < 1 or not model_id.strip():
+            raise ConfigError(
+                f"{name} entries must look like '<max_input_tokens>=<model_id>', got '{entry}'"
+            )
+        routes.append((max_input_tokens, model_id.strip()))
+    return tuple(sorted(routes))
+
+
+def _read_bool_env(name: str, default: bool) -> bool:
+    raw_value = (os.environ.get(name) or "").strip().lower()
+    if not raw_value:
+        return default
+    if raw_value in {"1", "true", "yes", "on"}:
+        return True
+    if raw_value in {"0", "false", "no", "off"}:
+        return False
+    raise ConfigError(f"{name} must be a boolean (true/false)")
+
+
 def load_settings() -> Settings:
     bucket = os.environ.get("MP_BUCKET")
     if not bucket:
@@ -55,6 +151,62 @@ def load_settings() -> Settings:
     ).strip()
     elevenlabs_model_id = (os.environ.get("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")).strip()
     elevenlabs_output_format = (os.environ.get("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")).strip()
+    tts_max_concurrency = _read_positive_int_env("TTS_MAX_CONCURRENCY", 4)
+    tts_cache_backend = (os.environ.get("TTS_CACHE_BACKEND", "off") or "off").strip().lower()
+    if tts_cache_backend not in {"off", "local", "s3"}:
+        raise ConfigError("TTS_CACHE_BACKEND must be one of 'off', 'local', or 's3'")
+    tts_cache_dir = (
+        os.environ.get("TTS_CACHE_DIR") or "/tmp/podcast-anything/tts-cache"
+    ).strip()
+    tts_cache_max_age_sec = _read_positive_int_env("TTS_CACHE_MAX_AGE_SEC", 7 * 24 * 3600)
+    tts_cache_max_bytes = _read_positive_int_env("TTS_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+    audio_upload_mode = (os.environ.get("AUDIO_UPLOAD_MODE", "put") or "put").strip().lower()
+    if audio_upload_mode not in {"put", "multipart"}:
+        raise ConfigError("AUDIO_UPLOAD_MODE must be either 'put' or 'multipart'")
+    audio_checkpoints = _read_bool_env("AUDIO_CHECKPOINTS", False)
+    tts_max_attempts = _read_positive_int_env("TTS_MAX_ATTEMPTS", 4)
+    tts_requests_per_sec = _read_optional_positive_float_env("TTS_REQUESTS_PER_SEC")
+    tts_chars_per_sec = _read_optional_positive_float_env("TTS_CHARS_PER_SEC")
+    voice_pace_calibration = _read_bool_env("VOICE_PACE_CALIBRATION", False)
+    rewrite_strategy = (os.environ.get("REWRITE_STRATEGY") or "direct").strip().lower()
+    if rewrite_strategy not in {"direct", "map_reduce", "auto"}:
+        raise ConfigError("REWRITE_STRATEGY must be one of 'direct', 'map_reduce', or 'auto'")
+    rewrite_section_tokens = _read_positive_int_env("REWRITE_SECTION_TOKENS", 6000)
+    rewrite_max_concurrency = _read_positive_int_env("REWRITE_MAX_CONCURRENCY", 4)
+    script_cache_backend = (os.environ.get("SCRIPT_CACHE_BACKEND", "off") or "off").strip().lower()
+    if script_cache_backend not in {"off", "local", "s3"}:
+        raise ConfigError("SCRIPT_CACHE_BACKEND must be one of 'off', 'local', or 's3'")
+    script_cache_dir = (
+        os.environ.get("SCRIPT_CACHE_DIR") or "/tmp/podcast-anything/script-cache"
+    ).strip()
+    script_cache_max_age_sec = _read_positive_int_env("SCRIPT_CACHE_MAX_AGE_SEC", 30 * 24 * 3600)
+    script_cache_max_bytes = _read_positive_int_env("SCRIPT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+    bedrock_prompt_cache = _read_bool_env("BEDROCK_PROMPT_CACHE", False)
+    bedrock_model_routes = _read_model_routes_env("BEDROCK_MODEL_ROUTES")
+    script_target_minutes = _read_positive_int_env("SCRIPT_TARGET_MINUTES", 8)
+    script_generation = (os.environ.get("SCRIPT_GENERATION") or "whole").strip().lower()
+    if script_generation not in {"whole", "outline"}:
+        raise ConfigError("SCRIPT_GENERATION must be either 'whole' or 'outline'")
+    script_segment_count = _read_positive_int_env("SCRIPT_SEGMENT_COUNT", 4)
+    source_compression_tokens = _read_optional_positive_int_env("SOURCE_COMPRESSION_TOKENS")
+    article_extractor = (os.environ.get("ARTICLE_EXTRACTOR") or "auto").strip().lower()
+    if article_extractor not in {"auto", "lxml", "bs4", "stream"}:
+        raise ConfigError("ARTICLE_EXTRACTOR must be one of 'auto', 'lxml', 'bs4', or 'stream'")
+    article_max_bytes = _read_positive_int_env("ARTICLE_MAX_BYTES", 5 * 1024 * 1024)
+    article_cache_backend = (
+        (os.environ.get("ARTICLE_CACHE_BACKEND", "off") or "off").strip().lower()
+    )
+    if article_cache_backend not in {"off", "local", "s3"}:
+        raise ConfigError("ARTICLE_CACHE_BACKEND must be one of 'off', 'local', or 's3'")
+    article_cache_dir = (
+        os.environ.get("ARTICLE_CACHE_DIR") or "/tmp/podcast-anything/article-cache"
+    ).strip()
+    article_cache_max_age_sec = _read_positive_int_env("ARTICLE_CACHE_MAX_AGE_SEC", 7 * 24 * 3600)
+    article_cache_max_bytes = _read_positive_int_env("ARTICLE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+    cache_sweep_interval_sec = _read_positive_int_env("CACHE_SWEEP_INTERVAL_SEC", 3600)
+    fetch_max_concurrency = _read_positive_int_env("FETCH_MAX_CONCURRENCY", 8)
+    fetch_max_per_host = _read_positive_int_env("FETCH_MAX_PER_HOST", 2)
+    fetch_budget_sec = _read_positive_int_env("FETCH_BUDGET_SEC", 60)
 
     if not polly_voice_id:
         raise ConfigError("POLLY_VOICE_ID must not be empty")
@@ -83,4 +235,38 @@ def load_settings() -> Settings:
         elevenlabs_duo_voice_id=elevenlabs_duo_voice_id,
         elevenlabs_model_id=elevenlabs_model_id,
         elevenlabs_output_format=elevenlabs_output_format,
+        tts_max_concurrency=tts_max_concurrency,
+        tts_cache_backend=tts_cache_backend,
+        tts_cache_dir=tts_cache_dir,
+        tts_cache_max_age_sec=tts_cache_max_age_sec,
+        tts_cache_max_bytes=tts_cache_max_bytes,
+        audio_upload_mode=audio_upload_mode,
+        audio_checkpoints=audio_checkpoints,
+        tts_max_attempts=tts_max_attempts,
+        tts_requests_per_sec=tts_requests_per_sec,
+        tts_chars_per_sec=tts_chars_per_sec,
+        voice_pace_calibration=voice_pace_calibration,
+        rewrite_strategy=rewrite_strategy,
+        rewrite_section_tokens=rewrite_section_tokens,
+        rewrite_max_concurrency=rewrite_max_concurrency,
+        script_cache_backend=script_cache_backend,
+        script_cache_dir=script_cache_dir,
+        script_cache_max_age_sec=script_cache_max_age_sec,
+        script_cache_max_bytes=script_cache_max_bytes,
+        bedrock_prompt_cache=bedrock_prompt_cache,
+        bedrock_model_routes=bedrock_model_routes,
+        script_target_minutes=script_target_minutes,
+        script_generation=script_generation,
+        script_segment_count=script_segment_count,
+        source_compression_tokens=source_compression_tokens,
+        article_extractor=article_extractor,
+        article_max_bytes=article_max_bytes,
+        article_cache_backend=article_cache_backend,
+        article_cache_dir=article_cache_dir,
+        article_cache_max_age_sec=article_cache_max_age_sec,
+        article_cache_max_bytes=article_cache_max_bytes,
+        cache_sweep_interval_sec=cache_sweep_interval_sec,
+        fetch_max_concurrency=fetch_max_concurrency,
+        fetch_max_per_host=fetch_max_per_host,
+        fetch_budget_sec=fetch_budget_sec,
     )
@@ -16,6 +16,8 @@ _KNOWN_FIELDS = {
     "source_text",
     "source_file_name",
     "source_file_base64",
+    "sources",
+    "sources_s3_key",
     "source_type",
     "title",
     "style",
@@ -25,14 +27,18 @@ _KNOWN_FIELDS = {
     "bucket",
     "article_s3_key",
     "article_char_count",
+    "article_token_count",
     "script_s3_key",
     "script_metadata_s3_key",
     "audio_s3_key",
     "audio_estimated_duration_sec",
+    "audio_plan_s3_key",
+    "audio_chunk_count",
 }
 
 
 _ALLOWED_SCRIPT_MODES = {"single", "duo"}
+MAX_SOURCES = 20
 
 
 def _normalize_script_mode(value: str | None) -> str:
@@ -64,6 +70,82 @@ def _read_optional_int(value: Any, field_name: str) -> int | None:
     return value
 
 
+@dataclass(frozen=True)
+class SourceSpec:
+    """One entry of a multi-source ``sources`` list: a URL, a text, or an uploaded file.
+
+    ``text`` may accompany ``url`` (for example, a YouTube transcript fetched by the client),
+    in which case the URL is not fetched.
+    """
+
+    url: str | None = None
+    text: str | None = None
+    file_name: str | None = None
+    file_base64: str | None = None
+    title: str | None = None
+
+    @classmethod
+    def from_dict(cls, payload: Any, position: int) -> "SourceSpec":
+        field_name = f"sources[{position}]"
+        if not isinstance(payload, Mapping):
+            raise EventSchemaError(f"event field '{field_name}' must be an object")
+        spec = cls(
+            url=_read_optional_string(payload.get("url"), f"{field_name}.url"),
+            text=_read_optional_string(payload.get("text"), f"{field_name}.text"),
+            file_name=_read_optional_string(payload.get("file_name"), f"{field_name}.file_name"),
+            file_base64=_read_optional_string(
+                payload.get("file_base64"), f"{field_name}.file_base64"
+            ),
+            title=_read_optional_string(payload.get("title"), f"{field_name}.title"),
+        )
+        if spec.file_base64 is not None:
+            if spec.url is not None or spec.text is not None:
+                raise EventSchemaError(
+                    f"event field '{field_name}' cannot combine file_base64 with url or text"
+                )
+            if spec.file_name is None:
+                raise EventSchemaError(
+                    f"event field '{field_name}' with file_base64 must include file_name"
+                )
+        elif spec.url is None and spec.text is None:
+            raise EventSchemaError(
+                f"event field '{field_name}' must include url, text, or file_base64"
+            )
+        return spec
+
+    @property
+    def kind(self) -> str:
+        if self.file_base64 is not None:
+            return "file"
+        return "url" if self.url is not None else "text"
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            key: value
+            for key, value in (
+                ("url", self.url),
+                ("text", self.text),
+                ("file_name", self.file_name),
+                ("file_base64", self.file_base64),
+                ("title", self.title),
+            )
+            if value is not None
+        }
+
+
+def parse_sources(value: Any) -> tuple[SourceSpec, ...] | None:
+    """Validate a ``sources`` list into ``SourceSpec`` entries (``None`` when absent)."""
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        raise EventSchemaError("event field 'sources' must be a list")
+    if not value:
+        raise EventSchemaError("event field 'sources' must not be empty")
+    if len(value) > MAX_SOURCES:
+        raise EventSchemaError(f"event field 'sources' must have at most {MAX_SOURCES} entries")
+    return tuple(SourceSpec.from_dict(item, position) for position, item in enumerate(value))
+
+
 @dataclass(frozen=True)
 class PipelineEvent:
     job_id: str | None = None
@@ -71,6 +153,8 @@ class PipelineEvent:
     source_text: str | None = None
     source_file_name: str | None = None
     source_file_base64: str | None = None
+    sources: tuple[SourceSpec, ...] | None = None
+    sources_s3_key: str | None = None
     source_type: str | None = None
     title: str | None = None
     style: str = "podcast"
@@ -80,10 +164,13 @@ class PipelineEvent:
     bucket: str | None = None
     article_s3_key: str | None = None
     article_char_count: int | None = None
+    article_token_count: int | None = None
     script_s3_key: str | None = None
     script_metadata_s3_key: str | None = None
     audio_s3_key: str | None = None
     audio_estimated_duration_sec: int | None = None
+    audio_plan_s3_key: str | None = None
+    audio_chunk_count: int | None = None
     extras: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
@@ -103,6 +190,8 @@ class PipelineEvent:
                 payload.get("source_file_base64"),
                 "source_file_base64",
             ),
+            sources=parse_sources(payload.get("sources")),
+            sources_s3_key=_read_optional_string(payload.get("sources_s3_key"), "sources_s3_key"),
             source_type=_read_optional_string(payload.get("source_type"), "source_type"),
             title=_read_optional_string(payload.get("title"), "title"),
             style=_read_optional_string(payload.get("style"), "style") or "podcast",
@@ -116,6 +205,9 @@ class PipelineEvent:
             article_char_count=_read_optional_int(
                 payload.get("article_char_count"), "article_char_count"
             ),
+            article_token_count=_read_optional_int(
+                payload.get("article_token_count"), "article_token_count"
+            ),
             script_s3_key=_read_optional_string(payload.get("script_s3_key"), "script_s3_key"),
             script_metadata_s3_key=_read_optional_string(
                 payload.get("script_metadata_s3_key"),
@@ -126,6 +218,12 @@ class PipelineEvent:
                 payload.get("audio_estimated_duration_sec"),
                 "audio_estimated_duration_sec",
             ),
+            audio_plan_s3_key=_read_optional_string(
+                payload.get("audio_plan_s3_key"), "audio_plan_s3_key"
+            ),
+            audio_chunk_count=_read_optional_int(
+                payload.get("audio_chunk_count"), "audio_chunk_count"
+            ),
             extras={key: value for key, value in payload.items() if key not in _KNOWN_FIELDS},
         )
         if stage:
@@ -136,12 +234,15 @@ class PipelineEvent:
         if stage == "fetch":
             has_source_url = self.source_url is not None
             has_source_file = self.source_file_base64 is not None
+            has_sources = self.sources is not None
             if not self.job_id:
                 raise EventSchemaError("event must include job_id")
-            if has_source_url == has_source_file:
+            if has_source_url + has_source_file + has_sources != 1:
                 raise EventSchemaError(
-                    "event must include exactly one of source_url or source_file_base64"
+                    "event must include exactly one of source_url, source_file_base64, or sources"
                 )
+            if has_sources and self.source_text is not None:
+                raise EventSchemaError("event with sources cannot also include source_text")
             if has_source_file and not self.source_file_name:
                 raise EventSchemaError(
                     "event with source_file_base64 must also include source_file_name"
@@ -159,6 +260,10 @@ class PipelineEvent:
             if not self.job_id or not self.script_s3_key:
                 raise EventSchemaError("event must include job_id and script_s3_key")
             return
+        if stage == "audio_plan":
+            if not self.job_id or not self.audio_plan_s3_key:
+                raise EventSchemaError("event must include job_id and audio_plan_s3_key")
+            return
         raise EventSchemaError(f"unsupported pipeline stage: {stage}")
 
     def require_fetch_fields(self) -> tuple[str, str | None]:
@@ -176,6 +281,11 @@ class PipelineEvent:
         self.validate_for_stage("generate")
         return cast(str, self.job_id), cast(str, self.script_s3_key)
 
+    def require_audio_plan_fields(self) -> tuple[str, str]:
+        """Return required fields for the fan-out chunk and assemble stages."""
+        self.validate_for_stage("audio_plan")
+        return cast(str, self.job_id), cast(str, self.audio_plan_s3_key)
+
     def resolved_bucket(self, default_bucket: str) -> str:
         return self.bucket or default_bucket
 
@@ -190,6 +300,8 @@ class PipelineEvent:
             ("source_text", self.source_text),
             ("source_file_name", self.source_file_name),
             ("source_file_base64", self.source_file_base64),
+            ("sources", [spec.to_dict() for spec in self.sources] if self.sources else None),
+            ("sources_s3_key", self.sources_s3_key),
             ("source_type", self.source_type),
             ("title", self.title),
             ("style", self.style),
@@ -199,10 +311,13 @@ class PipelineEvent:
             ("bucket", self.bucket),
             ("article_s3_key", self.article_s3_key),
             ("article_char_count", self.article_char_count),
+            ("article_token_count", self.article_token_count),
             ("script_s3_key", self.script_s3_key),
             ("script_metadata_s3_key", self.script_metadata_s3_key),
             ("audio_s3_key", self.audio_s3_key),
             ("audio_estimated_duration_sec", self.audio_estimated_duration_sec),
+            ("audio_plan_s3_key", self.audio_plan_s3_key),
+            ("audio_chunk_count", self.audio_chunk_count),
         ):
             if value is not None:
                 data[key] = value
@@ -6,10 +6,11 @@ import base64
 import logging
 from typing import Any
 
-from podcast_anything import article, document, youtube
+from podcast_anything import article_cache, document, multi_source, youtube
 from podcast_anything.config import load_settings
 from podcast_anything.event_schema import PipelineEvent
-from podcast_anything.s3 import put_text
+from podcast_anything.llm import estimate_tokens
+from podcast_anything.s3 import put_json, put_text
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -22,8 +23,17 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     settings = load_settings()
     bucket = pipeline_event.resolved_bucket(settings.bucket)
     is_youtube_source = bool(source_url) and youtube.is_youtube_url(source_url)
+    sources_key = None
 
-    if pipeline_event.source_file_base64:
+    if pipeline_event.sources:
+        results = multi_source.fetch_sources(
+            pipeline_event.sources, settings=settings, bucket=bucket, job_id=job_id
+        )
+        text, provenance = multi_source.merge_sources(results)
+        source_type = "multi"
+        sources_key = f"jobs/{job_id}/sources.json"
+        put_json(bucket, sources_key, {"sources": provenance})
+    elif pipeline_event.source_file_base64:
         try:
             file_bytes = base64.b64decode(pipeline_event.source_file_base64, validate=True)
         except ValueError as exc:
@@ -54,8 +64,13 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             "(`source_text` / `transcript_text`). AWS-side YouTube transcript fetch is disabled."
         )
     else:
-        html = article.fetch_html(source_url or "")
-        text = article.extract_text(html)
+        text = article_cache.fetch_article_text(
+            source_url or "",
+            cache=article_cache.build_article_cache(settings, bucket),
+            engine=settings.article_extractor,
+            max_bytes=settings.article_max_bytes,
+            job_id=job_id,
+        )
         source_type = "article"
 
     article_key = f"jobs/{job_id}/source.txt"
@@ -70,7 +85,10 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         bucket=bucket,
         source_text=None,  # drop large inline source text after persisting to S3
         source_file_base64=None,  # drop large inline file payload after persisting to S3
+        sources=None,  # drop inline multi-source payloads; provenance is in sources.json
+        sources_s3_key=sources_key,
         source_type=source_type,
         article_s3_key=article_key,
         article_char_count=len(text),
+        article_token_count=estimate_tokens(text),
     ).to_dict()
@@ -1,26 +1,67 @@
-"""Lambda handler: synthesize podcast audio from script text."""
+"""Lambda handlers: synthesize podcast audio from script text."""
 
 from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
 
-from podcast_anything.config import load_settings
-from podcast_anything.event_schema import PipelineEvent
-from podcast_anything.s3 import get_text, put_bytes
-from podcast_anything.tts import synthesize_speech
+from podcast_anything.cache import CacheBackend, CacheError, TieredCache, build_cache
+from podcast_anything.checkpoint import JobChunkCheckpoint, JobScriptCheckpoint, chunks_prefix
+from podcast_anything.config import Settings, load_settings
+from podcast_anything.event_schema import EventSchemaError, PipelineEvent
+from podcast_anything.llm import ScriptStream, stream_bedrock
+from podcast_anything.mp3 import ScannedAudio, assemble_mp3, scan_audio
+from podcast_anything.rate_limit import ProviderLimiter
+from podcast_anything.s3 import (
+    MultipartUpload,
+    get_bytes,
+    get_json,
+    get_text,
+    object_exists,
+    put_bytes,
+    put_json,
+)
+from podcast_anything.script_pipeline import (
+    build_prompt,
+    build_script_cache,
+    get_cached_script,
+    load_script_inputs,
+    log_generation,
+    prepare_source,
+    put_cached_script,
+    script_cache_key,
+    store_script,
+    write_outlined,
+)
+from podcast_anything.script_repair import DuoLineNormalizer, normalize_duo_script
+from podcast_anything.tts import (
+    chunk_cache_key,
+    iter_speech_chunks,
+    iter_voice_segments,
+    split_text_for_tts,
+    synthesize_speech,
+)
+from podcast_anything.voice_pace import (
+    DEFAULT_WPM,
+    VoicePaceError,
+    VoicePaceMeter,
+    count_words,
+    estimate_duration_sec,
+    load_calibration,
+    update_calibration,
+    voice_key,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 _DUO_LINE_RE = re.compile(r"^\s*(HOST_A|HOST_B)\s*:\s*(.*)$", re.IGNORECASE)
-
-
-def _estimate_duration_sec(text: str, wpm: int = 150) -> int:
-    words = len(text.split())
-    minutes = words / max(wpm, 1)
-    return int(minutes * 60)
+_TTS_CACHE_PREFIX = "cache/tts/"
+_MAX_TEXT_CHARS = 1800
+_INTERJECTION_MAX_CHARS = 40
 
 
 def _default_duo_voice_ids(settings: Any) -> tuple[str, str]:
@@ -29,6 +70,48 @@ def _default_duo_voice_ids(settings: Any) -> tuple[str, str]:
     return settings.polly_voice_id, settings.polly_duo_voice_id
 
 
+def _build_tts_cache(settings: Settings, bucket: str) -> CacheBackend | None:
+    return build_cache(
+        settings.tts_cache_backend,
+        bucket=bucket,
+        prefix=_TTS_CACHE_PREFIX,
+        local_dir=settings.tts_cache_dir,
+        max_age_sec=settings.tts_cache_max_age_sec,
+        max_bytes=settings.tts_cache_max_bytes,
+        sweep_interval_sec=settings.cache_sweep_interval_sec,
+    )
+
+
+def _build_rate_limiter(settings: Settings, max_concurrency: int) -> ProviderLimiter:
+    return ProviderLimiter(
+        max_concurrency=max_concurrency,
+        requests_per_sec=settings.tts_requests_per_sec,
+        chars_per_sec=settings.tts_chars_per_sec,
+        max_attempts=settings.tts_max_attempts,
+    )
+
+
+def _build_chunk_store(
+    settings: Settings, bucket: str, job_id: str, tts_cache: CacheBackend | None
+) -> CacheBackend | None:
+    """Layer the per-job checkpoint in front of the shared TTS cache when enabled."""
+    if not settings.audio_checkpoints:
+        return tts_cache
+    checkpoint = JobChunkCheckpoint(bucket, job_id)
+    return TieredCache(checkpoint, tts_cache) if tts_cache else checkpoint
+
+
+def _evict_tts_cache(cache: CacheBackend | None) -> None:
+    if cache is None:
+        return
+    try:
+        evicted = cache.evict()
+    except CacheError as exc:
+        logger.warning("TTS cache eviction failed", extra={"error": str(exc)})
+        return
+    logger.info("Evicted TTS cache entries", extra={"evicted_count": evicted})
+
+
 def _parse_duo_turns(script_text: str) -> list[tuple[str, str]]:
     turns: list[tuple[str, str]] = []
     active_speaker: str | None = None
@@ -66,53 +149,286 @@ def _parse_duo_turns(script_text: str) -> list[tuple[str, str]]:
     return turns
 
 
-def _synthesize_duo_audio(
+@dataclass(frozen=True)
+class _DuoRequest:
+    """One TTS request in a duo episode: one or more consecutive turns by one speaker."""
+
+    speaker: str
+    text: str
+    first_turn: int
+    turn_count: int
+    interjection: bool
+
+
+def _iter_duo_requests(
+    turns: Iterable[tuple[str, str]], max_text_chars: int = _MAX_TEXT_CHARS
+) -> Iterator[_DuoRequest]:
+    """Coalesce consecutive same-speaker turns into as few requests as fit ``max_text_chars``.
+
+    Short interjections ("Right.", "Exactly!") stay standalone so identical ones can share
+    one synthesis within the episode and hit the chunk cache across episodes. A request is
+    yielded as soon as the next turn cannot join it, so turns may arrive as they stream.
+    """
+    pending: _DuoRequest | None = None
+    for turn_index, (speaker, text) in enumerate(turns):
+        interjection = len(text) <= _INTERJECTION_MAX_CHARS
+        if (
+            pending is not None
+            and not interjection
+            and not pending.interjection
+            and pending.speaker == speaker
+            and len(pending.text) + 1 + len(text) <= max_text_chars
+        ):
+            pending = _DuoRequest(
+                speaker=speaker,
+                text=f"{pending.text}\n{text}",
+                first_turn=pending.first_turn,
+                turn_count=pending.turn_count + 1,
+                interjection=False,
+            )
+            continue
+        if pending is not None:
+            yield pending
+        pending = _DuoRequest(
+            speaker=speaker,
+            text=text,
+            first_turn=turn_index,
+            turn_count=1,
+            interjection=interjection,
+        )
+    if pending is not None:
+        yield pending
+
+
+def _plan_duo_requests(
+    turns: list[tuple[str, str]], max_text_chars: int = _MAX_TEXT_CHARS
+) -> list[_DuoRequest]:
+    return list(_iter_duo_requests(turns, max_text_chars))
+
+
+def _iter_duo_audio(
     script_text: str,
     *,
     speaker_a_voice_id: str,
     speaker_b_voice_id: str,
-    provider: str,
-    output_format: str,
-    text_type: str,
-    elevenlabs_api_key: str | None,
-    elevenlabs_model_id: str,
-) -> bytes:
+    max_concurrency: int = 1,
+    pace: VoicePaceMeter | None = None,
+    **tts_options: Any,
+) -> Iterator[ScannedAudio]:
+    """Synthesize every duo turn on one shared worker pool, yielding audio in turn order.
+
+    Each chunk is scanned once; the scan yielded here is reused for stitching. When ``pace``
+    is given, each request's words and measured audio seconds are recorded against its voice.
+    """
     turns = _parse_duo_turns(script_text)
     if not turns:
         raise ValueError(
             "script_mode=duo requires script lines prefixed with HOST_A: or HOST_B:."
         )
 
+    planned = _plan_duo_requests(turns)
+    voice_ids = [
+        speaker_a_voice_id if request.speaker == "HOST_A" else speaker_b_voice_id
+        for request in planned
+    ]
+    # Synthesize each distinct interjection once; later repeats replay the same audio.
+    segments: list[tuple[str, str]] = []
+    first_position: list[int] = []
+    segment_for_position: list[int] = []
+    interjection_segments: dict[tuple[str, str], int] = {}
+    for position, (request, voice_id) in enumerate(zip(planned, voice_ids)):
+        segment_key = (voice_id, request.text)
+        if request.interjection and segment_key in interjection_segments:
+            segment_for_position.append(interjection_segments[segment_key])
+            continue
+        if request.interjection:
+            interjection_segments[segment_key] = len(segments)
+        segment_for_position.append(len(segments))
+        first_position.append(position)
+        segments.append(segment_key)
+
     logger.info(
         "Starting duo audio synthesis",
-        extra={"turn_count": len(turns), "provider": provider},
-    )
-    audio_parts: list[bytes] = []
-    for index, (speaker, turn_text) in enumerate(turns):
-        voice_id = speaker_a_voice_id if speaker == "HOST_A" else speaker_b_voice_id
-        turn_audio = synthesize_speech(
-            turn_text,
-            voice_id=voice_id,
-            provider=provider,
-            output_format=output_format,
-            text_type=text_type,
-            max_text_chars=1800,
-            elevenlabs_api_key=elevenlabs_api_key,
-            elevenlabs_model_id=elevenlabs_model_id,
-        )
-        audio_parts.append(turn_audio)
+        extra={
+            "turn_count": len(turns),
+            "request_count": len(segments),
+            "reused_count": len(planned) - len(segments),
+            "provider": tts_options.get("provider"),
+            "max_concurrency": max_concurrency,
+        },
+    )
+    segment_chunks = iter_voice_segments(
+        segments,
+        max_text_chars=_MAX_TEXT_CHARS,
+        max_concurrency=max_concurrency,
+        **tts_options,
+    )
+
+    def log_request(position: int, audio_bytes: int, audio_sec: float, *, reused: bool) -> None:
+        request = planned[position]
+        if pace is not None:
+            pace.record(
+                voice_key(tts_options.get("provider", "polly"), voice_ids[position]),
+                count_words(request.text),
+                audio_sec,
+            )
         logger.info(
             "Synthesized duo turn",
             extra={
-                "turn_index": index,
-                "speaker": speaker,
-                "voice_id": voice_id,
-                "text_chars": len(turn_text),
-                "audio_bytes": len(turn_audio),
+                "turn_index": request.first_turn,
+                "turn_count": request.turn_count,
+                "speaker": request.speaker,
+                "voice_id": voice_ids[position],
+                "text_chars": len(request.text),
+                "audio_bytes": audio_bytes,
+                "audio_sec": round(audio_sec, 3),
+                "reused": reused,
             },
         )
 
-    return b"".join(audio_parts)
+    replay_audio: dict[int, list[ScannedAudio]] = {}
+
+    def replay(start: int, end: int) -> Iterator[ScannedAudio]:
+        for position in range(start, end):
+            chunks = replay_audio[segment_for_position[position]]
+            audio_bytes = sum(len(chunk.data) for chunk in chunks)
+            audio_sec = sum(chunk.duration_sec for chunk in chunks)
+            log_request(position, audio_bytes, audio_sec, reused=True)
+            yield from chunks
+
+    next_position = 0
+    current: int | None = None
+    current_bytes = 0
+    current_sec = 0.0
+    for segment_index, chunk_audio in segment_chunks:
+        if segment_index != current:
+            if current is not None:
+                log_request(first_position[current], current_bytes, current_sec, reused=False)
+                next_position = first_position[current] + 1
+            yield from replay(next_position, first_position[segment_index])
+            current, current_bytes, current_sec = segment_index, 0, 0.0
+        scanned = scan_audio(chunk_audio)
+        if planned[first_position[segment_index]].interjection:
+            replay_audio.setdefault(segment_index, []).append(scanned)
+        current_bytes += len(chunk_audio)
+        current_sec += scanned.duration_sec
+        yield scanned
+    if current is not None:
+        log_request(first_position[current], current_bytes, current_sec, reused=False)
+        next_position = first_position[current] + 1
+    yield from replay(next_position, len(planned))
+
+
+def _provider_options(settings: Settings) -> dict[str, Any]:
+    is_elevenlabs = settings.tts_provider == "elevenlabs"
+    return {
+        "provider": settings.tts_provider,
+        "output_format": settings.elevenlabs_output_format if is_elevenlabs else "mp3",
+        "text_type": "text" if is_elevenlabs else "ssml",
+        "elevenlabs_api_key": settings.elevenlabs_api_key,
+        "elevenlabs_model_id": settings.elevenlabs_model_id,
+    }
+
+
+def _tts_options(
+    settings: Settings, bucket: str, job_id: str, tts_cache: CacheBackend | None
+) -> dict[str, Any]:
+    return {
+        **_provider_options(settings),
+        "max_concurrency": settings.tts_max_concurrency,
+        "cache": _build_chunk_store(settings, bucket, job_id, tts_cache),
+        "rate_limiter": _build_rate_limiter(settings, settings.tts_max_concurrency),
+    }
+
+
+def _resolve_voice_ids(pipeline_event: PipelineEvent, settings: Settings) -> tuple[str, str]:
+    default_voice_id, default_voice_id_b = _default_duo_voice_ids(settings)
+    return (
+        pipeline_event.voice_id or default_voice_id,
+        pipeline_event.voice_id_b or default_voice_id_b,
+    )
+
+
+def _store_audio(
+    bucket: str,
+    audio_key: str,
+    audio_parts: Iterable[bytes | ScannedAudio],
+    *,
+    upload_mode: str,
+    job_id: str,
+) -> float | None:
+    """Upload the episode and return its exact duration from MP3 frames, if it has any.
+
+    Each part is scanned once (or not at all when it arrives as ``ScannedAudio``); the same
+    scan supplies both the frames to upload and the duration.
+    """
+    if upload_mode == "multipart":
+        duration_sec = 0.0
+        # Stream parts into S3 as they arrive so only one part buffer is held in memory.
+        # Per-part ID3 tags and Xing/Info frames are dropped at frame boundaries; the
+        # totals a single stream header needs are not known until the last part.
+        with MultipartUpload(bucket, audio_key, content_type="audio/mpeg") as upload:
+            for audio_part in audio_parts:
+                scanned = (
+                    audio_part if isinstance(audio_part, ScannedAudio) else scan_audio(audio_part)
+                )
+                duration_sec += scanned.duration_sec
+                for run in scanned.runs or [scanned.data]:
+                    upload.write(run)
+        logger.info(
+            "Stored audio",
+            extra={
+                "job_id": job_id,
+                "key": audio_key,
+                "upload_mode": "multipart",
+                "part_count": upload.part_count,
+                "audio_bytes": upload.bytes_written,
+                "audio_duration_sec": round(duration_sec, 3),
+            },
+        )
+        return duration_sec or None
+    parts, measured_sec = assemble_mp3(audio_parts)
+    put_bytes(bucket, audio_key, b"".join(parts), content_type="audio/mpeg")
+    logger.info(
+        "Stored audio",
+        extra={"job_id": job_id, "key": audio_key, "audio_duration_sec": measured_sec},
+    )
+    return measured_sec
+
+
+def _duration_sec(measured_sec: float | None, script_text: str) -> int:
+    # Word-count estimate only when the output has no MP3 frames to measure (e.g. PCM).
+    if measured_sec is None:
+        return estimate_duration_sec(script_text)
+    return round(measured_sec)
+
+
+def _load_voice_pace(settings: Settings, bucket: str) -> dict[str, float]:
+    if not settings.voice_pace_calibration:
+        return {}
+    try:
+        return load_calibration(bucket)
+    except VoicePaceError as exc:
+        logger.warning("Voice pace calibration read failed", extra={"error": str(exc)})
+        return {}
+
+
+def _record_voice_pace(settings: Settings, bucket: str, pace: VoicePaceMeter) -> None:
+    measured = pace.measured_wpm()
+    if not settings.voice_pace_calibration or not measured:
+        return
+    try:
+        calibration = update_calibration(bucket, measured)
+    except VoicePaceError as exc:
+        logger.warning("Voice pace calibration update failed", extra={"error": str(exc)})
+        return
+    logger.info(
+        "Updated voice pace calibration",
+        extra={
+            "measured_wpm": {key: round(wpm, 1) for key, wpm in measured.items()},
+            "calibrated_wpm": {key: round(calibration[key], 1) for key in measured},
+        },
+    )
 
 
 def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
@@ -121,45 +437,424 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
 
     settings = load_settings()
     bucket = pipeline_event.resolved_bucket(settings.bucket)
-    default_voice_id, default_voice_id_b = _default_duo_voice_ids(settings)
-    voice_id = pipeline_event.voice_id or default_voice_id
-    voice_id_b = pipeline_event.voice_id_b or default_voice_id_b
-    output_format = (
-        settings.elevenlabs_output_format if settings.tts_provider == "elevenlabs" else "mp3"
-    )
-    text_type = "text" if settings.tts_provider == "elevenlabs" else "ssml"
+    voice_id, voice_id_b = _resolve_voice_ids(pipeline_event, settings)
 
+    tts_cache = _build_tts_cache(settings, bucket)
+    tts_options = _tts_options(settings, bucket, job_id, tts_cache)
     script_text = get_text(bucket, script_key)
-    if pipeline_event.script_mode == "duo":
-        audio = _synthesize_duo_audio(
+    is_duo = pipeline_event.script_mode == "duo"
+
+    pace = VoicePaceMeter()
+    audio_parts: Iterable[bytes | ScannedAudio]
+    if is_duo:
+        audio_parts = _iter_duo_audio(
             script_text,
             speaker_a_voice_id=voice_id,
             speaker_b_voice_id=voice_id_b,
-            provider=settings.tts_provider,
-            output_format=output_format,
-            text_type=text_type,
-            elevenlabs_api_key=settings.elevenlabs_api_key,
-            elevenlabs_model_id=settings.elevenlabs_model_id,
+            pace=pace,
+            **tts_options,
         )
     else:
-        audio = synthesize_speech(
-            script_text,
-            voice_id=voice_id,
-            provider=settings.tts_provider,
-            output_format=output_format,
-            text_type=text_type,
-            max_text_chars=1800,
-            elevenlabs_api_key=settings.elevenlabs_api_key,
-            elevenlabs_model_id=settings.elevenlabs_model_id,
+        audio_parts = iter_speech_chunks(
+            script_text, voice_id=voice_id, max_text_chars=_MAX_TEXT_CHARS, **tts_options
         )
 
     audio_key = f"jobs/{job_id}/audio.mp3"
-    put_bytes(bucket, audio_key, audio, content_type="audio/mpeg")
+    measured_sec = _store_audio(
+        bucket, audio_key, audio_parts, upload_mode=settings.audio_upload_mode, job_id=job_id
+    )
+    _evict_tts_cache(tts_cache)
+    if not is_duo and measured_sec:
+        pace.record(
+            voice_key(settings.tts_provider, voice_id), count_words(script_text), measured_sec
+        )
+    _record_voice_pace(settings, bucket, pace)
 
-    logger.info("Stored audio", extra={"job_id": job_id, "key": audio_key})
+    return pipeline_event.with_updates(
+        bucket=bucket,
+        audio_s3_key=audio_key,
+        audio_estimated_duration_sec=_duration_sec(measured_sec, script_text),
+    ).to_dict()
+
+
+def _streamed_duo_turns(script_segments: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield each streamed duo line as a ``(speaker, text)`` turn as soon as it arrives.
+
+    Lines are repaired as they arrive (label variants, speaker names, markdown); there is no
+    Bedrock repair fallback once audio is being produced. Consecutive lines by one host are
+    joined later by ``_iter_duo_requests``, so no line waits for the one after it here.
+    """
+    normalizer = DuoLineNormalizer()
+    speaker: str | None = None
+    emitted = False
+    for raw_line in script_segments:
+        line = normalizer.normalize(raw_line)
+        if line is None:
+            continue
+        match = _DUO_LINE_RE.match(line)
+        if match:
+            speaker = match.group(1).upper()
+            line = match.group(2).strip()
+        # Unlabeled lines continue the current turn; text before the first label is dropped.
+        if speaker is None or not line:
+            continue
+        emitted = True
+        yield speaker, line
+    if not emitted:
+        raise ValueError("script_mode=duo requires script lines prefixed with HOST_A: or HOST_B:.")
+
+
+def _iter_streamed_audio(
+    script_segments: Iterable[str],
+    *,
+    script_mode: str,
+    speaker_a_voice_id: str,
+    speaker_b_voice_id: str,
+    pace: VoicePaceMeter,
+    **tts_options: Any,
+) -> Iterator[ScannedAudio]:
+    """Voice streamed script segments in order, recording each voice's pace in ``pace``.
+
+    Duo turns are coalesced into requests as in ``_iter_duo_audio``; single-host segments are
+    voiced as they arrive. Each chunk is scanned once, for both stitching and pace.
+    """
+    voice_segments: list[tuple[str, str]] = []
+
+    def planned_segments() -> Iterator[tuple[str, str]]:
+        if script_mode == "duo":
+            segments: Iterable[tuple[str, str]] = (
+                (
+                    speaker_a_voice_id if request.speaker == "HOST_A" else speaker_b_voice_id,
+                    request.text,
+                )
+                for request in _iter_duo_requests(_streamed_duo_turns(script_segments))
+            )
+        else:
+            segments = ((speaker_a_voice_id, segment) for segment in script_segments)
+        for segment in segments:
+            voice_segments.append(segment)
+            yield segment
+
+    provider = tts_options.get("provider", "polly")
+    previous_index = None
+    for segment_index, chunk_audio in iter_voice_segments(
+        planned_segments(), max_text_chars=_MAX_TEXT_CHARS, **tts_options
+    ):
+        scanned = scan_audio(chunk_audio)
+        voice_id, text = voice_segments[segment_index]
+        # A segment voiced in several chunks counts its words with its first chunk.
+        words = count_words(text) if segment_index != previous_index else 0
+        previous_index = segment_index
+        pace.record(voice_key(provider, voice_id), words, scanned.duration_sec)
+        yield scanned
+
+
+def streaming_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+    """Rewrite and voice the script in one step, synthesizing segments while Bedrock streams.
+
+    Completed sentences (or duo turns) go to the TTS pool as soon as they are generated, so
+    audio is ready about one LLM generation earlier than with separate rewrite and generate
+    steps. ``script.txt`` and ``script.json`` are written once the stream ends, with the same
+    metadata as the rewrite step, and the output carries ``article_token_count`` likewise.
+    """
+    pipeline_event = PipelineEvent.from_dict(event)
+    job_id, article_key = pipeline_event.require_rewrite_fields()
+
+    settings = load_settings()
+    bucket = pipeline_event.resolved_bucket(settings.bucket)
+    voice_id, voice_id_b = _resolve_voice_ids(pipeline_event, settings)
+    inputs = load_script_inputs(pipeline_event, settings, get_text(bucket, article_key))
+    article_text, input_tokens, route = inputs.article_text, inputs.input_tokens, inputs.route
+    target_minutes = settings.script_target_minutes
+    script_cache = build_script_cache(settings, bucket)
+    cache_key = script_cache_key(
+        pipeline_event, settings, route.model_id, article_text, input_tokens=input_tokens
+    )
+    cached_script = get_cached_script(script_cache, cache_key, job_id=job_id)
+    # With checkpoints the step is retried; a retry replays the script the first attempt
+    # streamed, so its chunks hash the same and completed chunk objects are reused.
+    script_checkpoint = JobScriptCheckpoint(bucket, job_id) if settings.audio_checkpoints else None
+    checkpoint_key = cache_key
+    stored_script = cached_script
+    if stored_script is None:
+        stored_script = get_cached_script(script_checkpoint, checkpoint_key, job_id=job_id)
+    generation_ms: int | None = None
+    if stored_script is not None:
+        # A stored script is voiced through the same segmenter as a live stream.
+        deltas: Iterable[str] = [stored_script]
+    else:
+        source_text = prepare_source(
+            pipeline_event,
+            settings,
+            bucket=bucket,
+            job_id=job_id,
+            article_text=article_text,
+            input_tokens=input_tokens,
+        )
+        started = time.perf_counter()
+        # Outlined parts are written in parallel and voiced once all are done.
+        outlined_script = write_outlined(
+            pipeline_event,
+            settings,
+            bucket=bucket,
+            job_id=job_id,
+            source_text=source_text,
+            model_id=route.model_id,
+        )
+        if outlined_script is not None:
+            deltas = [outlined_script]
+        else:
+            if settings.script_generation == "outline":
+                # The outline fell back to one call; key the script by the path that wrote it.
+                cache_key = script_cache_key(
+                    pipeline_event,
+                    settings,
+                    route.model_id,
+                    article_text,
+                    input_tokens=input_tokens,
+                    generation="whole",
+                )
+            deltas = stream_bedrock(
+                route.model_id,
+                build_prompt(pipeline_event, source_text, target_minutes=target_minutes),
+                max_tokens=inputs.max_tokens,
+                cache_prompt=settings.bedrock_prompt_cache,
+            )
+
+    def on_script_complete(streamed_text: str) -> None:
+        # Runs on the reader thread when generation ends, before voicing catches up.
+        nonlocal generation_ms
+        generation_ms = log_generation(
+            inputs, job_id=job_id, started=started, script_text=streamed_text
+        )
+        put_cached_script(script_checkpoint, checkpoint_key, streamed_text, job_id=job_id)
+
+    script = ScriptStream(
+        deltas,
+        script_mode=pipeline_event.script_mode,
+        on_complete=on_script_complete if stored_script is None else None,
+    )
+    tts_cache = _build_tts_cache(settings, bucket)
+    pace = VoicePaceMeter()
+    audio_parts = _iter_streamed_audio(
+        script,
+        script_mode=pipeline_event.script_mode,
+        speaker_a_voice_id=voice_id,
+        speaker_b_voice_id=voice_id_b,
+        pace=pace,
+        **_tts_options(settings, bucket, job_id, tts_cache),
+    )
+
+    audio_key = f"jobs/{job_id}/audio.mp3"
+    measured_sec = _store_audio(
+        bucket, audio_key, audio_parts, upload_mode=settings.audio_upload_mode, job_id=job_id
+    )
+    _evict_tts_cache(tts_cache)
+    _record_voice_pace(settings, bucket, pace)
+    script_text = script.text
+    if pipeline_event.script_mode == "duo":
+        # Store the script as it was voiced.
+        script_text, _ = normalize_duo_script(script_text)
+    if cached_script is None:
+        put_cached_script(script_cache, cache_key, script_text, job_id=job_id)
+    script_key, metadata_key = store_script(
+        bucket,
+        job_id,
+        pipeline_event,
+        route.model_id,
+        script_text,
+        cache_hit=cached_script is not None,
+        compression=inputs.compression,
+        generation_ms=generation_ms,
+    )
 
     return pipeline_event.with_updates(
+        bucket=bucket,
+        article_token_count=inputs.source_tokens,
+        script_s3_key=script_key,
+        script_metadata_s3_key=metadata_key,
+        audio_s3_key=audio_key,
+        audio_estimated_duration_sec=_duration_sec(measured_sec, script_text),
+    ).to_dict()
+
+
+def _plan_chunks(
+    script_text: str,
+    *,
+    job_id: str,
+    script_mode: str,
+    voice_id: str,
+    voice_id_b: str,
+    provider_options: dict[str, Any],
+    voice_wpm: dict[str, float] | None = None,
+) -> list[dict[str, Any]]:
+    if script_mode == "duo":
+        turns = _parse_duo_turns(script_text)
+        if not turns:
+            raise ValueError(
+                "script_mode=duo requires script lines prefixed with HOST_A: or HOST_B:."
+            )
+        segments = [
+            (request.speaker, voice_id if request.speaker == "HOST_A" else voice_id_b, request.text)
+            for request in _plan_duo_requests(turns)
+        ]
+    else:
+        segments = [(None, voice_id, script_text)]
+
+    voice_wpm = voice_wpm or {}
+    chunks: list[dict[str, Any]] = []
+    for speaker, segment_voice_id, segment_text in segments:
+        wpm = voice_wpm.get(voice_key(provider_options["provider"], segment_voice_id), DEFAULT_WPM)
+        for chunk_text in split_text_for_tts(segment_text, max_text_chars=_MAX_TEXT_CHARS):
+            key = chunk_cache_key(
+                chunk_text,
+                segment_voice_id,
+                provider=provider_options["provider"],
+                output_format=provider_options["output_format"],
+                text_type=provider_options["text_type"],
+                elevenlabs_model_id=provider_options["elevenlabs_model_id"],
+            )
+            chunks.append(
+                {
+                    "index": len(chunks),
+                    "speaker": speaker,
+                    "voice_id": segment_voice_id,
+                    "text": chunk_text,
+                    "s3_key": f"{chunks_prefix(job_id)}{key}.mp3",
+                    "estimated_duration_sec": estimate_duration_sec(chunk_text, wpm),
+                }
+            )
+    return chunks
+
+
+def plan_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+    """Split the script into chunk tasks for the Step Functions Map fan-out."""
+    pipeline_event = PipelineEvent.from_dict(event)
+    job_id, script_key = pipeline_event.require_generate_fields()
+
+    settings = load_settings()
+    bucket = pipeline_event.resolved_bucket(settings.bucket)
+    voice_id, voice_id_b = _resolve_voice_ids(pipeline_event, settings)
+    script_text = get_text(bucket, script_key)
+    chunks = _plan_chunks(
+        script_text,
+        job_id=job_id,
+        script_mode=pipeline_event.script_mode,
+        voice_id=voice_id,
+        voice_id_b=voice_id_b,
+        provider_options=_provider_options(settings),
+        voice_wpm=_load_voice_pace(settings, bucket),
+    )
+    estimated_duration_sec = sum(chunk["estimated_duration_sec"] for chunk in chunks)
+
+    plan_key = f"{chunks_prefix(job_id)}plan.json"
+    put_json(
+        bucket,
+        plan_key,
+        {
+            "job_id": job_id,
+            "script_s3_key": script_key,
+            "script_mode": pipeline_event.script_mode,
+            "chunks": chunks,
+        },
+    )
+    logger.info(
+        "Planned audio chunks",
+        extra={
+            "job_id": job_id,
+            "key": plan_key,
+            "chunk_count": len(chunks),
+            "estimated_duration_sec": estimated_duration_sec,
+        },
+    )
+
+    result = pipeline_event.with_updates(
+        bucket=bucket,
+        audio_plan_s3_key=plan_key,
+        audio_chunk_count=len(chunks),
+        audio_estimated_duration_sec=estimated_duration_sec,
+    ).to_dict()
+    # Map state items stay small; each chunk task reads its text from the plan in S3.
+    result["audio_chunk_items"] = [{"chunk_index": index} for index in range(len(chunks))]
+    return result
+
+
+def chunk_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+    """Synthesize one planned chunk (one Map iteration) and store it under the job prefix."""
+    pipeline_event = PipelineEvent.from_dict(event)
+    job_id, plan_key = pipeline_event.require_audio_plan_fields()
+    chunk_index = pipeline_event.extras.get("chunk_index")
+    if type(chunk_index) is not int or chunk_index < 0:
+        raise EventSchemaError("event field 'chunk_index' must be an integer >= 0")
+
+    settings = load_settings()
+    bucket = pipeline_event.resolved_bucket(settings.bucket)
+    chunk = get_json(bucket, plan_key)["chunks"][chunk_index]
+    if object_exists(bucket, chunk["s3_key"]):
+        logger.info(
+            "Audio chunk already synthesized",
+            extra={"job_id": job_id, "chunk_index": chunk_index, "key": chunk["s3_key"]},
+        )
+        return {"chunk_index": chunk_index, "skipped": True}
+
+    tts_cache = _build_tts_cache(settings, bucket)
+    audio = synthesize_speech(
+        chunk["text"],
+        voice_id=chunk["voice_id"],
+        max_text_chars=_MAX_TEXT_CHARS,
+        cache=tts_cache,
+        rate_limiter=_build_rate_limiter(settings, max_concurrency=1),
+        **_provider_options(settings),
+    )
+    put_bytes(bucket, chunk["s3_key"], audio, content_type="audio/mpeg")
+    logger.info(
+        "Stored audio chunk",
+        extra={
+            "job_id": job_id,
+            "chunk_index": chunk_index,
+            "speaker": chunk["speaker"],
+            "audio_bytes": len(audio),
+        },
+    )
+    return {"chunk_index": chunk_index, "skipped": False, "audio_bytes": len(audio)}
+
+
+def assemble_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+    """Stitch planned chunk audio, in plan order, into ``audio.mp3``."""
+    pipeline_event = PipelineEvent.from_dict(event)
+    job_id, plan_key = pipeline_event.require_audio_plan_fields()
+
+    settings = load_settings()
+    bucket = pipeline_event.resolved_bucket(settings.bucket)
+    chunks = get_json(bucket, plan_key)["chunks"]
+
+    pace = VoicePaceMeter()
+
+    def chunk_audio() -> Iterator[ScannedAudio]:
+        for chunk in chunks:
+            scanned = scan_audio(get_bytes(bucket, chunk["s3_key"]))
+            pace.record(
+                voice_key(settings.tts_provider, chunk["voice_id"]),
+                count_words(chunk["text"]),
+                scanned.duration_sec,
+            )
+            yield scanned
+
+    audio_key = f"jobs/{job_id}/audio.mp3"
+    measured_sec = _store_audio(
+        bucket,
+        audio_key,
+        chunk_audio(),
+        upload_mode=settings.audio_upload_mode,
+        job_id=job_id,
+    )
+    _record_voice_pace(settings, bucket, pace)
+
+    script_text = "\n".join(chunk["text"] for chunk in chunks)
+    result = pipeline_event.with_updates(
         bucket=bucket,
         audio_s3_key=audio_key,
-        audio_estimated_duration_sec=_estimate_duration_sec(script_text),
+        audio_estimated_duration_sec=_duration_sec(measured_sec, script_text),
     ).to_dict()
+    result.pop("audio_chunk_items", None)
+    return result
@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from podcast_anything.config import load_settings
 from podcast_anything.event_schema import PipelineEvent
-from podcast_anything.llm import build_podcast_prompt, call_bedrock
-from podcast_anything.s3 import get_text, put_json, put_text
+from podcast_anything.llm import call_bedrock
+from podcast_anything.s3 import get_text
+from podcast_anything.script_pipeline import (
+    build_prompt,
+    build_script_cache,
+    get_cached_script,
+    load_script_inputs,
+    log_generation,
+    prepare_source,
+    put_cached_script,
+    repair_script,
+    script_cache_key,
+    store_script,
+    write_outlined,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -21,40 +35,71 @@ def handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     settings = load_settings()
     bucket = pipeline_event.resolved_bucket(settings.bucket)
 
-    article_text = get_text(bucket, article_key)
-    prompt = build_podcast_prompt(
-        article_text=article_text,
-        title=pipeline_event.title,
-        style=pipeline_event.style,
-        source_type=pipeline_event.source_type,
-        script_mode=pipeline_event.script_mode,
+    inputs = load_script_inputs(pipeline_event, settings, get_text(bucket, article_key))
+    article_text, input_tokens, route = inputs.article_text, inputs.input_tokens, inputs.route
+    target_minutes = settings.script_target_minutes
+    script_cache = build_script_cache(settings, bucket)
+    cache_key = script_cache_key(
+        pipeline_event, settings, route.model_id, article_text, input_tokens=input_tokens
     )
-
-    script_text = call_bedrock(settings.bedrock_model_id, prompt)
-
-    script_key = f"jobs/{job_id}/script.txt"
-    metadata_key = f"jobs/{job_id}/script.json"
-
-    put_text(bucket, script_key, script_text)
-    put_json(
+    script_text = get_cached_script(script_cache, cache_key, job_id=job_id)
+    cache_hit = script_text is not None
+    generation_ms = None
+    if script_text is None:
+        source_text = prepare_source(
+            pipeline_event,
+            settings,
+            bucket=bucket,
+            job_id=job_id,
+            article_text=article_text,
+            input_tokens=input_tokens,
+        )
+        started = time.perf_counter()
+        script_text = write_outlined(
+            pipeline_event,
+            settings,
+            bucket=bucket,
+            job_id=job_id,
+            source_text=source_text,
+            model_id=route.model_id,
+        )
+        generation = "outline" if script_text is not None else "whole"
+        if script_text is None:
+            script_text = call_bedrock(
+                route.model_id,
+                build_prompt(pipeline_event, source_text, target_minutes=target_minutes),
+                max_tokens=inputs.max_tokens,
+                cache_prompt=settings.bedrock_prompt_cache,
+            )
+        generation_ms = log_generation(
+            inputs, job_id=job_id, started=started, script_text=script_text
+        )
+        script_text = repair_script(pipeline_event, settings, script_text, job_id=job_id)
+        if generation != settings.script_generation:
+            # The outline fell back to one call; key the script by the path that wrote it.
+            cache_key = script_cache_key(
+                pipeline_event,
+                settings,
+                route.model_id,
+                article_text,
+                input_tokens=input_tokens,
+                generation=generation,
+            )
+        put_cached_script(script_cache, cache_key, script_text, job_id=job_id)
+    script_key, metadata_key = store_script(
         bucket,
-        metadata_key,
-        {
-            "job_id": job_id,
-            "source_url": pipeline_event.source_url,
-            "source_type": pipeline_event.source_type,
-            "title": pipeline_event.title,
-            "style": pipeline_event.style,
-            "script_mode": pipeline_event.script_mode,
-            "model_id": settings.bedrock_model_id,
-            "script_s3_key": script_key,
-        },
+        job_id,
+        pipeline_event,
+        route.model_id,
+        script_text,
+        cache_hit=cache_hit,
+        compression=inputs.compression,
+        generation_ms=generation_ms,
     )
 
-    logger.info("Stored podcast script", extra={"job_id": job_id, "key": script_key})
-
     return pipeline_event.with_updates(
         bucket=bucket,
+        article_token_count=inputs.source_tokens,
         script_s3_key=script_key,
         script_metadata_s3_key=metadata_key,
     ).to_dict()
@@ -3,54 +3,257 @@
 from __future__ import annotations
 
 import json
+import logging
+import math
+import queue
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
 
 import boto3
 
+logger = logging.getLogger(__name__)
+
 
 class LLMError(RuntimeError):
     pass
 
 
+@dataclass(frozen=True)
+class Prompt:
+    """A prompt split into a shared prefix and per-call content.
+
+    ``system`` is identical across the calls that share it (jobs with the same settings, or
+    the parallel part calls of one job), so Bedrock can cache it as a prompt prefix;
+    ``content`` carries what differs per call.
+    """
+
+    system: str
+    content: str
+
+    def __str__(self) -> str:
+        return f"{self.system}\n\n{self.content}"
+
+
+# Bump when the script prompt changes so cached scripts are not reused across versions.
+PODCAST_PROMPT_VERSION = "podcast-v2"
+
+
+def script_minutes_range(target_minutes: int) -> tuple[int, int]:
+    """The speech length range, in minutes, that the script prompt asks for."""
+    return max(1, target_minutes - 2), target_minutes + 2
+
+
+def _normalize_script_mode(script_mode: str) -> str:
+    normalized = script_mode.strip().lower()
+    if normalized not in {"single", "duo"}:
+        raise LLMError("script_mode must be either 'single' or 'duo'.")
+    return normalized
+
+
+def _source_block(
+    article_text: str,
+    *,
+    title: str | None,
+    style: str,
+    source_type: str | None,
+    script_mode: str,
+) -> str:
+    title_line = f"Title: {title}\n" if title else ""
+    if source_type == "youtube":
+        source_label = "YouTube transcript"
+    elif source_type == "multi":
+        source_label = (
+            "source material (several sources, each starting with a [Source n of N] line)"
+        )
+    else:
+        source_label = "source material"
+    return (
+        f"Style: {style}\n"
+        f"Script Mode: {script_mode}\n"
+        f"{title_line}"
+        f"Input Type: {source_type or 'article'}\n"
+        f"{source_label}:\n"
+        f"{article_text}"
+    )
+
+
 def build_podcast_prompt(
     article_text: str,
     title: str | None = None,
     style: str = "podcast",
     source_type: str | None = None,
     script_mode: str = "single",
-) -> str:
-    title_line = f"Title: {title}\n" if title else ""
-    source_label = "YouTube transcript" if source_type == "youtube" else "source material"
-    normalized_script_mode = script_mode.strip().lower()
+    target_minutes: int = 8,
+) -> Prompt:
+    min_minutes, max_minutes = script_minutes_range(target_minutes)
+    normalized_script_mode = _normalize_script_mode(script_mode)
     if normalized_script_mode == "single":
         script_instruction = (
             "Rewrite it into a natural, single-host podcast script. Keep it engaging, "
             "clear, and structured with an intro, 3-5 short segments with signposts, and "
             "a concise outro. "
         )
-    elif normalized_script_mode == "duo":
+    else:
         script_instruction = (
             "Rewrite it into a natural, two-host podcast dialogue between HOST_A and HOST_B. "
             "Use plain text lines prefixed with exactly 'HOST_A:' or 'HOST_B:'. "
             "Keep it engaging, clear, and structured with an intro, 3-5 short segments with "
             "signposts, and a concise outro. "
         )
+
+    return Prompt(
+        system=(
+            "You are a podcast writer. The user message holds the source material. "
+            f"{script_instruction}"
+            f"Aim for {min_minutes}-{max_minutes} minutes of speech. "
+            "Use plain text only; do not include JSON, markdown, or stage directions."
+        ),
+        content=_source_block(
+            article_text,
+            title=title,
+            style=style,
+            source_type=source_type,
+            script_mode=normalized_script_mode,
+        ),
+    )
+
+
+def build_outline_prompt(
+    article_text: str,
+    *,
+    segment_count: int,
+    title: str | None = None,
+    style: str = "podcast",
+    source_type: str | None = None,
+    script_mode: str = "single",
+) -> Prompt:
+    """Prompt for a short JSON outline (intro, ``segment_count`` segments, outro)."""
+    return Prompt(
+        system=(
+            "You are planning a podcast episode from the source material in the user message. "
+            "Reply with only a JSON object of the form "
+            '{"intro": "...", "segments": [{"title": "...", "points": ["..."]}], '
+            f'"outro": "..."}} with exactly {segment_count} segments in a logical order. '
+            "Give each segment a short title and 2-4 concrete points drawn from the source; "
+            "keep the intro and outro to one sentence each."
+        ),
+        content=_source_block(
+            article_text,
+            title=title,
+            style=style,
+            source_type=source_type,
+            script_mode=_normalize_script_mode(script_mode),
+        ),
+    )
+
+
+def build_script_part_prompt(
+    article_text: str,
+    outline_text: str,
+    *,
+    part_index: int,
+    part_count: int,
+    part_brief: str,
+    words: int,
+    title: str | None = None,
+    style: str = "podcast",
+    source_type: str | None = None,
+    script_mode: str = "single",
+) -> Prompt:
+    """Prompt for one part of an outlined episode.
+
+    The instructions, outline, and source form the shared ``system`` prefix of every part call
+    of the job; only the part brief differs.
+    """
+    normalized_script_mode = _normalize_script_mode(script_mode)
+    if normalized_script_mode == "single":
+        format_instruction = "The episode has a single host. "
     else:
-        raise LLMError("script_mode must be either 'single' or 'duo'.")
+        format_instruction = (
+            "The episode is a natural dialogue between HOST_A and HOST_B. "
+            "Every line starts with exactly 'HOST_A:' or 'HOST_B:'. "
+        )
+    return Prompt(
+        system=(
+            "You are a podcast writer. You write one part of an episode at a time; other "
+            "writers produce the other parts in parallel from the same outline, and the parts "
+            "are joined in order, so keep to your part. "
+            f"{format_instruction}"
+            "Use plain text only; do not include JSON, markdown, stage directions, or part "
+            "headings.\n\n"
+            f"Episode outline:\n{outline_text}\n\n"
+            + _source_block(
+                article_text,
+                title=title,
+                style=style,
+                source_type=source_type,
+                script_mode=normalized_script_mode,
+            )
+        ),
+        content=f"Write part {part_index + 1} of {part_count}. {part_brief} "
+        f"Aim for about {words} words.",
+    )
 
-    return (
-        "You are a podcast writer. "
-        f"{script_instruction}"
-        "Aim for 6-10 minutes of speech. "
-        "Use plain text only; do not include JSON, markdown, or stage directions.\n\n"
-        f"Style: {style}\n"
-        f"Script Mode: {normalized_script_mode}\n"
-        f"{title_line}"
-        f"Input Type: {source_type or 'article'}\n"
-        f"{source_label}:\n"
-        f"{article_text}"
+
+def build_notes_prompt(
+    section_text: str,
+    *,
+    section_index: int,
+    section_count: int,
+    title: str | None = None,
+) -> Prompt:
+    """Prompt that condenses one section of a long source into notes for the script writer."""
+    title_line = f"Title: {title}\n" if title else ""
+    return Prompt(
+        system=(
+            "You are preparing research notes for a podcast writer. "
+            "Condense the source section in the user message into dense plain-text notes, "
+            "one point per line. Keep every key claim, name, number, date, and memorable "
+            "quote; drop repetition, navigation text, and boilerplate. "
+            "Do not add facts that are not in the section."
+        ),
+        content=f"{title_line}Section {section_index + 1}/{section_count}:\n{section_text}",
+    )
+
+
+def build_duo_repair_prompt(script_text: str) -> Prompt:
+    """Prompt that relabels a two-host script whose speaker prefixes could not be repaired."""
+    return Prompt(
+        system=(
+            "You fix speaker labels in a two-host podcast script. The user message holds the "
+            "script. Return the same dialogue with every line prefixed by exactly 'HOST_A:' "
+            "or 'HOST_B:', giving the first speaker HOST_A. Do not change, add, or remove "
+            "spoken words; drop markdown, headings, and stage directions. Reply with the "
+            "script only."
+        ),
+        content=script_text,
     )
 
 
+# Words and punctuation marks, the units subword tokenizers split text into first.
+_TOKEN_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+# Common English words up to this length are a single token in Bedrock tokenizers.
+_CHARS_PER_WORD_TOKEN = 6
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast local estimate of the model token count of ``text``, erring slightly high.
+
+    Each punctuation mark counts as one token and each word as one token per started
+    ``_CHARS_PER_WORD_TOKEN`` characters. Non-ASCII words (CJK, accented text) count one
+    token per character, since tokenizers split them far more finely.
+    """
+    total = 0
+    for piece in _TOKEN_PIECE_RE.findall(text):
+        if not piece.isascii():
+            total += len(piece)
+        else:
+            total += math.ceil(len(piece) / _CHARS_PER_WORD_TOKEN)
+    return total
+
+
 def _is_nova_model(model_id: str) -> bool:
     return model_id.startswith("amazon.nova") or model_id.startswith("us.amazon.nova")
 
@@ -59,12 +262,89 @@ def _is_anthropic_model(model_id: str) -> bool:
     return model_id.startswith("anthropic.") or model_id.startswith("us.anthropic.")
 
 
+# Bedrock does not cache prompt prefixes shorter than this on most Claude models.
+_MIN_CACHE_PREFIX_TOKENS = 1024
+
+
+def _anthropic_body(
+    prompt: str | Prompt, max_tokens: int, temperature: float, cache_prompt: bool = False
+) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    text = prompt
+    content_block: dict[str, Any] = {"type": "text", "text": text}
+    if isinstance(prompt, Prompt):
+        system_block: dict[str, Any] = {"type": "text", "text": prompt.system}
+        content_block["text"] = prompt.content
+        system_tokens = estimate_tokens(prompt.system)
+        if cache_prompt and system_tokens >= _MIN_CACHE_PREFIX_TOKENS:
+            # A system block this large (an outline part's outline and source) is shared
+            # by several calls; cache it on its own. Content after it is per call, so a
+            # breakpoint there would pay the cache-write surcharge without a later read.
+            system_block["cache_control"] = {"type": "ephemeral"}
+        body["system"] = [system_block]
+    body["messages"] = [{"role": "user", "content": [content_block]}]
+    return body
+
+
+def _nova_body(prompt: str | Prompt, max_tokens: int, temperature: float) -> dict[str, Any]:
+    body: dict[str, Any] = {}
+    text = prompt
+    if isinstance(prompt, Prompt):
+        body["system"] = [{"text": prompt.system}]
+        text = prompt.content
+    body["messages"] = [{"role": "user", "content": [{"text": text}]}]
+    body["inferenceConfig"] = {
+        "maxTokens": max_tokens,
+        "temperature": temperature,
+    }
+    return body
+
+
+def _log_usage(model_id: str, usage: dict[str, Any] | None) -> None:
+    """Log token usage, including prompt-cache reads and writes, from a Bedrock response."""
+    if not usage:
+        return
+    logger.info(
+        "Bedrock token usage",
+        extra={
+            "model_id": model_id,
+            "input_tokens": usage.get("input_tokens", usage.get("inputTokens")),
+            "output_tokens": usage.get("output_tokens", usage.get("outputTokens")),
+            "cache_read_tokens": usage.get(
+                "cache_read_input_tokens", usage.get("cacheReadInputTokenCount", 0)
+            ),
+            "cache_write_tokens": usage.get(
+                "cache_creation_input_tokens", usage.get("cacheWriteInputTokenCount", 0)
+            ),
+        },
+    )
+
+
 def call_bedrock(
-    model_id: str, prompt: str, max_tokens: int = 1400, temperature: float = 0.5
+    model_id: str,
+    prompt: str | Prompt,
+    max_tokens: int = 1400,
+    temperature: float = 0.5,
+    *,
+    cache_prompt: bool = False,
 ) -> str:
+    """Generate text; ``cache_prompt`` marks a ``Prompt`` for prompt caching.
+
+    The breakpoint goes after the ``system`` block when that alone is long enough to cache;
+    shorter prompts are sent unmarked. Prompt caching applies to Anthropic models only and
+    is ignored for other families.
+    """
     if _is_anthropic_model(model_id):
         return call_bedrock_anthropic(
-            model_id, prompt, max_tokens=max_tokens, temperature=temperature
+            model_id,
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            cache_prompt=cache_prompt,
         )
     if _is_nova_model(model_id):
         return call_bedrock_nova(model_id, prompt, max_tokens=max_tokens, temperature=temperature)
@@ -73,27 +353,22 @@ def call_bedrock(
 
 def call_bedrock_anthropic(
     model_id: str,
-    prompt: str,
+    prompt: str | Prompt,
     max_tokens: int = 1400,
     temperature: float = 0.5,
+    cache_prompt: bool = False,
 ) -> str:
     client = boto3.client("bedrock-runtime")
 
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": max_tokens,
-        "temperature": temperature,
-        "messages": [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
-    }
-
     response = client.invoke_model(
         modelId=model_id,
-        body=json.dumps(body),
+        body=json.dumps(_anthropic_body(prompt, max_tokens, temperature, cache_prompt)),
         accept="application/json",
         contentType="application/json",
     )
 
     payload = json.loads(response["body"].read())
+    _log_usage(model_id, payload.get("usage"))
     content = payload.get("content")
     if not content:
         raise LLMError("Bedrock response missing content.")
@@ -106,30 +381,198 @@ def call_bedrock_anthropic(
 
 def call_bedrock_nova(
     model_id: str,
-    prompt: str,
+    prompt: str | Prompt,
     max_tokens: int = 1400,
     temperature: float = 0.5,
 ) -> str:
     client = boto3.client("bedrock-runtime")
 
-    body = {
-        "messages": [{"role": "user", "content": [{"text": prompt}]}],
-        "inferenceConfig": {
-            "maxTokens": max_tokens,
-            "temperature": temperature,
-        },
-    }
-
     response = client.invoke_model(
         modelId=model_id,
-        body=json.dumps(body),
+        body=json.dumps(_nova_body(prompt, max_tokens, temperature)),
         accept="application/json",
         contentType="application/json",
     )
 
     payload = json.loads(response["body"].read())
+    _log_usage(model_id, payload.get("usage"))
     content_list = payload.get("output", {}).get("message", {}).get("content", [])
     text_block = next((item for item in content_list if "text" in item), None)
     if not text_block:
         raise LLMError("Nova response missing text.")
     return text_block["text"].strip()
+
+
+def stream_bedrock(
+    model_id: str,
+    prompt: str | Prompt,
+    max_tokens: int = 1400,
+    temperature: float = 0.5,
+    *,
+    cache_prompt: bool = False,
+) -> Iterator[str]:
+    """Yield generated text deltas as Bedrock streams them."""
+    if _is_anthropic_model(model_id):
+        return stream_bedrock_anthropic(
+            model_id,
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            cache_prompt=cache_prompt,
+        )
+    if _is_nova_model(model_id):
+        return stream_bedrock_nova(
+            model_id, prompt, max_tokens=max_tokens, temperature=temperature
+        )
+    raise LLMError(f"Unsupported Bedrock model_id: {model_id}")
+
+
+def _iter_stream_payloads(model_id: str, body: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    client = boto3.client("bedrock-runtime")
+    response = client.invoke_model_with_response_stream(
+        modelId=model_id,
+        body=json.dumps(body),
+        accept="application/json",
+        contentType="application/json",
+    )
+    for event in response["body"]:
+        chunk = event.get("chunk")
+        if chunk is None:
+            # Mid-stream failures arrive as an event keyed by the exception name.
+            error_name, error = next(iter(event.items()), ("unknown", {}))
+            message = error.get("message") if isinstance(error, dict) else error
+            raise LLMError(f"Bedrock stream failed ({error_name}): {message}")
+        yield json.loads(chunk["bytes"])
+
+
+def stream_bedrock_anthropic(
+    model_id: str,
+    prompt: str | Prompt,
+    max_tokens: int = 1400,
+    temperature: float = 0.5,
+    cache_prompt: bool = False,
+) -> Iterator[str]:
+    body = _anthropic_body(prompt, max_tokens, temperature, cache_prompt)
+    for payload in _iter_stream_payloads(model_id, body):
+        payload_type = payload.get("type")
+        if payload_type == "content_block_delta":
+            text = payload.get("delta", {}).get("text")
+            if text:
+                yield text
+        elif payload_type == "message_start":
+            # Input and cache token counts are reported once, before the first delta.
+            _log_usage(model_id, payload.get("message", {}).get("usage"))
+
+
+def stream_bedrock_nova(
+    model_id: str,
+    prompt: str | Prompt,
+    max_tokens: int = 1400,
+    temperature: float = 0.5,
+) -> Iterator[str]:
+    body = _nova_body(prompt, max_tokens, temperature)
+    for payload in _iter_stream_payloads(model_id, body):
+        text = payload.get("contentBlockDelta", {}).get("delta", {}).get("text")
+        if text:
+            yield text
+        elif "metadata" in payload:
+            _log_usage(model_id, payload["metadata"].get("usage"))
+
+
+# A sentence end (confirmed by the whitespace after it) or a line break.
+_SEGMENT_BOUNDARY_RE = re.compile(r"[.!?][\"')\]]*(?=\s)|\n")
+_STREAM_SEGMENT_MIN_CHARS = 400
+
+
+def iter_script_segments(
+    deltas: Iterable[str],
+    *,
+    script_mode: str = "single",
+    min_chars: int = _STREAM_SEGMENT_MIN_CHARS,
+) -> Iterator[str]:
+    """Cut streamed script text into segments as soon as they are complete.
+
+    In ``duo`` mode every finished line is one segment, so each turn can be voiced as soon
+    as its line ends. In ``single`` mode text is cut at the first sentence end or line break
+    after ``min_chars``, so TTS requests are neither tiny nor delayed.
+    """
+    buffer = ""
+    for delta in deltas:
+        buffer += delta
+        if script_mode == "duo":
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                if line.strip():
+                    yield line.strip()
+            continue
+        while len(buffer) > min_chars:
+            match = _SEGMENT_BOUNDARY_RE.search(buffer, min_chars - 1)
+            if match is None:
+                break
+            segment, buffer = buffer[: match.end()].strip(), buffer[match.end() :]
+            if segment:
+                yield segment
+    if buffer.strip():
+        yield buffer.strip()
+
+
+_STREAM_DONE = object()
+
+
+class ScriptStream:
+    """Read a streamed script on a background thread and hand out completed segments.
+
+    Reading runs ahead of the consumer, so slow TTS requests never hold up generation.
+    Iterating yields segments in order and re-raises any stream error; ``text`` is the full
+    script once iteration has finished. ``on_complete`` receives the full script on the
+    reading thread as soon as the stream ends without error, before iteration finishes.
+    """
+
+    def __init__(
+        self,
+        deltas: Iterable[str],
+        *,
+        script_mode: str = "single",
+        min_chars: int = _STREAM_SEGMENT_MIN_CHARS,
+        on_complete: Callable[[str], None] | None = None,
+    ) -> None:
+        self._parts: list[str] = []
+        self._segments: queue.Queue[object] = queue.Queue()
+        self._error: Exception | None = None
+        self._on_complete = on_complete
+        self._thread = threading.Thread(
+            target=self._read, args=(deltas, script_mode, min_chars), daemon=True
+        )
+        self._thread.start()
+
+    def _read(self, deltas: Iterable[str], script_mode: str, min_chars: int) -> None:
+        def recorded() -> Iterator[str]:
+            for delta in deltas:
+                self._parts.append(delta)
+                yield delta
+
+        try:
+            for segment in iter_script_segments(
+                recorded(), script_mode=script_mode, min_chars=min_chars
+            ):
+                self._segments.put(segment)
+            if self._on_complete is not None:
+                self._on_complete(self.text)
+        except Exception as exc:  # re-raised in the consuming thread
+            self._error = exc
+        finally:
+            self._segments.put(_STREAM_DONE)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            segment = self._segments.get()
+            if segment is _STREAM_DONE:
+                break
+            yield str(segment)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts).strip()
@@ -0,0 +1,124 @@
+"""Route script generation to a Bedrock model by input size and size its output budget."""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Sequence
+
+from podcast_anything.llm import estimate_tokens, script_minutes_range
+from podcast_anything.voice_pace import DEFAULT_WPM
+
+logger = logging.getLogger(__name__)
+
+# Spoken-style English averages about 1.3 tokens per word; the headroom keeps a script at
+# the top of the requested length range from being cut off mid-sentence.
+_TOKENS_PER_WORD = 1.3
+_OUTPUT_HEADROOM = 1.25
+# Largest ``max_tokens`` Bedrock accepts per model family, matched by model ID substring in
+# order. Unknown models get the smallest limit among the families the pipeline supports.
+_OUTPUT_TOKEN_LIMITS = (
+    ("anthropic.claude-3-5-", 8192),
+    ("anthropic.claude-3-7-", 64000),
+    ("anthropic.claude-3-", 4096),
+    ("anthropic.claude-sonnet-4", 64000),
+    ("anthropic.claude-opus-4", 32000),
+    ("amazon.nova-", 5000),
+)
+_DEFAULT_OUTPUT_TOKEN_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """The model chosen for a call and the input-size bucket that chose it."""
+
+    model_id: str
+    # Upper input-token bound of the bucket; ``None`` for the default route.
+    max_input_tokens: int | None = None
+
+    @property
+    def name(self) -> str:
+        if self.max_input_tokens is None:
+            return "default"
+        return f"up_to_{self.max_input_tokens}"
+
+
+def select_route(
+    routes: Sequence[tuple[int, str]], default_model_id: str, input_tokens: int
+) -> ModelRoute:
+    """Return the smallest route whose limit covers ``input_tokens``, else the default model.
+
+    ``routes`` are ``(max_input_tokens, model_id)`` pairs, as loaded from
+    ``BEDROCK_MODEL_ROUTES``; inputs above every limit go to ``default_model_id``.
+    """
+    for max_input_tokens, model_id in sorted(routes):
+        if input_tokens <= max_input_tokens:
+            return ModelRoute(model_id, max_input_tokens)
+    return ModelRoute(default_model_id)
+
+
+def output_token_limit(model_id: str) -> int:
+    """The largest ``max_tokens`` a Bedrock call to ``model_id`` may ask for."""
+    for fragment, limit in _OUTPUT_TOKEN_LIMITS:
+        if fragment in model_id:
+            return limit
+    return _DEFAULT_OUTPUT_TOKEN_LIMIT
+
+
+def max_tokens_for_words(words: float) -> int:
+    """Output token budget for about ``words`` words of script, with headroom."""
+    return math.ceil(words * _TOKENS_PER_WORD * _OUTPUT_HEADROOM)
+
+
+def script_max_tokens(
+    target_minutes: int, wpm: float = DEFAULT_WPM, *, model_id: str | None = None
+) -> int:
+    """Output token budget for a script at the top of the requested length range.
+
+    With ``model_id`` the budget is clamped to that model's output limit, so a long
+    ``SCRIPT_TARGET_MINUTES`` yields a shorter script instead of a rejected request.
+    """
+    _, upper_minutes = script_minutes_range(target_minutes)
+    budget = max_tokens_for_words(upper_minutes * wpm)
+    if model_id is None:
+        return budget
+    limit = output_token_limit(model_id)
+    if budget > limit:
+        logger.warning(
+            "Script output budget exceeds model limit; clamping",
+            extra={
+                "model_id": model_id,
+                "target_minutes": target_minutes,
+                "max_tokens": budget,
+                "output_token_limit": limit,
+            },
+        )
+        return limit
+    return budget
+
+
+def log_route_latency(
+    route: ModelRoute,
+    *,
+    job_id: str,
+    input_tokens: int,
+    max_tokens: int,
+    elapsed_ms: int,
+    output_text: str,
+) -> None:
+    """Log one routed call so route thresholds can be tuned from the latency distribution."""
+    output_tokens = estimate_tokens(output_text)
+    logger.info(
+        "Routed Bedrock call",
+        extra={
+            "job_id": job_id,
+            "route": route.name,
+            "model_id": route.model_id,
+            "input_tokens": input_tokens,
+            "max_tokens": max_tokens,
+            "output_tokens_estimate": output_tokens,
+            "elapsed_ms": elapsed_ms,
+            "ms_per_output_token": round(elapsed_ms / max(output_tokens, 1), 2),
+        },
+    )
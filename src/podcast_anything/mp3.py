@@ -0,0 +1,359 @@
+"""Frame-level MPEG Layer III helpers: scan, strip metadata, and stitch without re-encoding."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+_BITRATES_KBPS = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000),
+}
+# Header version bits -> MPEG version (1, 2, or 2.5 as 25); 0b01 is reserved.
+_VERSIONS = {0b11: 1, 0b10: 2, 0b00: 25}
+_MONO = 0b11
+_VBR_TAGS = (b"Xing", b"Info")
+_VBRI_OFFSET = 36
+_TOC_SIZE = 100
+_XING_FLAGS = 0x0007  # frame count, byte count, TOC
+_ID3V1_SIZE = 128
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """Decoded fields of one 4-byte MPEG Layer III frame header."""
+
+    raw: int
+    version: int
+    bitrate_index: int
+    sample_rate: int
+    padding: int
+    channel_mode: int
+    has_crc: bool
+
+    @property
+    def bitrate_kbps(self) -> int:
+        return _BITRATES_KBPS[1 if self.version == 1 else 2][self.bitrate_index]
+
+    @property
+    def samples_per_frame(self) -> int:
+        return 1152 if self.version == 1 else 576
+
+    @property
+    def frame_length(self) -> int:
+        coefficient = 144 if self.version == 1 else 72
+        return coefficient * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    @property
+    def duration_sec(self) -> float:
+        return self.samples_per_frame / self.sample_rate
+
+    @property
+    def side_info_size(self) -> int:
+        mono = self.channel_mode == _MONO
+        if self.version == 1:
+            return 17 if mono else 32
+        return 9 if mono else 17
+
+    @property
+    def vbr_tag_offset(self) -> int:
+        return 4 + (2 if self.has_crc else 0) + self.side_info_size
+
+
+def parse_frame_header(data: bytes | memoryview, offset: int = 0) -> FrameHeader | None:
+    """Return the Layer III frame header at ``offset``, or ``None`` if it is not one."""
+    if offset + 4 > len(data) or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+    raw = int.from_bytes(data[offset : offset + 4], "big")
+    version = _VERSIONS.get((raw >> 19) & 0b11)
+    layer_bits = (raw >> 17) & 0b11
+    bitrate_index = (raw >> 12) & 0b1111
+    sample_rate_index = (raw >> 10) & 0b11
+    if version is None or layer_bits != 0b01:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    return FrameHeader(
+        raw=raw,
+        version=version,
+        bitrate_index=bitrate_index,
+        sample_rate=_SAMPLE_RATES[version][sample_rate_index],
+        padding=(raw >> 9) & 1,
+        channel_mode=(raw >> 6) & 0b11,
+        has_crc=not (raw >> 16) & 1,
+    )
+
+
+def _id3v2_size(data: memoryview, offset: int) -> int:
+    if len(data) - offset < 10 or data[offset : offset + 3] != b"ID3":
+        return 0
+    size_bytes = data[offset + 6 : offset + 10]
+    if any(byte & 0x80 for byte in size_bytes):
+        return 0
+    size = 0
+    for byte in size_bytes:
+        size = (size << 7) | byte
+    footer = 10 if data[offset + 5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_vbr_info_frame(data: memoryview, offset: int, header: FrameHeader) -> bool:
+    tag_offset = offset + header.vbr_tag_offset
+    if data[tag_offset : tag_offset + 4] in _VBR_TAGS:
+        return True
+    return data[offset + _VBRI_OFFSET : offset + _VBRI_OFFSET + 4] == b"VBRI"
+
+
+def iter_audio_frames(data: bytes | memoryview) -> Iterator[tuple[int, FrameHeader]]:
+    """Yield ``(offset, header)`` for each audio frame in one linear pass over ``data``.
+
+    ID3v1/ID3v2 tags and Xing/Info/VBRI metadata frames are skipped, as is any garbage
+    between frames. A sync word only counts as a frame if another frame (or the end of
+    the buffer) follows it, which filters out false syncs inside tag payloads.
+    """
+    view = memoryview(data)
+    end = len(view)
+    offset = 0
+    # The header that confirmed the previous frame; reused so each header is parsed once.
+    confirmed: FrameHeader | None = None
+    while offset + 4 <= end:
+        header, confirmed = confirmed or parse_frame_header(view, offset), None
+        if header is None:
+            tag_size = _id3v2_size(view, offset)
+            if tag_size:
+                offset += tag_size
+                continue
+            if end - offset == _ID3V1_SIZE and view[offset : offset + 3] == b"TAG":
+                return
+        else:
+            next_offset = offset + header.frame_length
+            if next_offset < end:
+                confirmed = parse_frame_header(view, next_offset)
+            if (
+                next_offset == end
+                or confirmed is not None
+                or (
+                    next_offset < end
+                    and (_id3v2_size(view, next_offset) or end - next_offset == _ID3V1_SIZE)
+                )
+            ):
+                if not _is_vbr_info_frame(view, offset, header):
+                    yield offset, header
+                offset = next_offset
+                continue
+        found = _find_sync(view, offset + 1)
+        if found < 0:
+            return
+        offset = found
+
+
+def _find_sync(view: memoryview, start: int) -> int:
+    # memoryview has no find(); search the underlying object when it is bytes-like.
+    obj = view.obj
+    if isinstance(obj, (bytes, bytearray)) and len(obj) == len(view):
+        return obj.find(b"\xff", start)
+    for index in range(start, len(view)):
+        if view[index] == 0xFF:
+            return index
+    return -1
+
+
+def _collect_runs(
+    view: memoryview, on_frame: Callable[[FrameHeader], None] | None = None
+) -> list[memoryview]:
+    runs: list[memoryview] = []
+    run_start = run_end = -1
+    for offset, header in iter_audio_frames(view):
+        if on_frame is not None:
+            on_frame(header)
+        if offset != run_end:
+            if run_start >= 0:
+                runs.append(view[run_start:run_end])
+            run_start = offset
+        run_end = offset + header.frame_length
+    if run_start >= 0:
+        runs.append(view[run_start:run_end])
+    return runs
+
+
+def audio_runs(
+    data: bytes | memoryview, on_frame: Callable[[FrameHeader], None] | None = None
+) -> list[memoryview]:
+    """Return zero-copy slices covering only the audio frames of ``data``, in order.
+
+    Adjacent frames are merged into a single slice. Returns an empty list when ``data``
+    contains no MPEG Layer III frames. ``on_frame`` is called with each audio frame header.
+    """
+    return _collect_runs(memoryview(data), on_frame)
+
+
+@dataclass(frozen=True)
+class ScannedAudio:
+    """One buffer together with its audio runs and frame headers from a single scan."""
+
+    data: bytes | memoryview
+    runs: list[memoryview]
+    headers: list[FrameHeader]
+
+    @property
+    def duration_sec(self) -> float:
+        return sum(header.duration_sec for header in self.headers)
+
+
+def scan_audio(data: bytes | memoryview) -> ScannedAudio:
+    """Scan ``data`` once so its runs and duration can be reused without another pass."""
+    headers: list[FrameHeader] = []
+    return ScannedAudio(data, _collect_runs(memoryview(data), headers.append), headers)
+
+
+def audio_duration_sec(data: bytes | memoryview) -> float | None:
+    """Exact playback duration of ``data`` from its frame headers, without decoding.
+
+    Returns ``None`` when ``data`` contains no MPEG Layer III frames.
+    """
+    total = 0.0
+    frame_count = 0
+    for _, header in iter_audio_frames(data):
+        total += header.duration_sec
+        frame_count += 1
+    return total if frame_count else None
+
+
+class Mp3Assembler:
+    """Stitch MP3 buffers frame by frame, keeping references instead of copying audio.
+
+    Interior ID3 tags and Xing/Info/VBRI frames are dropped, and ``parts`` starts with one
+    freshly built Xing (or Info, for constant bitrate) frame describing the whole stream.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[memoryview] = []
+        self._frame_lengths = array("I")
+        self._first: FrameHeader | None = None
+        self._uniform = True
+        self._constant_bitrate = True
+        self.sample_count = 0
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._frame_lengths)
+
+    @property
+    def audio_bytes(self) -> int:
+        return sum(len(run) for run in self._runs)
+
+    @property
+    def duration_sec(self) -> float:
+        if self._first is None:
+            return 0.0
+        return self.sample_count / self._first.sample_rate
+
+    def _track(self, header: FrameHeader) -> None:
+        if self._first is None:
+            self._first = header
+        elif (header.version, header.sample_rate) != (
+            self._first.version,
+            self._first.sample_rate,
+        ):
+            self._uniform = False
+        if header.bitrate_index != self._first.bitrate_index:
+            self._constant_bitrate = False
+        self._frame_lengths.append(header.frame_length)
+        self.sample_count += header.samples_per_frame
+
+    def add(self, data: bytes | memoryview | ScannedAudio) -> bool:
+        """Append the audio frames of ``data``; return ``False`` if it holds no MP3 frames.
+
+        A ``ScannedAudio`` is appended from its recorded frames without scanning it again.
+        """
+        scanned = data if isinstance(data, ScannedAudio) else scan_audio(data)
+        for header in scanned.headers:
+            self._track(header)
+        self._runs.extend(scanned.runs)
+        return bool(scanned.runs)
+
+    def vbr_header_frame(self) -> bytes | None:
+        """Build one Xing/Info frame with frame count, byte count, and a 100-entry seek table.
+
+        Returns ``None`` when there is no audio or the stream mixes MPEG versions or sample
+        rates, where a single header could not describe every frame.
+        """
+        first = self._first
+        if first is None or not self._uniform:
+            return None
+        tag_offset = 4 + first.side_info_size
+        needed = tag_offset + 4 + 4 + 4 + 4 + _TOC_SIZE
+        # Same stream parameters as the audio, no CRC, no padding; grow the bitrate until
+        # the frame is large enough to hold the tag.
+        base_raw = (first.raw | (1 << 16)) & ~(1 << 9) & ~(0b1111 << 12)
+        header: FrameHeader | None = None
+        for bitrate_index in range(first.bitrate_index, 15):
+            header = parse_frame_header((base_raw | (bitrate_index << 12)).to_bytes(4, "big"))
+            if header is not None and header.frame_length >= needed:
+                break
+        if header is None or header.frame_length < needed:
+            return None
+
+        frame_count = self.frame_count
+        total_bytes = header.frame_length + self.audio_bytes
+        toc = bytearray(_TOC_SIZE)
+        position = header.frame_length
+        frame_index = 0
+        for percent in range(_TOC_SIZE):
+            target = percent * frame_count // _TOC_SIZE
+            while frame_index < target:
+                position += self._frame_lengths[frame_index]
+                frame_index += 1
+            toc[percent] = min(255, position * 256 // total_bytes)
+
+        frame = bytearray(header.frame_length)
+        frame[0:4] = header.raw.to_bytes(4, "big")
+        tag = b"Info" if self._constant_bitrate else b"Xing"
+        frame[tag_offset : tag_offset + 4] = tag
+        frame[tag_offset + 4 : tag_offset + 8] = _XING_FLAGS.to_bytes(4, "big")
+        frame[tag_offset + 8 : tag_offset + 12] = frame_count.to_bytes(4, "big")
+        frame[tag_offset + 12 : tag_offset + 16] = total_bytes.to_bytes(4, "big")
+        frame[tag_offset + 16 : tag_offset + 16 + _TOC_SIZE] = toc
+        return bytes(frame)
+
+    def parts(self) -> list[bytes | memoryview]:
+        header_frame = self.vbr_header_frame()
+        prefix: list[bytes | memoryview] = [header_frame] if header_frame else []
+        return prefix + list(self._runs)
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self.parts())
+
+
+def assemble_mp3(
+    chunks: Iterable[bytes | ScannedAudio],
+) -> tuple[list[bytes | memoryview], float | None]:
+    """Stitch MP3 buffers in one scan; return the parts to write and the stream duration.
+
+    When any input is not MPEG Layer III audio (for example PCM output formats) the inputs
+    are returned unchanged and the duration is ``None``.
+    """
+    assembler = Mp3Assembler()
+    buffers: list[bytes | memoryview] = []
+    all_parsed = True
+    for chunk in chunks:
+        buffers.append(chunk.data if isinstance(chunk, ScannedAudio) else chunk)
+        all_parsed = assembler.add(chunk) and all_parsed
+    if not buffers or not all_parsed:
+        return buffers, None
+    return assembler.parts(), assembler.duration_sec
+
+
+def stitch_mp3(chunks: Iterable[bytes | ScannedAudio]) -> bytes:
+    """Join MP3 buffers into one stream with a single VBR header and no interior metadata.
+
+    Inputs that are not MPEG Layer III audio are joined unchanged.
+    """
+    parts, _ = assemble_mp3(chunks)
+    return b"".join(parts)
@@ -0,0 +1,172 @@
+"""Concurrent fetching of multi-source inputs merged into one ``source.txt``."""
+
+from __future__ import annotations
+
+import base64
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import requests
+
+from podcast_anything import article, article_cache, document, youtube
+from podcast_anything.cache import CacheBackend
+from podcast_anything.config import Settings
+from podcast_anything.event_schema import SourceSpec
+from podcast_anything.llm import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class SourceFetchError(RuntimeError):
+    """Raised when none of the sources of a multi-source job could be read."""
+
+
+@dataclass(frozen=True)
+class SourceResult:
+    """Text read from one entry of ``sources``, or the error that prevented it."""
+
+    index: int
+    spec: SourceSpec
+    text: str
+    source_type: str | None
+    elapsed_ms: int
+    error: str | None = None
+
+    def provenance(self, section: int | None) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "section": section,
+            "kind": self.spec.kind,
+            "url": self.spec.url,
+            "file_name": self.spec.file_name,
+            "title": self.spec.title,
+            "source_type": self.source_type,
+            "char_count": len(self.text),
+            "token_count": estimate_tokens(self.text) if self.text else 0,
+            "elapsed_ms": self.elapsed_ms,
+            "error": self.error,
+        }
+
+
+def _read_source(
+    spec: SourceSpec,
+    *,
+    settings: Settings,
+    cache: CacheBackend | None,
+    session: requests.Session,
+    job_id: str,
+) -> tuple[str, str]:
+    """Return ``(text, source_type)`` for one source, like the single-source fetch step."""
+    if spec.file_base64 is not None:
+        try:
+            file_bytes = base64.b64decode(spec.file_base64, validate=True)
+        except ValueError as exc:
+            raise ValueError("file_base64 is not valid base64.") from exc
+        return document.extract_text_from_bytes(file_bytes, spec.file_name or "uploaded-document")
+    is_youtube_source = bool(spec.url) and youtube.is_youtube_url(spec.url or "")
+    if spec.text is not None:
+        return spec.text, "youtube" if is_youtube_source else "text"
+    if is_youtube_source:
+        raise ValueError("YouTube sources require caller-provided transcript text.")
+    text = article_cache.fetch_article_text(
+        spec.url or "",
+        cache=cache,
+        engine=settings.article_extractor,
+        max_bytes=settings.article_max_bytes,
+        job_id=job_id,
+        session=session,
+    )
+    return text, "article"
+
+
+def fetch_sources(
+    specs: Sequence[SourceSpec], *, settings: Settings, bucket: str, job_id: str
+) -> list[SourceResult]:
+    """Read every source concurrently and return the results in input order.
+
+    At most ``FETCH_MAX_CONCURRENCY`` sources are read at once, and one pooled session keeps
+    at most ``FETCH_MAX_PER_HOST`` connections open to any host. A source that fails, or is
+    not read within ``FETCH_BUDGET_SEC`` of the start, is logged and kept with its error;
+    ``SourceFetchError`` is raised only when all fail.
+    """
+    cache = article_cache.build_article_cache(settings, bucket)
+    session = article.build_session(settings.fetch_max_per_host)
+
+    def read(index: int, spec: SourceSpec) -> SourceResult:
+        started = time.perf_counter()
+        try:
+            text, source_type = _read_source(
+                spec, settings=settings, cache=cache, session=session, job_id=job_id
+            )
+            error = None
+        except (article.ArticleError, document.DocumentError, ValueError) as exc:
+            logger.warning(
+                "Source fetch failed",
+                extra={"job_id": job_id, "source_index": index, "error": str(exc)},
+            )
+            text, source_type, error = "", None, str(exc)
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return SourceResult(index, spec, text.strip(), source_type, elapsed_ms, error)
+
+    started = time.perf_counter()
+    workers = max(1, min(settings.fetch_max_concurrency, len(specs)))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures = [pool.submit(read, index, spec) for index, spec in enumerate(specs)]
+    try:
+        done, _ = wait(futures, timeout=settings.fetch_budget_sec)
+    finally:
+        # Sources still queued or reading past the budget are abandoned, not waited for.
+        pool.shutdown(wait=False, cancel_futures=True)
+        session.close()
+
+    results = []
+    for index, (spec, future) in enumerate(zip(specs, futures)):
+        if future in done:
+            results.append(future.result())
+            continue
+        error = f"Not read within the {settings.fetch_budget_sec}s fetch budget"
+        logger.warning(
+            "Source fetch failed", extra={"job_id": job_id, "source_index": index, "error": error}
+        )
+        budget_ms = settings.fetch_budget_sec * 1000
+        results.append(SourceResult(index, spec, "", None, budget_ms, error))
+
+    failed = [result for result in results if result.error is not None or not result.text]
+    logger.info(
+        "Fetched sources",
+        extra={
+            "job_id": job_id,
+            "source_count": len(results),
+            "failed_count": len(failed),
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            "slowest_source_ms": max(result.elapsed_ms for result in results),
+        },
+    )
+    if len(failed) == len(results):
+        errors = "; ".join(f"[{result.index}] {result.error or 'no text'}" for result in failed)
+        raise SourceFetchError(f"None of the {len(results)} sources could be read: {errors}")
+    return results
+
+
+def _label(spec: SourceSpec) -> str:
+    return spec.title or spec.url or spec.file_name or "Provided text"
+
+
+def merge_sources(results: Sequence[SourceResult]) -> tuple[str, list[dict[str, Any]]]:
+    """Join readable sources under ``[Source n of N: label]`` markers.
+
+    Returns the merged text and one provenance record per input source; ``section`` is the
+    marker number, or ``None`` for sources that were skipped.
+    """
+    readable = [result for result in results if result.error is None and result.text]
+    sections = {result.index: number for number, result in enumerate(readable, start=1)}
+    merged = "\n\n".join(
+        f"[Source {sections[result.index]} of {len(readable)}: {_label(result.spec)}]\n"
+        f"{result.text}"
+        for result in readable
+    )
+    provenance = [result.provenance(sections.get(result.index)) for result in results]
+    return merged, provenance
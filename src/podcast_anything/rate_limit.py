@@ -0,0 +1,216 @@
+"""Client-side rate limiting, adaptive concurrency, and throttle retries for provider calls."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class ThrottledError(RuntimeError):
+    """Raised by a provider call when the provider asked us to slow down."""
+
+    def __init__(self, message: str, *, retry_after_sec: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after_sec = retry_after_sec
+
+
+class TransientError(RuntimeError):
+    """Raised by a provider call that failed in a way worth retrying (5xx, dropped connection).
+
+    Retried like a throttle, but it does not shrink the concurrency limit.
+    """
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, sleeping until they are available; return seconds waited."""
+        # A request larger than the bucket can never fit, so cap it at a full bucket.
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit: grow by one per window of successes, halve on a throttle.
+
+    Throttles from requests that started before the most recent decrease do not shrink
+    the limit again, so one burst of 429s costs a single halving.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        *,
+        minimum: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maximum < 1 or minimum < 1 or minimum > maximum:
+            raise ValueError("concurrency bounds must satisfy 1 <= minimum <= maximum")
+        self.maximum = maximum
+        self.minimum = minimum
+        self._limit = float(maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._started = 0
+        self._last_decrease = 0
+        self._clock = clock
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return int(self._limit)
+
+    def acquire(self) -> tuple[int, float]:
+        """Wait for a slot; return a ticket for ``release`` and the seconds waited."""
+        started = self._clock()
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            self._started += 1
+            return self._started, self._clock() - started
+
+    def release(self, ticket: int, *, throttled: bool, failed: bool = False) -> None:
+        """Free a slot; ``failed`` calls neither shrink nor grow the limit."""
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                if ticket > self._last_decrease:
+                    self._limit = max(float(self.minimum), self._limit / 2)
+                    self._last_decrease = self._started
+                    self._successes = 0
+            elif not failed:
+                self._successes += 1
+                if self._successes >= int(self._limit):
+                    self._limit = min(float(self.maximum), self._limit + 1)
+                    self._successes = 0
+            self._condition.notify_all()
+
+
+class ProviderLimiter:
+    """Gate provider calls through rate buckets and adaptive concurrency, retrying throttles.
+
+    ``requests_per_sec`` and ``chars_per_sec`` are optional client-side budgets. Calls
+    that raise ``ThrottledError`` or ``TransientError`` are retried with full-jitter
+    exponential backoff (or the provider's ``Retry-After``) up to ``max_attempts`` total
+    attempts; only throttles shrink the concurrency limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        requests_per_sec: float | None = None,
+        chars_per_sec: float | None = None,
+        max_attempts: int = 4,
+        base_delay_sec: float = 0.5,
+        max_delay_sec: float = 8.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self.concurrency = AdaptiveConcurrency(max_concurrency, clock=clock)
+        self._request_bucket = (
+            TokenBucket(requests_per_sec, clock=clock, sleep=sleep) if requests_per_sec else None
+        )
+        self._char_bucket = (
+            TokenBucket(chars_per_sec, clock=clock, sleep=sleep) if chars_per_sec else None
+        )
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "throttle_count": 0,
+            "throttled_sec": 0.0,
+            "rate_wait_sec": 0.0,
+            "transient_error_count": 0,
+        }
+
+    def stats(self) -> dict[str, float]:
+        """Cumulative throttle and transient error counts, backoff time, and budget waits."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _record(self, **deltas: float) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                self._stats[name] += delta
+
+    def _backoff(self, attempt: int, retry_after_sec: float | None) -> float:
+        if retry_after_sec is not None:
+            return min(self.max_delay_sec, retry_after_sec)
+        ceiling = min(self.max_delay_sec, self.base_delay_sec * 2 ** (attempt - 1))
+        return self._rng.uniform(0, ceiling)
+
+    def call(self, func: Callable[[], _T], *, chars: int = 0) -> _T:
+        attempt = 0
+        while True:
+            attempt += 1
+            ticket, waited = self.concurrency.acquire()
+            throttled = False
+            failed = False
+            try:
+                if self._request_bucket:
+                    waited += self._request_bucket.acquire(1)
+                if self._char_bucket and chars:
+                    waited += self._char_bucket.acquire(chars)
+                self._record(rate_wait_sec=waited)
+                return func()
+            except ThrottledError as exc:
+                throttled = True
+                self._record(throttle_count=1)
+                if attempt == self.max_attempts:
+                    raise
+                delay = self._backoff(attempt, exc.retry_after_sec)
+            except TransientError:
+                failed = True
+                self._record(transient_error_count=1)
+                if attempt == self.max_attempts:
+                    raise
+                delay = self._backoff(attempt, None)
+            finally:
+                self.concurrency.release(ticket, throttled=throttled, failed=failed)
+            self._sleep(delay)
+            self._record(throttled_sec=delay)
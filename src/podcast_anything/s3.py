@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from datetime import datetime
+from typing import Any, Iterable
 
 import boto3
+from botocore.exceptions import ClientError
 
 
 def _client():
@@ -37,3 +39,138 @@ def get_json(bucket: str, key: str) -> dict[str, Any]:
 
 def put_bytes(bucket: str, key: str, data: bytes, content_type: str) -> None:
     _client().put_object(Bucket=bucket, Key=key, Body=data, ContentType=content_type)
+
+
+def get_bytes(bucket: str, key: str) -> bytes:
+    resp = _client().get_object(Bucket=bucket, Key=key)
+    return resp["Body"].read()
+
+
+def object_exists(bucket: str, key: str) -> bool:
+    try:
+        _client().head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+            return False
+        raise
+    return True
+
+
+def last_modified(bucket: str, key: str) -> datetime | None:
+    """Return an object's last-modified time, or ``None`` when the key is absent."""
+    try:
+        resp = _client().head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+            return None
+        raise
+    return resp["LastModified"]
+
+
+def get_bytes_if_exists(bucket: str, key: str) -> tuple[bytes, datetime] | None:
+    """Return object bytes and last-modified time, or ``None`` when the key is absent."""
+    try:
+        resp = _client().get_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+            return None
+        raise
+    return resp["Body"].read(), resp["LastModified"]
+
+
+def list_objects(bucket: str, prefix: str) -> list[dict[str, Any]]:
+    paginator = _client().get_paginator("list_objects_v2")
+    objects: list[dict[str, Any]] = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        objects.extend(page.get("Contents", []))
+    return objects
+
+
+def delete_keys(bucket: str, keys: Iterable[str]) -> None:
+    pending = list(keys)
+    # DeleteObjects accepts at most 1000 keys per request.
+    for start in range(0, len(pending), 1000):
+        batch = pending[start : start + 1000]
+        _client().delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+
+
+class MultipartUpload:
+    """Stream bytes into one S3 object, holding at most one part in memory.
+
+    Use as a context manager: parts are uploaded as soon as ``part_size`` bytes are buffered,
+    the upload is completed on a clean exit, and aborted if the block raises.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        content_type: str,
+        part_size: int = 8 * 1024 * 1024,
+    ) -> None:
+        if part_size < self.MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {self.MIN_PART_SIZE} bytes")
+        self.bucket = bucket
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.bytes_written = 0
+        self._client = _client()
+        self._buffer = bytearray()
+        self._parts: list[dict[str, Any]] = []
+        self._upload_id: str | None = None
+
+    @property
+    def part_count(self) -> int:
+        return len(self._parts)
+
+    def __enter__(self) -> "MultipartUpload":
+        resp = self._client.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            ContentType=self.content_type,
+        )
+        self._upload_id = resp["UploadId"]
+        return self
+
+    def write(self, data: bytes | memoryview) -> None:
+        self._buffer.extend(data)
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self._parts) + 1
+        resp = self._client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": resp["ETag"], "PartNumber": part_number})
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+            )
+            return
+        # The final part may be smaller than MIN_PART_SIZE; S3 requires at least one part.
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self._client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
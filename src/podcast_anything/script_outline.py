@@ -0,0 +1,223 @@
+"""Two-phase script generation: a short outline, then its parts written in parallel."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from podcast_anything import s3
+from podcast_anything.llm import (
+    build_outline_prompt,
+    build_script_part_prompt,
+    call_bedrock,
+    script_minutes_range,
+)
+from podcast_anything.model_routing import max_tokens_for_words, output_token_limit
+from podcast_anything.voice_pace import DEFAULT_WPM, count_words
+
+logger = logging.getLogger(__name__)
+
+# Bump when the outline or part prompts change so cached outlined scripts are not reused.
+OUTLINE_PROMPT_VERSION = "outline-v1"
+_OUTLINE_MAX_TOKENS = 800
+# Share of the episode's words given to each of the intro and the outro.
+_BOOKEND_SHARE = 0.075
+
+
+class ScriptOutlineError(RuntimeError):
+    """Raised when the outline reply cannot be parsed into intro, segments, and outro."""
+
+
+@dataclass(frozen=True)
+class OutlineSegment:
+    title: str
+    points: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ScriptOutline:
+    intro: str
+    segments: tuple[OutlineSegment, ...]
+    outro: str
+
+    def to_text(self) -> str:
+        lines = [f"Intro: {self.intro}"]
+        for index, segment in enumerate(self.segments, start=1):
+            lines.append(f"Segment {index}: {segment.title}")
+            lines.extend(f"- {point}" for point in segment.points)
+        lines.append(f"Outro: {self.outro}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "intro": self.intro,
+            "segments": [
+                {"title": segment.title, "points": list(segment.points)}
+                for segment in self.segments
+            ],
+            "outro": self.outro,
+        }
+
+    def part_briefs(self) -> list[str]:
+        """One instruction per part, in episode order: intro, each segment, outro."""
+        briefs = [
+            f"This is the intro: {self.intro} Welcome listeners, introduce the topic, and "
+            "briefly preview the segments without covering their details."
+        ]
+        for index, segment in enumerate(self.segments, start=1):
+            points = "; ".join(segment.points)
+            briefs.append(
+                f"This is segment {index}: {segment.title}. Cover: {points}. Open with a short "
+                "signpost; do not greet listeners or wrap up the episode."
+            )
+        briefs.append(
+            f"This is the outro: {self.outro} Recap the key takeaways and sign off without "
+            "introducing new material."
+        )
+        return briefs
+
+
+def outline_key(job_id: str) -> str:
+    return f"jobs/{job_id}/rewrite/outline.json"
+
+
+def _text(value: Any, field: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ScriptOutlineError(f"Outline field '{field}' must be a non-empty string.")
+    return value.strip()
+
+
+def parse_outline(text: str) -> ScriptOutline:
+    """Parse the model's outline reply, tolerating code fences or prose around the JSON."""
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ScriptOutlineError("Outline reply contains no JSON object.")
+    try:
+        payload = json.loads(text[start : end + 1])
+    except json.JSONDecodeError as exc:
+        raise ScriptOutlineError(f"Outline reply is not valid JSON: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ScriptOutlineError("Outline reply must be a JSON object.")
+
+    raw_segments = payload.get("segments")
+    if not isinstance(raw_segments, list) or not raw_segments:
+        raise ScriptOutlineError("Outline must contain at least one segment.")
+    segments = []
+    for raw in raw_segments:
+        if not isinstance(raw, dict):
+            raise ScriptOutlineError("Each outline segment must be a JSON object.")
+        points = raw.get("points") or []
+        if not isinstance(points, list):
+            raise ScriptOutlineError("Outline segment 'points' must be a list.")
+        segments.append(
+            OutlineSegment(
+                title=_text(raw.get("title"), "segments.title"),
+                points=tuple(str(point).strip() for point in points if str(point).strip()),
+            )
+        )
+    return ScriptOutline(
+        intro=_text(payload.get("intro"), "intro"),
+        segments=tuple(segments),
+        outro=_text(payload.get("outro"), "outro"),
+    )
+
+
+def part_word_budgets(
+    segment_count: int, target_minutes: int, wpm: float = DEFAULT_WPM
+) -> list[int]:
+    """Words per part (intro, segments, outro) so the joined script hits ``target_minutes``."""
+    total_words = target_minutes * wpm
+    bookend = round(total_words * _BOOKEND_SHARE)
+    segment_words = round(total_words * (1 - 2 * _BOOKEND_SHARE) / segment_count)
+    return [bookend, *([segment_words] * segment_count), bookend]
+
+
+def write_outlined_script(
+    source_text: str,
+    *,
+    bucket: str,
+    job_id: str,
+    model_id: str,
+    segment_count: int,
+    target_minutes: int = 8,
+    max_concurrency: int = 4,
+    title: str | None = None,
+    style: str = "podcast",
+    source_type: str | None = None,
+    script_mode: str = "single",
+    cache_prompt: bool = False,
+) -> str:
+    """Outline the episode with one call, then write its parts in parallel and join them.
+
+    Every part call shares the outline and source as its prompt prefix. A cache entry only
+    exists once a call that wrote it has finished, so with ``cache_prompt`` the first part is
+    written alone and the rest then fan out and read the source from the prompt cache. The
+    outline is stored at ``jobs/<job_id>/rewrite/outline.json``.
+    """
+    started = time.perf_counter()
+    source_fields = {
+        "title": title,
+        "style": style,
+        "source_type": source_type,
+        "script_mode": script_mode,
+    }
+    outline = parse_outline(
+        call_bedrock(
+            model_id,
+            build_outline_prompt(source_text, segment_count=segment_count, **source_fields),
+            max_tokens=_OUTLINE_MAX_TOKENS,
+            temperature=0.3,
+            # The outline prompt shares no prefix with the part prompts.
+            cache_prompt=False,
+        )
+    )
+    s3.put_json(bucket, outline_key(job_id), outline.to_dict())
+    outline_ms = int((time.perf_counter() - started) * 1000)
+
+    outline_text = outline.to_text()
+    briefs = outline.part_briefs()
+    budgets = part_word_budgets(len(outline.segments), target_minutes)
+    # Parts get the same headroom over their share as the whole script gets over its target.
+    _, upper_minutes = script_minutes_range(target_minutes)
+    stretch = upper_minutes / target_minutes
+
+    def write_part(index: int) -> str:
+        prompt = build_script_part_prompt(
+            source_text,
+            outline_text,
+            part_index=index,
+            part_count=len(briefs),
+            part_brief=briefs[index],
+            words=budgets[index],
+            **source_fields,
+        )
+        return call_bedrock(
+            model_id,
+            prompt,
+            max_tokens=min(
+                max_tokens_for_words(budgets[index] * stretch), output_token_limit(model_id)
+            ),
+            cache_prompt=cache_prompt,
+        ).strip()
+
+    # Parallel calls started before the prefix is cached would each pay to write it.
+    first_parts = [write_part(0)] if cache_prompt else []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(briefs)))) as pool:
+        parts = first_parts + list(pool.map(write_part, range(len(first_parts), len(briefs))))
+    script_text = "\n\n".join(part for part in parts if part)
+
+    logger.info(
+        "Wrote outlined script",
+        extra={
+            "job_id": job_id,
+            "part_count": len(parts),
+            "outline_ms": outline_ms,
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+            "word_count": count_words(script_text),
+        },
+    )
+    return script_text
@@ -0,0 +1,336 @@
+"""Script generation steps shared by the rewrite and streaming rewrite-and-voice handlers."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+from podcast_anything.cache import CacheBackend, CacheError, build_cache, hash_key
+from podcast_anything.config import Settings
+from podcast_anything.event_schema import PipelineEvent
+from podcast_anything.llm import (
+    PODCAST_PROMPT_VERSION,
+    Prompt,
+    build_podcast_prompt,
+    estimate_tokens,
+)
+from podcast_anything.model_routing import (
+    ModelRoute,
+    log_route_latency,
+    script_max_tokens,
+    select_route,
+)
+from podcast_anything.s3 import put_json, put_text
+from podcast_anything.script_outline import (
+    OUTLINE_PROMPT_VERSION,
+    ScriptOutlineError,
+    write_outlined_script,
+)
+from podcast_anything.script_repair import repair_duo_script
+from podcast_anything.source_compression import CompressionStats, compress_source
+from podcast_anything.source_notes import condense_source
+
+logger = logging.getLogger(__name__)
+
+_SCRIPT_CACHE_PREFIX = "cache/scripts/"
+
+
+@dataclass(frozen=True)
+class ScriptInputs:
+    """The source a script is written from, and the route and budget chosen for it.
+
+    ``source_tokens`` is the estimate for ``source.txt`` as fetched, returned to the state
+    machine as ``article_token_count``; ``input_tokens`` is the estimate after compression.
+    """
+
+    article_text: str
+    source_tokens: int
+    input_tokens: int
+    compression: CompressionStats | None
+    route: ModelRoute
+    max_tokens: int
+
+
+def load_script_inputs(
+    pipeline_event: PipelineEvent, settings: Settings, article_text: str
+) -> ScriptInputs:
+    """Compress ``source.txt`` if configured, then route it and size the output budget."""
+    source_tokens = article_tokens(pipeline_event, article_text)
+    article_text, compression = compress_article(settings, article_text)
+    input_tokens = compression.output_tokens if compression else source_tokens
+    route = route_script_model(settings, input_tokens)
+    return ScriptInputs(
+        article_text=article_text,
+        source_tokens=source_tokens,
+        input_tokens=input_tokens,
+        compression=compression,
+        route=route,
+        max_tokens=script_max_tokens(settings.script_target_minutes, model_id=route.model_id),
+    )
+
+
+def log_generation(inputs: ScriptInputs, *, job_id: str, started: float, script_text: str) -> int:
+    """Log the routed script call that began at ``started``; return its ``generation_ms``."""
+    generation_ms = int((time.perf_counter() - started) * 1000)
+    log_route_latency(
+        inputs.route,
+        job_id=job_id,
+        input_tokens=inputs.input_tokens,
+        max_tokens=inputs.max_tokens,
+        elapsed_ms=generation_ms,
+        output_text=script_text,
+    )
+    return generation_ms
+
+
+def build_script_cache(settings: Settings, bucket: str) -> CacheBackend | None:
+    return build_cache(
+        settings.script_cache_backend,
+        bucket=bucket,
+        prefix=_SCRIPT_CACHE_PREFIX,
+        local_dir=settings.script_cache_dir,
+        max_age_sec=settings.script_cache_max_age_sec,
+        max_bytes=settings.script_cache_max_bytes,
+        sweep_interval_sec=settings.cache_sweep_interval_sec,
+    )
+
+
+def script_cache_key(
+    pipeline_event: PipelineEvent,
+    settings: Settings,
+    model_id: str,
+    article_text: str,
+    *,
+    input_tokens: int,
+    generation: str | None = None,
+) -> str:
+    """Hash everything that shapes the generated script: prompt version, model, and inputs.
+
+    The key also covers the settings that choose how the script is written: outline segment
+    count, and whether (and how) the source is condensed first. ``generation`` names the path
+    that actually wrote the script, so an outline fallback is stored under ``whole``; it
+    defaults to ``SCRIPT_GENERATION``.
+    """
+    outline = (generation or settings.script_generation) == "outline"
+    if uses_condensed_source(settings, input_tokens):
+        section_model_id = route_script_model(settings, settings.rewrite_section_tokens).model_id
+        source_path = f"condensed:{settings.rewrite_section_tokens}:{section_model_id}"
+    else:
+        source_path = "direct"
+    return hash_key(
+        OUTLINE_PROMPT_VERSION if outline else PODCAST_PROMPT_VERSION,
+        model_id,
+        str(settings.script_target_minutes),
+        str(settings.script_segment_count) if outline else "",
+        source_path,
+        pipeline_event.style,
+        pipeline_event.script_mode,
+        pipeline_event.source_type or "",
+        pipeline_event.title or "",
+        article_text,
+    )
+
+
+def get_cached_script(cache: CacheBackend | None, key: str, *, job_id: str) -> str | None:
+    """Return the cached script for ``key``; cache failures are logged and treated as misses."""
+    if cache is None:
+        return None
+    try:
+        data = cache.get(key)
+    except CacheError as exc:
+        logger.warning("Script cache read failed", extra={"job_id": job_id, "error": str(exc)})
+        return None
+    logger.info("Script cache lookup", extra={"job_id": job_id, "cache_hit": data is not None})
+    return None if data is None else data.decode("utf-8")
+
+
+def put_cached_script(
+    cache: CacheBackend | None, key: str, script_text: str, *, job_id: str
+) -> None:
+    """Store a freshly generated script and evict expired or excess entries."""
+    if cache is None:
+        return
+    try:
+        cache.put(key, script_text.encode("utf-8"))
+        evicted = cache.evict()
+    except CacheError as exc:
+        logger.warning("Script cache write failed", extra={"job_id": job_id, "error": str(exc)})
+        return
+    logger.info("Evicted script cache entries", extra={"job_id": job_id, "evicted_count": evicted})
+
+
+def article_tokens(pipeline_event: PipelineEvent, article_text: str) -> int:
+    """Estimated tokens of ``source.txt``, from the fetch step's event field when present."""
+    if pipeline_event.article_token_count is not None:
+        return pipeline_event.article_token_count
+    return estimate_tokens(article_text)
+
+
+def compress_article(
+    settings: Settings, article_text: str
+) -> tuple[str, CompressionStats | None]:
+    """Cut the source to ``SOURCE_COMPRESSION_TOKENS`` by extractive compression, if set."""
+    if settings.source_compression_tokens is None:
+        return article_text, None
+    return compress_source(article_text, settings.source_compression_tokens)
+
+
+def route_script_model(settings: Settings, input_tokens: int) -> ModelRoute:
+    """Pick the script model for a source of ``input_tokens`` from ``BEDROCK_MODEL_ROUTES``."""
+    return select_route(settings.bedrock_model_routes, settings.bedrock_model_id, input_tokens)
+
+
+def uses_condensed_source(settings: Settings, input_tokens: int) -> bool:
+    """Whether ``REWRITE_STRATEGY`` condenses a source of ``input_tokens`` before scripting.
+
+    ``map_reduce`` always condenses; ``auto`` condenses only sources larger than one
+    ``REWRITE_SECTION_TOKENS`` section.
+    """
+    strategy = settings.rewrite_strategy
+    return strategy == "map_reduce" or (
+        strategy == "auto" and input_tokens > settings.rewrite_section_tokens
+    )
+
+
+def prepare_source(
+    pipeline_event: PipelineEvent,
+    settings: Settings,
+    *,
+    bucket: str,
+    job_id: str,
+    article_text: str,
+    input_tokens: int | None = None,
+) -> str:
+    """Return the text the script is written from: the source itself or condensed notes.
+
+    See ``uses_condensed_source`` for when the source is condensed. ``input_tokens``
+    overrides the event's token count when ``article_text`` is not ``source.txt`` as fetched.
+    """
+    if input_tokens is None:
+        input_tokens = article_tokens(pipeline_event, article_text)
+    if not uses_condensed_source(settings, input_tokens):
+        return article_text
+    return condense_source(
+        article_text,
+        bucket=bucket,
+        job_id=job_id,
+        # Sections are short inputs, so they take the route for one section's size.
+        model_id=route_script_model(settings, settings.rewrite_section_tokens).model_id,
+        max_section_tokens=settings.rewrite_section_tokens,
+        max_concurrency=settings.rewrite_max_concurrency,
+        title=pipeline_event.title,
+        cache_prompt=settings.bedrock_prompt_cache,
+    )
+
+
+def write_outlined(
+    pipeline_event: PipelineEvent,
+    settings: Settings,
+    *,
+    bucket: str,
+    job_id: str,
+    source_text: str,
+    model_id: str,
+) -> str | None:
+    """Write the script outline-first when ``SCRIPT_GENERATION=outline``.
+
+    Returns ``None`` when outline mode is off or the outline cannot be parsed, in which case
+    the caller writes the script with a single call.
+    """
+    if settings.script_generation != "outline":
+        return None
+    try:
+        return write_outlined_script(
+            source_text,
+            bucket=bucket,
+            job_id=job_id,
+            model_id=model_id,
+            segment_count=settings.script_segment_count,
+            target_minutes=settings.script_target_minutes,
+            max_concurrency=settings.rewrite_max_concurrency,
+            title=pipeline_event.title,
+            style=pipeline_event.style,
+            source_type=pipeline_event.source_type,
+            script_mode=pipeline_event.script_mode,
+            cache_prompt=settings.bedrock_prompt_cache,
+        )
+    except ScriptOutlineError as exc:
+        logger.warning(
+            "Outline unusable; writing script in one call",
+            extra={"job_id": job_id, "error": str(exc)},
+        )
+        return None
+
+
+def repair_script(
+    pipeline_event: PipelineEvent, settings: Settings, script_text: str, *, job_id: str
+) -> str:
+    """Fix duo speaker labels and markdown before the script is stored.
+
+    Local repair handles the common label variants; the Bedrock fallback call takes the route
+    for the script's own size, which is usually the cheapest model.
+    """
+    if pipeline_event.script_mode != "duo":
+        return script_text
+    return repair_duo_script(
+        script_text,
+        model_id=route_script_model(settings, estimate_tokens(script_text)).model_id,
+        job_id=job_id,
+        cache_prompt=settings.bedrock_prompt_cache,
+    )
+
+
+def build_prompt(
+    pipeline_event: PipelineEvent, article_text: str, *, target_minutes: int = 8
+) -> Prompt:
+    return build_podcast_prompt(
+        article_text=article_text,
+        title=pipeline_event.title,
+        style=pipeline_event.style,
+        source_type=pipeline_event.source_type,
+        script_mode=pipeline_event.script_mode,
+        target_minutes=target_minutes,
+    )
+
+
+def store_script(
+    bucket: str,
+    job_id: str,
+    pipeline_event: PipelineEvent,
+    model_id: str,
+    script_text: str,
+    *,
+    cache_hit: bool = False,
+    compression: CompressionStats | None = None,
+    generation_ms: int | None = None,
+) -> tuple[str, str]:
+    """Write ``script.txt`` and ``script.json``; return their keys.
+
+    ``script.json`` records source compression stats and the script generation time, so the
+    effect of compression on Bedrock latency can be compared across jobs.
+    """
+    script_key = f"jobs/{job_id}/script.txt"
+    metadata_key = f"jobs/{job_id}/script.json"
+
+    put_text(bucket, script_key, script_text)
+    put_json(
+        bucket,
+        metadata_key,
+        {
+            "job_id": job_id,
+            "source_url": pipeline_event.source_url,
+            "source_type": pipeline_event.source_type,
+            "title": pipeline_event.title,
+            "style": pipeline_event.style,
+            "script_mode": pipeline_event.script_mode,
+            "model_id": model_id,
+            "script_s3_key": script_key,
+            "cache_hit": cache_hit,
+            "source_compression": compression.to_dict() if compression else None,
+            "generation_ms": generation_ms,
+        },
+    )
+
+    logger.info("Stored podcast script", extra={"job_id": job_id, "key": script_key})
+    return script_key, metadata_key
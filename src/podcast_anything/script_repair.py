@@ -0,0 +1,148 @@
+"""Local repair of duo scripts: canonical ``HOST_A:`` / ``HOST_B:`` labels, no markdown."""
+
+from __future__ import annotations
+
+import logging
+import re
+
+from podcast_anything.llm import LLMError, build_duo_repair_prompt, call_bedrock
+from podcast_anything.model_routing import max_tokens_for_words
+from podcast_anything.voice_pace import count_words
+
+logger = logging.getLogger(__name__)
+
+_CODE_FENCE_RE = re.compile(r"^\s*```")
+_HEADING_RE = re.compile(r"^\s*#{1,6}\s")
+_RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+# A whole line in brackets or parentheses, or in single-asterisk italics: "[music]", "*laughs*".
+_STAGE_DIRECTION_RE = re.compile(r"^\s*(\[[^\]]*\]|\([^)]*\)|\*[^*]+\*)\s*$")
+_LIST_MARKER_RE = re.compile(r"^\s*(?:[-+>]\s+|\*\s+|\d+[.)]\s+)")
+_EMPHASIS_RE = re.compile(r"\*\*|__|\*|`")
+# "HOST_A:", "Host A -", "host-b:", "Speaker 1:", "HOST ONE:".
+_HOST_LABEL_RE = re.compile(
+    r"^\s*(?:host|speaker)[\s_-]*(a|b|1|2|one|two)\s*[:–—-]\s*(.*)$", re.IGNORECASE
+)
+_HOST_IDS = {
+    "a": "HOST_A",
+    "1": "HOST_A",
+    "one": "HOST_A",
+    "b": "HOST_B",
+    "2": "HOST_B",
+    "two": "HOST_B",
+}
+# A speaker name of one to three capitalized words: "Maya:", "Dr. Lee:".
+_NAME_LABEL_RE = re.compile(r"^\s*([A-Z][\w'.-]*(?: [A-Z][\w'.-]*){0,2})\s*:\s*(.*)$")
+_NOT_SPEAKERS = {"intro", "outro", "note", "segment", "summary", "title", "music", "sfx"}
+
+
+class ScriptRepairError(RuntimeError):
+    """Raised when a duo script has no usable speaker labels even after repair."""
+
+
+class DuoLineNormalizer:
+    """Rewrite duo script lines one at a time into canonical ``HOST_A:`` / ``HOST_B:`` form.
+
+    Markdown, headings, and whole-line stage directions are removed. Speaker names are mapped
+    to hosts in order of appearance (first name is ``HOST_A``) until a host-style label shows
+    up, since a script that already uses host labels may contain other ``Word:`` lines.
+    Works on streamed lines as well as whole scripts.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[str, str] = {}
+        self._host_labels_seen = False
+        self.repaired_lines = 0
+
+    def normalize(self, line: str) -> str | None:
+        """Return the canonical line, or ``None`` when the line is not spoken text."""
+        stripped = line.strip()
+        if not stripped:
+            return ""
+        if (
+            _CODE_FENCE_RE.match(stripped)
+            or _HEADING_RE.match(stripped)
+            or _RULE_RE.match(stripped)
+            or _STAGE_DIRECTION_RE.match(stripped)
+        ):
+            self.repaired_lines += 1
+            return None
+        cleaned = _EMPHASIS_RE.sub("", _LIST_MARKER_RE.sub("", stripped)).strip()
+        normalized = self._relabel(cleaned)
+        if normalized != stripped:
+            self.repaired_lines += 1
+        return normalized
+
+    def _relabel(self, line: str) -> str:
+        match = _HOST_LABEL_RE.match(line)
+        if match:
+            self._host_labels_seen = True
+            return f"{_HOST_IDS[match.group(1).lower()]}: {match.group(2).strip()}".rstrip()
+        match = _NAME_LABEL_RE.match(line)
+        if match and not self._host_labels_seen:
+            name = match.group(1)
+            if name.lower() not in _NOT_SPEAKERS:
+                host = self._names.get(name)
+                if host is None and len(self._names) < 2:
+                    host = self._names[name] = "HOST_A" if not self._names else "HOST_B"
+                if host is not None:
+                    return f"{host}: {match.group(2).strip()}".rstrip()
+        return line
+
+
+def normalize_duo_script(script_text: str) -> tuple[str, int]:
+    """Return the locally repaired script and how many lines were changed or dropped."""
+    normalizer = DuoLineNormalizer()
+    lines = [normalizer.normalize(line) for line in script_text.splitlines()]
+    text = "\n".join(line for line in lines if line is not None).strip()
+    return text, normalizer.repaired_lines
+
+
+def duo_speakers(script_text: str) -> set[str]:
+    """Hosts that start at least one line of a canonical duo script."""
+    return {
+        line.split(":", 1)[0]
+        for line in script_text.splitlines()
+        if line.startswith(("HOST_A:", "HOST_B:"))
+    }
+
+
+def repair_duo_script(
+    script_text: str, *, model_id: str, job_id: str, cache_prompt: bool = False
+) -> str:
+    """Return ``script_text`` with canonical speaker labels and no markdown.
+
+    Local repair is tried first. Only when it does not yield lines for both hosts is one
+    Bedrock call made to relabel the script; whichever result labels more hosts is kept, and
+    ``ScriptRepairError`` is raised when neither has a labeled line.
+    """
+    repaired, repaired_lines = normalize_duo_script(script_text)
+    speakers = duo_speakers(repaired)
+    if len(speakers) == 2:
+        if repaired_lines:
+            logger.info(
+                "Repaired duo script locally",
+                extra={"job_id": job_id, "repaired_lines": repaired_lines},
+            )
+        return repaired
+
+    try:
+        relabeled, _ = normalize_duo_script(
+            call_bedrock(
+                model_id,
+                build_duo_repair_prompt(repaired or script_text),
+                max_tokens=max_tokens_for_words(count_words(script_text) * 1.2),
+                temperature=0.0,
+                cache_prompt=cache_prompt,
+            )
+        )
+    except LLMError as exc:
+        logger.warning(
+            "Duo script repair call failed", extra={"job_id": job_id, "error": str(exc)}
+        )
+        relabeled = ""
+    if len(duo_speakers(relabeled)) > len(speakers):
+        logger.info("Repaired duo script with Bedrock", extra={"job_id": job_id})
+        return relabeled
+    if speakers:
+        return repaired
+    raise ScriptRepairError("Duo script has no HOST_A: or HOST_B: lines after repair.")
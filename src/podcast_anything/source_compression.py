@@ -0,0 +1,244 @@
+"""Extractive compression of source text to a token budget before script generation."""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from podcast_anything.llm import estimate_tokens
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised via the pure-Python fallback
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[\"'(\[]?[A-Z0-9])")
+_TERM_RE = re.compile(r"\w+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i if in into is it "
+    "its me my not of on or our she so than that the their them then there these they this "
+    "to too us was we were what when which who will with would you your".split()
+)
+# Unpunctuated text (auto-generated transcripts) is cut into pieces of this many words.
+_MAX_SENTENCE_WORDS = 60
+_PIECE_WORDS = 40
+# Sentences at least this similar to one already kept are treated as repetition.
+_REDUNDANT_SIMILARITY = 0.8
+_DAMPING = 0.85
+_MAX_ITERATIONS = 50
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """What compression did to one source, recorded in ``script.json``."""
+
+    method: str
+    input_tokens: int
+    output_tokens: int
+    sentence_count: int
+    kept_sentence_count: int
+    elapsed_ms: int
+
+    @property
+    def ratio(self) -> float:
+        return round(self.output_tokens / max(self.input_tokens, 1), 3)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "ratio": self.ratio,
+            "sentence_count": self.sentence_count,
+            "kept_sentence_count": self.kept_sentence_count,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+
+def split_sentences(text: str) -> list[tuple[int, str]]:
+    """Return ``(paragraph_index, sentence)`` pairs in source order."""
+    sentences: list[tuple[int, str]] = []
+    for paragraph_index, paragraph in enumerate(_PARAGRAPH_RE.split(text.strip())):
+        for sentence in _SENTENCE_END_RE.split(" ".join(paragraph.split())):
+            words = sentence.split()
+            if len(words) <= _MAX_SENTENCE_WORDS:
+                if words:
+                    sentences.append((paragraph_index, sentence))
+                continue
+            for start in range(0, len(words), _PIECE_WORDS):
+                sentences.append((paragraph_index, " ".join(words[start : start + _PIECE_WORDS])))
+    return sentences
+
+
+def _terms(sentence: str) -> list[str]:
+    return [
+        term
+        for term in _TERM_RE.findall(sentence.lower())
+        if len(term) > 2 and term not in _STOP_WORDS
+    ]
+
+
+def _tfidf_vectors(sentences: list[str]) -> list[dict[str, float]]:
+    """L2-normalized TF-IDF vectors, treating each sentence as a document."""
+    term_counts = [Counter(_terms(sentence)) for sentence in sentences]
+    document_frequency = Counter(term for counts in term_counts for term in counts)
+    count = len(sentences)
+    vectors = []
+    for counts in term_counts:
+        weights = {
+            term: (1 + math.log(tf)) * math.log((1 + count) / (1 + document_frequency[term]))
+            for term, tf in counts.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in weights.items()})
+    return vectors
+
+
+def _cosine(left: dict[str, float], right: dict[str, float]) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(weight * right.get(term, 0.0) for term, weight in left.items())
+
+
+# Scores per sentence, and the highest similarity of one sentence to a list of others.
+_Scored = tuple[list[float], Callable[[int, list[int]], float]]
+
+
+def _textrank(vectors: list[dict[str, float]]) -> _Scored:
+    """TextRank over the sentence cosine-similarity graph, computed with NumPy.
+
+    The similarity matrix ``S = M @ M.T`` of the sparse TF-IDF matrix ``M`` is never built:
+    each power iteration applies it as two scatter-adds over the non-zero weights, so memory
+    and time grow with the number of terms in the source rather than with sentences squared.
+    """
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    columns: list[int] = []
+    weights: list[float] = []
+    for row, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            rows.append(row)
+            columns.append(vocabulary.setdefault(term, len(vocabulary)))
+            weights.append(weight)
+    row_ids = np.asarray(rows, dtype=np.int64)
+    column_ids = np.asarray(columns, dtype=np.int64)
+    values = np.asarray(weights, dtype=np.float64)
+    count = len(vectors)
+    self_similarity = np.bincount(row_ids, weights=values * values, minlength=count)
+
+    def similarity_times(vector: Any) -> Any:
+        """``S @ vector`` with the diagonal (each sentence's similarity to itself) removed."""
+        term_totals = np.bincount(
+            column_ids, weights=values * vector[row_ids], minlength=len(vocabulary)
+        )
+        product = np.bincount(row_ids, weights=values * term_totals[column_ids], minlength=count)
+        return product - self_similarity * vector
+
+    row_sums = similarity_times(np.ones(count))
+    has_edges = row_sums > 1e-12
+    scores = np.full(count, 1.0 / count)
+    for _ in range(_MAX_ITERATIONS):
+        # S is symmetric, so transition.T @ scores == S @ (scores / row_sums).
+        spread = np.divide(scores, row_sums, out=np.zeros(count), where=has_edges)
+        updated = (1 - _DAMPING) / count + _DAMPING * similarity_times(spread)
+        converged = float(np.abs(updated - scores).sum()) < 1e-6
+        scores = updated
+        if converged:
+            break
+
+    closest = np.zeros(count)
+    folded = 0
+
+    def max_similarity(index: int, others: list[int]) -> float:
+        # ``others`` only grows between calls (it is the kept list), so each newly kept
+        # sentence's similarity column is folded into a running maximum once.
+        nonlocal closest, folded
+        for other in others[folded:]:
+            term_weights = np.zeros(len(vocabulary))
+            start, stop = np.searchsorted(row_ids, [other, other + 1])
+            term_weights[column_ids[start:stop]] = values[start:stop]
+            column = np.bincount(
+                row_ids, weights=values * term_weights[column_ids], minlength=count
+            )
+            closest = np.maximum(closest, column)
+        folded = len(others)
+        return float(closest[index]) if others else 0.0
+
+    return scores.tolist(), max_similarity
+
+
+def _centroid_scores(vectors: list[dict[str, float]]) -> _Scored:
+    """Similarity of each sentence to the document's TF-IDF centroid (no NumPy needed)."""
+    centroid: Counter[str] = Counter()
+    for vector in vectors:
+        centroid.update(vector)
+
+    def max_similarity(index: int, others: list[int]) -> float:
+        return max((_cosine(vectors[index], vectors[other]) for other in others), default=0.0)
+
+    return [_cosine(vector, centroid) for vector in vectors], max_similarity
+
+
+def compress_source(text: str, max_tokens: int) -> tuple[str, CompressionStats]:
+    """Keep the highest-scoring sentences of ``text`` that fit ``max_tokens``, in source order.
+
+    Sentences are scored with TextRank over TF-IDF cosine similarity when NumPy is installed,
+    otherwise by similarity to the TF-IDF centroid. Sentences nearly identical to one already
+    kept are skipped. Text already within the budget is returned unchanged.
+    """
+    started = time.perf_counter()
+    input_tokens = estimate_tokens(text)
+    sentences = split_sentences(text)
+    if input_tokens <= max_tokens or len(sentences) < 2:
+        stats = CompressionStats(
+            method="none",
+            input_tokens=input_tokens,
+            output_tokens=input_tokens,
+            sentence_count=len(sentences),
+            kept_sentence_count=len(sentences),
+            elapsed_ms=int((time.perf_counter() - started) * 1000),
+        )
+        return text, stats
+
+    vectors = _tfidf_vectors([sentence for _, sentence in sentences])
+    if np is not None:
+        method = "textrank"
+        scores, max_similarity = _textrank(vectors)
+    else:
+        method = "centroid"
+        scores, max_similarity = _centroid_scores(vectors)
+
+    kept: list[int] = []
+    remaining = max_tokens
+    for index in sorted(range(len(sentences)), key=lambda item: (-scores[item], item)):
+        sentence_tokens = estimate_tokens(sentences[index][1])
+        if sentence_tokens > remaining:
+            continue
+        if max_similarity(index, kept) >= _REDUNDANT_SIMILARITY:
+            continue
+        kept.append(index)
+        remaining -= sentence_tokens
+
+    paragraphs: dict[int, list[str]] = {}
+    for index in sorted(kept):
+        paragraph_index, sentence = sentences[index]
+        paragraphs.setdefault(paragraph_index, []).append(sentence)
+    compressed = "\n\n".join(" ".join(paragraph) for paragraph in paragraphs.values())
+    stats = CompressionStats(
+        method=method,
+        input_tokens=input_tokens,
+        output_tokens=estimate_tokens(compressed),
+        sentence_count=len(sentences),
+        kept_sentence_count=len(kept),
+        elapsed_ms=int((time.perf_counter() - started) * 1000),
+    )
+    logger.info("Compressed source text", extra=stats.to_dict())
+    return compressed, stats
@@ -0,0 +1,98 @@
+"""Map-reduce condensation of long sources into section notes for script generation."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from podcast_anything import s3
+from podcast_anything.cache import hash_key
+from podcast_anything.llm import build_notes_prompt, call_bedrock, estimate_tokens
+from podcast_anything.tts import split_text_for_tts
+
+logger = logging.getLogger(__name__)
+
+# Bump when the notes prompt changes so stored notes are not reused across versions.
+NOTES_PROMPT_VERSION = "notes-v2"
+_NOTES_MAX_TOKENS = 900
+
+
+def notes_prefix(job_id: str) -> str:
+    return f"jobs/{job_id}/rewrite/notes/"
+
+
+def split_source_sections(text: str, max_section_tokens: int) -> list[str]:
+    """Split ``text`` into balanced sections of at most ``max_section_tokens`` estimated tokens.
+
+    Sections break at paragraph and sentence boundaries where possible.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return []
+    tokens = estimate_tokens(stripped)
+    if tokens <= max_section_tokens:
+        return [stripped]
+    # The splitter's floor of 100 characters is far below any practical token budget.
+    max_chars = max(100, int(max_section_tokens * len(stripped) / tokens))
+    return split_text_for_tts(stripped, max_text_chars=max_chars)
+
+
+def condense_source(
+    text: str,
+    *,
+    bucket: str,
+    job_id: str,
+    model_id: str,
+    max_section_tokens: int,
+    max_concurrency: int = 4,
+    title: str | None = None,
+    cache_prompt: bool = False,
+) -> str:
+    """Condense ``text`` section by section with parallel Bedrock calls; return joined notes.
+
+    Each section's notes are stored under ``jobs/<job_id>/rewrite/notes/`` keyed by a hash of
+    the prompt version, model, and section text, so a retried job only condenses sections
+    that have no notes yet.
+    """
+    sections = split_source_sections(text, max_section_tokens)
+    started = time.perf_counter()
+
+    def condense(index: int) -> tuple[str, bool]:
+        section = sections[index]
+        key = f"{notes_prefix(job_id)}{hash_key(NOTES_PROMPT_VERSION, model_id, section)}.txt"
+        found = s3.get_bytes_if_exists(bucket, key)
+        if found is not None:
+            return found[0].decode("utf-8"), True
+        prompt = build_notes_prompt(
+            section, section_index=index, section_count=len(sections), title=title
+        )
+        notes = call_bedrock(
+            model_id,
+            prompt,
+            max_tokens=_NOTES_MAX_TOKENS,
+            temperature=0.2,
+            cache_prompt=cache_prompt,
+        )
+        s3.put_text(bucket, key, notes)
+        return notes, False
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(sections)))) as pool:
+        results = list(pool.map(condense, range(len(sections))))
+    section_notes = [notes for notes, _ in results]
+    reused = sum(1 for _, was_reused in results if was_reused)
+
+    logger.info(
+        "Condensed source into section notes",
+        extra={
+            "job_id": job_id,
+            "section_count": len(sections),
+            "reused_count": reused,
+            "source_tokens": estimate_tokens(text),
+            "notes_tokens": sum(estimate_tokens(notes) for notes in section_notes),
+            "elapsed_ms": int((time.perf_counter() - started) * 1000),
+        },
+    )
+    return "\n\n".join(
+        f"Section {index + 1} notes:\n{notes.strip()}" for index, notes in enumerate(section_notes)
+    )
@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import bisect
 import html
 import logging
+import math
 import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 
 import boto3
 import requests
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from requests.adapters import HTTPAdapter
+
+from podcast_anything.cache import CacheBackend, CacheError, hash_key
+from podcast_anything.mp3 import stitch_mp3
+from podcast_anything.rate_limit import ProviderLimiter, ThrottledError, TransientError
 
 
 class TTSError(RuntimeError):
@@ -17,6 +31,126 @@ class TTSError(RuntimeError):
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_POLLY_ENGINE = "generative"
+_ELEVENLABS_BASE_URL = "https://api.elevenlabs.io"
+_elevenlabs_session_lock = threading.Lock()
+_elevenlabs_shared_session: requests.Session | None = None
+_elevenlabs_pool_size = 0
+
+
+def _map_in_order(
+    items: Iterable[_T],
+    func: Callable[[int, _T], _R],
+    max_concurrency: int = 1,
+) -> Iterator[_R]:
+    """Apply ``func(index, item)`` on a bounded thread pool and yield results in input order.
+
+    At most ``max_concurrency`` calls run at once, and at most ``2 * max_concurrency``
+    results are held before the caller consumes them. ``items`` may be a lazy iterator;
+    it is only advanced when a slot in the window frees up.
+    """
+    if max_concurrency < 1:
+        raise TTSError("max_concurrency must be at least 1.")
+    known_count = len(items) if isinstance(items, Sequence) else None
+    if max_concurrency == 1 or (known_count is not None and known_count <= 1):
+        for index, item in enumerate(items):
+            yield func(index, item)
+        return
+
+    window = max_concurrency * 2
+    workers = max_concurrency if known_count is None else min(max_concurrency, known_count)
+    source = enumerate(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[_R]] = deque()
+
+        def submit_next() -> bool:
+            entry = next(source, None)
+            if entry is None:
+                return False
+            pending.append(executor.submit(func, *entry))
+            return True
+
+        try:
+            while len(pending) < window and submit_next():
+                pass
+            while pending:
+                result = pending.popleft().result()
+                submit_next()
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+# Preferred chunk boundaries, best first: line breaks, sentence ends, clauses, commas.
+# Plain spaces are only a fallback, looked up with str.rfind/find inside the window.
+# The pattern has no named groups; the kind is read from the first matched character.
+_BOUNDARY_RE = re.compile(r"\n|[.!?][\"')\]]*(?=\s)|[;:,](?=\s)")
+_BOUNDARY_PENALTY = {"\n": 0.0, ".": 0.05, "!": 0.05, "?": 0.05, ";": 0.3, ":": 0.3, ",": 0.4}
+_MIN_CHUNK_FRACTION = 0.5
+_OVERSHOOT_WEIGHT = 0.5
+
+
+def _boundary_candidates(text: str) -> tuple[list[int], list[float]]:
+    """Return chunk end offsets and their rank penalties from one scan of ``text``."""
+    positions: list[int] = []
+    penalties: list[float] = []
+    for match in _BOUNDARY_RE.finditer(text):
+        first = text[match.start()]
+        positions.append(match.start() if first == "\n" else match.end())
+        penalties.append(_BOUNDARY_PENALTY[first])
+    return positions, penalties
+
+
+def _earliest_cuts(text: str, positions: list[int], max_text_chars: int) -> list[int]:
+    """Return ``cuts`` where ``cuts[m]`` is the earliest split after which ``m`` chunks suffice.
+
+    Built by a greedy pass from the end of ``text`` that takes the earliest boundary or space
+    (or a hard cut when there is none) within ``max_text_chars`` of the previous cut, so
+    ``len(cuts)`` is the fewest chunks ``text`` splits into at whitespace.
+    """
+    cuts = [len(text)]
+    while cuts[-1] > max_text_chars:
+        end = cuts[-1]
+        low = end - max_text_chars
+        # Boundaries and spaces sit on whitespace that the next chunk skips, so a cut
+        # anywhere in the whitespace run just before ``low`` still leaves a short enough chunk.
+        search_from = low
+        while search_from > 0 and text[search_from - 1].isspace():
+            search_from -= 1
+        cut = end
+        index = bisect.bisect_left(positions, search_from)
+        if index < len(positions) and positions[index] < end:
+            cut = positions[index]
+        space = text.find(" ", search_from, cut)
+        if space >= 0:
+            cut = space
+        cuts.append(cut if cut < end else low)
+    return cuts
+
+
+def _greedy_chunks(text: str, positions: list[int], max_text_chars: int) -> list[str]:
+    """Fill each chunk up to the last boundary or space that fits, else cut at the limit."""
+    chunks: list[str] = []
+    start = 0
+    while start < len(text):
+        limit = start + max_text_chars
+        if limit >= len(text):
+            chunks.append(text[start:].strip())
+            break
+        index = bisect.bisect_right(positions, limit) - 1
+        split_at = max(text.rfind(" ", start, limit + 1), positions[index] if index >= 0 else -1)
+        if split_at <= start:
+            split_at = limit
+        chunks.append(text[start:split_at].strip())
+        start = split_at
+        while start < len(text) and text[start].isspace():
+            start += 1
+    return chunks
+
 
 def _split_text_for_tts(text: str, max_text_chars: int) -> list[str]:
     cleaned = text.strip()
@@ -25,36 +159,114 @@ def _split_text_for_tts(text: str, max_text_chars: int) -> list[str]:
     if max_text_chars < 100:
         raise TTSError("max_text_chars must be at least 100.")
 
-    chunks: list[str] = []
-    remaining = cleaned
+    total = len(cleaned)
+    if total <= max_text_chars:
+        return [cleaned]
 
-    while remaining:
-        if len(remaining) <= max_text_chars:
-            chunks.append(remaining)
+    positions, penalties = _boundary_candidates(cleaned)
+    # Every chunk is one more provider request, so the count is fixed at the minimum and
+    # each split only moves within the range that keeps the rest within that count.
+    earliest = _earliest_cuts(cleaned, positions, max_text_chars)
+    chunk_count = len(earliest)
+    chunks: list[str] = []
+    start = 0
+    while start < total:
+        remaining = total - start
+        if remaining <= max_text_chars:
+            chunks.append(cleaned[start:].strip())
             break
 
-        window = remaining[:max_text_chars]
-        split_at = max(
-            window.rfind("\n"),
-            window.rfind(". "),
-            window.rfind("! "),
-            window.rfind("? "),
-            window.rfind("; "),
-            window.rfind(", "),
-            window.rfind(" "),
+        # Aim every remaining chunk at the same size so the last one is not a short tail.
+        chunks_left = min(max(chunk_count - len(chunks), 2), chunk_count)
+        target = remaining / chunks_left
+        ideal = start + target
+        limit = start + max_text_chars
+        window_start = min(
+            max(earliest[chunks_left - 1], int(start + target * _MIN_CHUNK_FRACTION)), limit
         )
-        if split_at < int(max_text_chars * 0.6):
-            split_at = max_text_chars
 
-        chunk = remaining[:split_at].strip()
-        if not chunk:
-            split_at = max_text_chars
-            chunk = remaining[:split_at].strip()
+        def cost(position: int, penalty: float) -> float:
+            # Falling short of the target pushes text onto later chunks, so it costs more
+            # than overshooting (which max_text_chars already bounds).
+            distance = ideal - position
+            return penalty + (distance if distance > 0 else -distance * _OVERSHOOT_WEIGHT) / target
+
+        split_at = -1
+        best_cost = 0.0
+        for index in range(
+            bisect.bisect_left(positions, window_start),
+            bisect.bisect_right(positions, limit),
+        ):
+            candidate_cost = cost(positions[index], penalties[index])
+            if split_at < 0 or candidate_cost < best_cost:
+                split_at, best_cost = positions[index], candidate_cost
+
+        if split_at < 0:
+            pivot = min(limit, max(window_start, math.ceil(ideal)))
+            spaces = [
+                position
+                for position in (
+                    cleaned.rfind(" ", window_start, pivot + 1),
+                    cleaned.find(" ", pivot, limit + 1),
+                )
+                if position > start
+            ]
+            split_at = min(spaces, key=lambda position: cost(position, 0.0)) if spaces else pivot
+
+        chunk = cleaned[start:split_at].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = split_at
+        while start < total and cleaned[start].isspace():
+            start += 1
+
+    # Whitespace is rare in some texts, where hard cuts at the limit can need fewer chunks
+    # than the bound above allows; the balanced split never costs an extra request.
+    greedy = _greedy_chunks(cleaned, positions, max_text_chars)
+    return greedy if len(greedy) < len(chunks) else chunks
+
+
+def split_text_for_tts(text: str, max_text_chars: int = 2500) -> list[str]:
+    """Split text into provider-sized chunks, for callers that plan synthesis work up front."""
+    return _split_text_for_tts(text, max_text_chars=max_text_chars)
+
+
+def _resolve_output_format(provider: str, output_format: str) -> str:
+    if provider == "elevenlabs" and output_format == "mp3":
+        return "mp3_44100_128"
+    return output_format
+
+
+def chunk_cache_key(
+    text: str,
+    voice_id: str,
+    *,
+    provider: str = "polly",
+    output_format: str = "mp3",
+    text_type: str = "text",
+    elevenlabs_model_id: str = "eleven_multilingual_v2",
+) -> str:
+    """Content hash identifying one chunk's audio across caches and checkpoints."""
+    normalized_provider = provider.strip().lower()
+    engine_or_model = _POLLY_ENGINE if normalized_provider == "polly" else elevenlabs_model_id
+    return hash_key(
+        normalized_provider,
+        voice_id,
+        engine_or_model,
+        _resolve_output_format(normalized_provider, output_format),
+        text_type,
+        text,
+    )
+
 
-        chunks.append(chunk)
-        remaining = remaining[split_at:].lstrip()
+_POLLY_THROTTLE_CODES = {"ThrottlingException", "TooManyRequestsException"}
 
-    return chunks
+
+def _retry_after_sec(response: requests.Response) -> float | None:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
 
 
 def _chunk_to_ssml(text_chunk: str) -> str:
@@ -67,112 +279,282 @@ def _chunk_to_ssml(text_chunk: str) -> str:
     return f'<speak><prosody rate="95%">{escaped}</prosody></speak>'
 
 
-def _synthesize_with_polly(
-    text: str,
-    voice_id: str,
-    output_format: str = "mp3",
-    max_text_chars: int = 2500,
-    text_type: str = "text",
-) -> bytes:
-    if text_type not in {"text", "ssml"}:
-        raise TTSError("text_type must be either 'text' or 'ssml'.")
+def _plan_segment_chunks(
+    segments: Iterable[tuple[str, str]], max_text_chars: int
+) -> Sequence[tuple[int, str, str]] | Iterator[tuple[int, str, str]]:
+    """Split ``(voice_id, text)`` segments into ``(segment_index, voice_id, chunk)`` tasks.
+
+    A sequence of segments is planned up front; an iterator (for example a script still
+    being generated) is planned lazily, one segment at a time.
+    """
+    tasks = (
+        (segment_index, voice_id, chunk)
+        for segment_index, (voice_id, text) in enumerate(segments)
+        for chunk in _split_text_for_tts(text, max_text_chars=max_text_chars)
+    )
+    return list(tasks) if isinstance(segments, Sequence) else tasks
+
+
+def _describe_segments(
+    segments: Iterable[tuple[str, str]], tasks: Iterable[tuple[int, str, str]]
+) -> dict[str, object]:
+    if not isinstance(segments, Sequence) or not isinstance(tasks, Sequence):
+        return {"streaming": True}
+    return {
+        "chunk_count": len(tasks),
+        "segment_count": len(segments),
+        "voice_ids": sorted({voice_id for voice_id, _ in segments}),
+    }
 
-    chunks = _split_text_for_tts(text, max_text_chars=max_text_chars)
-    client = boto3.client("polly")
-    audio_parts: list[bytes] = []
+
+def _iter_chunk_audio(
+    tasks: Iterable[tuple[int, str, str]],
+    request_chunk: Callable[[int, str, str], bytes],
+    *,
+    provider_label: str,
+    cache: CacheBackend | None,
+    cache_key: Callable[[str, str], str],
+    max_concurrency: int,
+    rate_limiter: ProviderLimiter | None,
+) -> Iterator[tuple[int, bytes]]:
+    """Synthesize chunk tasks through the cache and worker pool.
+
+    Yields ``(segment_index, audio)`` in task order.
+    """
+    task_count = len(tasks) if isinstance(tasks, Sequence) else None
+    if max_concurrency < 1:
+        raise TTSError("max_concurrency must be at least 1.")
     total_start = time.perf_counter()
+    limiter = rate_limiter or ProviderLimiter(max_concurrency=max_concurrency)
+    limiter_start = limiter.stats()
+    stats_lock = threading.Lock()
+    cache_stats = {"hits": 0, "misses": 0}
 
-    logger.info(
-        "Starting Polly synthesis",
-        extra={
-            "chunk_count": len(chunks),
-            "voice_id": voice_id,
-            "text_type": text_type,
-            "output_format": output_format,
-        },
-    )
+    def read_cache(key: str) -> bytes | None:
+        try:
+            return cache.get(key) if cache else None
+        except CacheError as exc:
+            logger.warning("TTS cache read failed", extra={"error": str(exc)})
+            return None
 
-    for index, chunk in enumerate(chunks):
-        request_text = _chunk_to_ssml(chunk) if text_type == "ssml" else chunk
+    def write_cache(key: str, audio: bytes) -> None:
+        try:
+            if cache:
+                cache.put(key, audio)
+        except CacheError as exc:
+            logger.warning("TTS cache write failed", extra={"error": str(exc)})
+
+    def synthesize_chunk(index: int, task: tuple[int, str, str]) -> tuple[int, bytes]:
+        segment_index, voice_id, chunk = task
         chunk_start = time.perf_counter()
-        response = client.synthesize_speech(
-            Text=request_text,
-            TextType=text_type,
-            VoiceId=voice_id,
-            OutputFormat=output_format,
-            Engine="generative",
-        )
-        stream = response.get("AudioStream")
-        if not stream:
-            raise TTSError(f"Polly response missing AudioStream for chunk {index}.")
-        chunk_audio = stream.read()
-        audio_parts.append(chunk_audio)
+        key = cache_key(voice_id, chunk) if cache else None
+        chunk_audio = read_cache(key) if key else None
+        cache_hit = chunk_audio is not None
+        if chunk_audio is None:
+            try:
+                chunk_audio = limiter.call(
+                    lambda: request_chunk(index, voice_id, chunk), chars=len(chunk)
+                )
+            except ThrottledError as exc:
+                raise TTSError(
+                    f"{provider_label} throttled chunk {index} after "
+                    f"{limiter.max_attempts} attempts: {exc}"
+                ) from exc
+            except TransientError as exc:
+                raise TTSError(
+                    f"{provider_label} failed chunk {index} after "
+                    f"{limiter.max_attempts} attempts: {exc}"
+                ) from exc
+            if key:
+                write_cache(key, chunk_audio)
+        if cache:
+            with stats_lock:
+                cache_stats["hits" if cache_hit else "misses"] += 1
         chunk_elapsed_ms = int((time.perf_counter() - chunk_start) * 1000)
         logger.info(
-            "Polly chunk synthesized",
+            f"{provider_label} chunk synthesized",
             extra={
                 "chunk_index": index,
-                "chunk_count": len(chunks),
+                "chunk_count": task_count,
+                "segment_index": segment_index,
                 "input_chars": len(chunk),
                 "audio_bytes": len(chunk_audio),
                 "elapsed_ms": chunk_elapsed_ms,
+                "cache_hit": cache_hit,
             },
         )
-
-    combined_audio = b"".join(audio_parts)
+        return segment_index, chunk_audio
+
+    total_audio_bytes = 0
+    chunk_count = 0
+    for segment_index, chunk_audio in _map_in_order(tasks, synthesize_chunk, max_concurrency):
+        total_audio_bytes += len(chunk_audio)
+        chunk_count += 1
+        yield segment_index, chunk_audio
     total_elapsed_ms = int((time.perf_counter() - total_start) * 1000)
+    limiter_end = limiter.stats()
     logger.info(
-        "Completed Polly synthesis",
+        f"Completed {provider_label} synthesis",
         extra={
-            "chunk_count": len(chunks),
-            "total_audio_bytes": len(combined_audio),
+            "chunk_count": chunk_count,
+            "total_audio_bytes": total_audio_bytes,
             "elapsed_ms": total_elapsed_ms,
+            "cache_hits": cache_stats["hits"],
+            "cache_misses": cache_stats["misses"],
+            "throttle_count": int(limiter_end["throttle_count"] - limiter_start["throttle_count"]),
+            "transient_error_count": int(
+                limiter_end["transient_error_count"] - limiter_start["transient_error_count"]
+            ),
+            "throttled_ms": int(
+                (limiter_end["throttled_sec"] - limiter_start["throttled_sec"]) * 1000
+            ),
+            "rate_wait_ms": int(
+                (limiter_end["rate_wait_sec"] - limiter_start["rate_wait_sec"]) * 1000
+            ),
+            "concurrency_limit": limiter.concurrency.limit,
         },
     )
-    return combined_audio
 
 
-def _synthesize_with_elevenlabs(
-    text: str,
+def _iter_polly_chunks(
+    segments: Iterable[tuple[str, str]],
+    output_format: str = "mp3",
+    max_text_chars: int = 2500,
+    text_type: str = "text",
+    max_concurrency: int = 1,
+    cache: CacheBackend | None = None,
+    rate_limiter: ProviderLimiter | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    if text_type not in {"text", "ssml"}:
+        raise TTSError("text_type must be either 'text' or 'ssml'.")
+
+    tasks = _plan_segment_chunks(segments, max_text_chars)
+    # boto3 clients are thread-safe; size the connection pool for the worker count. Retries
+    # are left to the rate limiter so its adaptive concurrency sees every throttle; 5xx
+    # responses and connection errors are retried there too, as TransientError.
+    client = boto3.client(
+        "polly",
+        config=Config(
+            max_pool_connections=max(10, max_concurrency),
+            retries={"mode": "standard", "total_max_attempts": 1},
+        ),
+    )
+
+    logger.info(
+        "Starting Polly synthesis",
+        extra={
+            **_describe_segments(segments, tasks),
+            "text_type": text_type,
+            "output_format": output_format,
+            "max_concurrency": max_concurrency,
+            "cache_enabled": cache is not None,
+        },
+    )
+
+    def request_chunk(index: int, voice_id: str, chunk: str) -> bytes:
+        request_text = _chunk_to_ssml(chunk) if text_type == "ssml" else chunk
+        try:
+            response = client.synthesize_speech(
+                Text=request_text,
+                TextType=text_type,
+                VoiceId=voice_id,
+                OutputFormat=output_format,
+                Engine=_POLLY_ENGINE,
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in _POLLY_THROTTLE_CODES:
+                raise ThrottledError(f"Polly throttled chunk {index}: {exc}") from exc
+            if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500:
+                raise TransientError(f"Polly failed chunk {index}: {exc}") from exc
+            raise
+        except (BotocoreConnectionError, HTTPClientError) as exc:
+            raise TransientError(f"Polly connection failed for chunk {index}: {exc}") from exc
+        stream = response.get("AudioStream")
+        if not stream:
+            raise TTSError(f"Polly response missing AudioStream for chunk {index}.")
+        return stream.read()
+
+    return _iter_chunk_audio(
+        tasks,
+        request_chunk,
+        provider_label="Polly",
+        cache=cache,
+        cache_key=lambda voice_id, chunk: chunk_cache_key(
+            chunk,
+            voice_id,
+            provider="polly",
+            output_format=output_format,
+            text_type=text_type,
+        ),
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
+    )
+
+
+def _elevenlabs_session(pool_size: int) -> requests.Session:
+    """Return the shared keep-alive ElevenLabs session, sized for ``pool_size`` workers.
+
+    The session lives at module scope so warm Lambda invocations reuse open TLS connections.
+    """
+    global _elevenlabs_shared_session, _elevenlabs_pool_size
+    with _elevenlabs_session_lock:
+        if _elevenlabs_shared_session is None:
+            _elevenlabs_shared_session = requests.Session()
+            _elevenlabs_pool_size = 0
+        if pool_size > _elevenlabs_pool_size:
+            previous = _elevenlabs_shared_session.adapters.get(_ELEVENLABS_BASE_URL)
+            _elevenlabs_shared_session.mount(
+                _ELEVENLABS_BASE_URL,
+                HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True),
+            )
+            if previous is not None:
+                # Idle sockets of the smaller pool close now; in-flight ones when released.
+                previous.close()
+            _elevenlabs_pool_size = pool_size
+        return _elevenlabs_shared_session
+
+
+def _iter_elevenlabs_chunks(
+    segments: Iterable[tuple[str, str]],
     *,
-    voice_id: str,
     elevenlabs_api_key: str | None,
     elevenlabs_model_id: str,
     output_format: str = "mp3_44100_128",
     max_text_chars: int = 2500,
     text_type: str = "text",
-) -> bytes:
+    max_concurrency: int = 1,
+    cache: CacheBackend | None = None,
+    rate_limiter: ProviderLimiter | None = None,
+) -> Iterator[tuple[int, bytes]]:
     if text_type != "text":
         raise TTSError("ElevenLabs synthesis supports only text input in this pipeline.")
     if not elevenlabs_api_key:
         raise TTSError("ElevenLabs API key is required for elevenlabs provider.")
 
-    chunks = _split_text_for_tts(text, max_text_chars=max_text_chars)
-    audio_parts: list[bytes] = []
-    total_start = time.perf_counter()
+    tasks = _plan_segment_chunks(segments, max_text_chars)
+    session = _elevenlabs_session(max_concurrency)
 
     logger.info(
         "Starting ElevenLabs synthesis",
         extra={
-            "chunk_count": len(chunks),
-            "voice_id": voice_id,
+            **_describe_segments(segments, tasks),
             "model_id": elevenlabs_model_id,
             "output_format": output_format,
+            "max_concurrency": max_concurrency,
+            "cache_enabled": cache is not None,
         },
     )
 
-    endpoint = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
     headers = {
         "xi-api-key": elevenlabs_api_key,
         "Content-Type": "application/json",
         "Accept": "audio/mpeg",
     }
 
-    for index, chunk in enumerate(chunks):
-        chunk_start = time.perf_counter()
+    def request_chunk(index: int, voice_id: str, chunk: str) -> bytes:
         try:
-            response = requests.post(
-                endpoint,
+            response = session.post(
+                f"{_ELEVENLABS_BASE_URL}/v1/text-to-speech/{voice_id}",
                 params={"output_format": output_format},
                 headers=headers,
                 json={
@@ -181,8 +563,22 @@ def _synthesize_with_elevenlabs(
                 },
                 timeout=60,
             )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise TransientError(
+                f"ElevenLabs connection failed for chunk {index}: {exc}"
+            ) from exc
         except requests.RequestException as exc:
             raise TTSError(f"ElevenLabs request failed for chunk {index}: {exc}") from exc
+        if response.status_code == 429:
+            raise ThrottledError(
+                f"ElevenLabs throttled chunk {index}: {response.text.strip()[:200]}",
+                retry_after_sec=_retry_after_sec(response),
+            )
+        if response.status_code >= 500:
+            raise TransientError(
+                f"ElevenLabs failed chunk {index} (status={response.status_code}): "
+                f"{response.text.strip()[:200]}"
+            )
         if response.status_code >= 400:
             error_body = response.text.strip()[:500]
             raise TTSError(
@@ -191,36 +587,28 @@ def _synthesize_with_elevenlabs(
             )
         if not response.content:
             raise TTSError(f"ElevenLabs response missing audio content for chunk {index}.")
-
-        audio_parts.append(response.content)
-        chunk_elapsed_ms = int((time.perf_counter() - chunk_start) * 1000)
-        logger.info(
-            "ElevenLabs chunk synthesized",
-            extra={
-                "chunk_index": index,
-                "chunk_count": len(chunks),
-                "input_chars": len(chunk),
-                "audio_bytes": len(response.content),
-                "elapsed_ms": chunk_elapsed_ms,
-            },
-        )
-
-    combined_audio = b"".join(audio_parts)
-    total_elapsed_ms = int((time.perf_counter() - total_start) * 1000)
-    logger.info(
-        "Completed ElevenLabs synthesis",
-        extra={
-            "chunk_count": len(chunks),
-            "total_audio_bytes": len(combined_audio),
-            "elapsed_ms": total_elapsed_ms,
-        },
+        return response.content
+
+    return _iter_chunk_audio(
+        tasks,
+        request_chunk,
+        provider_label="ElevenLabs",
+        cache=cache,
+        cache_key=lambda voice_id, chunk: chunk_cache_key(
+            chunk,
+            voice_id,
+            provider="elevenlabs",
+            output_format=output_format,
+            text_type=text_type,
+            elevenlabs_model_id=elevenlabs_model_id,
+        ),
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
     )
-    return combined_audio
 
 
-def synthesize_speech(
-    text: str,
-    voice_id: str,
+def iter_voice_segments(
+    segments: Iterable[tuple[str, str]],
     *,
     provider: str = "polly",
     output_format: str = "mp3",
@@ -228,25 +616,101 @@ def synthesize_speech(
     text_type: str = "text",
     elevenlabs_api_key: str | None = None,
     elevenlabs_model_id: str = "eleven_multilingual_v2",
-) -> bytes:
+    max_concurrency: int = 1,
+    cache: CacheBackend | None = None,
+    rate_limiter: ProviderLimiter | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Synthesize ``(voice_id, text)`` segments on one shared worker pool.
+
+    A sequence of segments is chunked up front; an iterator is consumed lazily, so
+    segments can be fed in while they are still being produced. All chunks, across
+    segments and voices, share the ``max_concurrency`` pool. Yields
+    ``(segment_index, chunk_audio)`` in segment and chunk order. Provider throttles are
+    retried through ``rate_limiter``; pass one limiter to several calls to share its
+    budgets and adaptive concurrency across them.
+    """
     normalized_provider = provider.strip().lower()
     if normalized_provider == "polly":
-        return _synthesize_with_polly(
-            text=text,
-            voice_id=voice_id,
+        return _iter_polly_chunks(
+            segments,
             output_format=output_format,
             max_text_chars=max_text_chars,
             text_type=text_type,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
         )
     if normalized_provider == "elevenlabs":
-        resolved_output_format = output_format if output_format != "mp3" else "mp3_44100_128"
-        return _synthesize_with_elevenlabs(
-            text=text,
-            voice_id=voice_id,
+        return _iter_elevenlabs_chunks(
+            segments,
             elevenlabs_api_key=elevenlabs_api_key,
             elevenlabs_model_id=elevenlabs_model_id,
-            output_format=resolved_output_format,
+            output_format=_resolve_output_format(normalized_provider, output_format),
             max_text_chars=max_text_chars,
             text_type=text_type,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
         )
     raise TTSError("Unsupported TTS provider. Use 'polly' or 'elevenlabs'.")
+
+
+def iter_speech_chunks(
+    text: str,
+    voice_id: str,
+    *,
+    provider: str = "polly",
+    output_format: str = "mp3",
+    max_text_chars: int = 2500,
+    text_type: str = "text",
+    elevenlabs_api_key: str | None = None,
+    elevenlabs_model_id: str = "eleven_multilingual_v2",
+    max_concurrency: int = 1,
+    cache: CacheBackend | None = None,
+    rate_limiter: ProviderLimiter | None = None,
+) -> Iterator[bytes]:
+    """Yield synthesized audio chunk by chunk, in script order, as soon as each is ready."""
+    segment_chunks = iter_voice_segments(
+        [(voice_id, text)],
+        provider=provider,
+        output_format=output_format,
+        max_text_chars=max_text_chars,
+        text_type=text_type,
+        elevenlabs_api_key=elevenlabs_api_key,
+        elevenlabs_model_id=elevenlabs_model_id,
+        max_concurrency=max_concurrency,
+        cache=cache,
+        rate_limiter=rate_limiter,
+    )
+    return (chunk_audio for _, chunk_audio in segment_chunks)
+
+
+def synthesize_speech(
+    text: str,
+    voice_id: str,
+    *,
+    provider: str = "polly",
+    output_format: str = "mp3",
+    max_text_chars: int = 2500,
+    text_type: str = "text",
+    elevenlabs_api_key: str | None = None,
+    elevenlabs_model_id: str = "eleven_multilingual_v2",
+    max_concurrency: int = 1,
+    cache: CacheBackend | None = None,
+    rate_limiter: ProviderLimiter | None = None,
+) -> bytes:
+    return stitch_mp3(
+        iter_speech_chunks(
+            text,
+            voice_id,
+            provider=provider,
+            output_format=output_format,
+            max_text_chars=max_text_chars,
+            text_type=text_type,
+            elevenlabs_api_key=elevenlabs_api_key,
+            elevenlabs_model_id=elevenlabs_model_id,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            rate_limiter=rate_limiter,
+        )
+    )
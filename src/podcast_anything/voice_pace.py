@@ -0,0 +1,85 @@
+"""Measured speaking rate per TTS voice, used to calibrate duration estimates."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from podcast_anything import s3
+
+DEFAULT_WPM = 150.0
+CALIBRATION_KEY = "calibration/voice_pace.json"
+# Weight of a new job's measurement in the stored moving average.
+_SMOOTHING = 0.3
+# Shorter samples (a lone "Right.") are dominated by leading/trailing silence.
+_MIN_SAMPLE_SEC = 5.0
+
+
+class VoicePaceError(RuntimeError):
+    """Raised when the voice pace calibration cannot be read or written."""
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def estimate_duration_sec(text: str, wpm: float = DEFAULT_WPM) -> int:
+    minutes = count_words(text) / max(wpm, 1)
+    return int(minutes * 60)
+
+
+def voice_key(provider: str, voice_id: str) -> str:
+    return f"{provider}/{voice_id}"
+
+
+class VoicePaceMeter:
+    """Accumulate words spoken and measured audio seconds per voice for one job."""
+
+    def __init__(self) -> None:
+        self._totals: dict[str, tuple[int, float]] = {}
+
+    def record(self, key: str, words: int, seconds: float) -> None:
+        total_words, total_seconds = self._totals.get(key, (0, 0.0))
+        self._totals[key] = (total_words + words, total_seconds + seconds)
+
+    def measured_wpm(self) -> dict[str, float]:
+        return {
+            key: words / seconds * 60
+            for key, (words, seconds) in self._totals.items()
+            if seconds >= _MIN_SAMPLE_SEC and words
+        }
+
+
+def load_calibration(bucket: str) -> dict[str, float]:
+    """Return the stored words-per-minute per voice key, or an empty mapping."""
+    try:
+        found = s3.get_bytes_if_exists(bucket, CALIBRATION_KEY)
+    except (ClientError, BotoCoreError) as exc:
+        raise VoicePaceError(f"Failed to read voice pace calibration: {exc}") from exc
+    if found is None:
+        return {}
+    voices: dict[str, Any] = json.loads(found[0]).get("voices", {})
+    return {key: float(entry["wpm"]) for key, entry in voices.items()}
+
+
+def update_calibration(bucket: str, measured: dict[str, float]) -> dict[str, float]:
+    """Blend this job's measurements into the stored calibration and write it back.
+
+    Concurrent jobs may overwrite each other's update; the moving average tolerates a
+    lost sample.
+    """
+    calibration = load_calibration(bucket)
+    for key, wpm in measured.items():
+        previous = calibration.get(key)
+        calibration[key] = wpm if previous is None else previous + _SMOOTHING * (wpm - previous)
+    try:
+        s3.put_json(
+            bucket,
+            CALIBRATION_KEY,
+            {"voices": {key: {"wpm": round(wpm, 2)} for key, wpm in calibration.items()}},
+        )
+    except (ClientError, BotoCoreError) as exc:
+        raise VoicePaceError(f"Failed to write voice pace calibration: {exc}") from exc
+    return calibration
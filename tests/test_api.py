@@ -48,7 +48,7 @@ class ApiServiceTests(unittest.TestCase):
     def test_start_pipeline_execution_rejects_conflicting_source_inputs(self) -> None:
         with self.assertRaisesRegex(
             PipelineApiError,
-            "exactly one of source_url or source_file_base64",
+            "exactly one of source_url, source_file_base64, or sources",
         ):
             start_pipeline_execution(
                 source_url="https://example.com/article",
@@ -168,6 +168,37 @@ class ApiServiceTests(unittest.TestCase):
         self.assertEqual("brief.txt", result["source_file_name"])
         self.assertIsNone(result["source_url"])
 
+    @patch("podcast_anything.api.service.boto3.session.Session")
+    def test_start_pipeline_execution_accepts_multiple_sources(
+        self, mock_session_cls: Mock
+    ) -> None:
+        mock_session = Mock()
+        mock_sf = Mock()
+        mock_sf.start_execution.return_value = {
+            "executionArn": "arn:aws:states:us-east-1:123:execution:sm:exec-4",
+            "startDate": datetime(2026, 1, 4, tzinfo=timezone.utc),
+        }
+        mock_session.client.return_value = mock_sf
+        mock_session_cls.return_value = mock_session
+
+        sources = [{"url": "https://example.com/a"}, {"text": "Pasted notes.", "title": "Notes"}]
+        result = start_pipeline_execution(
+            sources=sources,
+            state_machine_arn="arn:aws:states:us-east-1:123:stateMachine:sm",
+            region="us-east-1",
+        )
+
+        payload = json.loads(mock_sf.start_execution.call_args.kwargs["input"])
+        self.assertEqual(sources, payload["sources"])
+        self.assertNotIn("source_url", payload)
+        self.assertEqual(2, result["source_count"])
+
+        with self.assertRaisesRegex(PipelineApiError, r"sources\[0\]: YouTube URLs require"):
+            start_pipeline_execution(
+                sources=[{"url": "https://www.youtube.com/watch?v=abc123"}],
+                state_machine_arn="arn:aws:states:us-east-1:123:stateMachine:sm",
+            )
+
     @patch("podcast_anything.api.service.boto3.session.Session")
     def test_start_pipeline_execution_resolves_state_machine_arn_from_stack(
         self, mock_session_cls: Mock
@@ -3,11 +3,33 @@
 from __future__ import annotations
 
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import requests
 
-from podcast_anything.article import ArticleError, extract_text, fetch_html
+from podcast_anything import article
+from podcast_anything.article import (
+    ArticleError,
+    detect_encoding,
+    extract_text,
+    extract_text_from_chunks,
+    fetch_html,
+    fetch_text,
+    resolve_engine,
+)
+
+# Hand-built pages, not captures of real sites: they reproduce layouts that stress the
+# engines differently (a heavy news page full of inline CSS and scripts, a blog with no
+# <article>, nested documentation markup, an <article> without <p> tags).
+_CORPUS = Path(__file__).parent / "fixtures" / "synthetic_pages"
+_ENGINES = ["bs4", "stream", "lxml"]
+# The streaming extractor uses lxml when installed and html.parser otherwise.
+_STREAM_BACKENDS = [None, article.etree]
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[start : start + size] for start in range(0, len(data), size)]
 
 
 class FetchHtmlTests(unittest.TestCase):
@@ -21,6 +43,42 @@ class FetchHtmlTests(unittest.TestCase):
 
         with self.assertRaisesRegex(ArticleError, "Failed to fetch article"):
             fetch_html("https://example.com/post")
+        with self.assertRaisesRegex(ArticleError, "Failed to fetch article"):
+            fetch_text("https://example.com/post")
+
+    @patch("podcast_anything.article.requests.get")
+    def test_fetch_text_extracts_while_streaming(self, mock_get: Mock) -> None:
+        page = "<article><p>Caf\u00e9 opens.</p></article>".encode("utf-8")
+        response = mock_get.return_value.__enter__.return_value
+        response.headers = {"Content-Type": "text/html"}
+        response.iter_content.return_value = iter(_chunks(page, 12))
+
+        self.assertEqual("Caf\u00e9 opens.", fetch_text("https://example.com/post"))
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        accept_encoding = mock_get.call_args.kwargs["headers"]["Accept-Encoding"]
+        self.assertIn("gzip", accept_encoding)
+        self.assertIn("br", accept_encoding)
+
+    @patch("podcast_anything.article.requests.get")
+    def test_fetch_html_stops_reading_at_max_bytes(self, mock_get: Mock) -> None:
+        response = mock_get.return_value.__enter__.return_value
+        response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        response.iter_content.return_value = iter([b"<p>One.</p>", b"<p>Two.</p>", b"<p>3"])
+
+        with self.assertLogs("podcast_anything.article", level="WARNING"):
+            html = fetch_html("https://example.com/post", max_bytes=15)
+
+        self.assertEqual("<p>One.</p><p>T", html)
+        # The rest of the body is never read.
+        self.assertEqual([b"<p>3"], list(response.iter_content.return_value))
+
+    def test_detects_encoding_from_header_then_meta(self) -> None:
+        meta = b'<head><meta http-equiv="Content-Type" content="text/html; charset=Shift_JIS">'
+
+        self.assertEqual("cp1252", detect_encoding("text/html; charset=windows-1252", meta))
+        self.assertEqual("shift_jis", detect_encoding("text/html", meta))
+        self.assertEqual("utf-8", detect_encoding("text/html; charset=bogus", b"<p>x</p>"))
+        self.assertEqual("utf-8", detect_encoding(None, b" " * 2048 + meta))
 
 
 class ExtractTextTests(unittest.TestCase):
@@ -32,18 +90,77 @@ class ExtractTextTests(unittest.TestCase):
         </body></html>
         """
 
-        self.assertEqual("Intro section.\nMain details.", extract_text(html))
+        for engine in _ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual("Intro section.\nMain details.", extract_text(html, engine))
 
     def test_falls_back_to_page_paragraphs(self) -> None:
         html = "<html><body><p>One.</p><p>Two.</p></body></html>"
 
-        self.assertEqual("One.\nTwo.", extract_text(html))
+        for engine in _ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual("One.\nTwo.", extract_text(html, engine))
 
     def test_raises_if_no_readable_paragraphs(self) -> None:
         html = "<html><body><div>No paragraphs here.</div></body></html>"
 
-        with self.assertRaisesRegex(ArticleError, "No readable text"):
-            extract_text(html)
+        for engine in _ENGINES:
+            with self.subTest(engine=engine):
+                with self.assertRaisesRegex(ArticleError, "No readable text"):
+                    extract_text(html, engine)
+
+    def test_drops_page_chrome_inside_paragraphs(self) -> None:
+        html = (
+            "<article><p>Keep <em>this</em><script>x()</script> and"
+            "<!-- note --> that.</p><aside><p>Related</p></aside></article>"
+        )
+
+        for engine in _ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual("Keep this and that.", extract_text(html, engine))
+
+    def test_lxml_engine_matches_bs4_on_synthetic_pages(self) -> None:
+        pages = sorted(_CORPUS.glob("*.html"))
+        self.assertTrue(pages)
+        for path in pages:
+            html = path.read_text(encoding="utf-8")
+            with self.subTest(page=path.name):
+                self.assertEqual(extract_text(html, "bs4"), extract_text(html, "lxml"))
+
+    def test_resolves_engines(self) -> None:
+        self.assertEqual("bs4", resolve_engine("bs4"))
+        with patch.object(article, "etree", None):
+            self.assertEqual("bs4", resolve_engine("auto"))
+            with self.assertRaisesRegex(ArticleError, "requires the `lxml` package"):
+                resolve_engine("lxml")
+        with self.assertRaisesRegex(ArticleError, "Unknown extraction engine"):
+            resolve_engine("regex")
+
+
+class StreamingExtractorTests(unittest.TestCase):
+    def test_matches_bs4_on_synthetic_pages_fed_in_small_chunks(self) -> None:
+        for path in sorted(_CORPUS.glob("*.html")):
+            html = path.read_text(encoding="utf-8")
+            expected = extract_text(html, "bs4")
+            for backend in _STREAM_BACKENDS:
+                with self.subTest(page=path.name, lxml=backend is not None):
+                    with patch.object(article, "etree", backend):
+                        chunks = _chunks(html.encode("utf-8"), 997)
+                        self.assertEqual(expected, extract_text_from_chunks(chunks))
+
+    def test_splits_text_at_comments_and_sniffs_meta_charset(self) -> None:
+        split = "<p>one<!-- note -->two \u00e9</p>".encode("utf-8")
+        latin = '<meta charset="iso-8859-1"><p>caf\u00e9</p>'.encode("latin-1")
+        for backend in _STREAM_BACKENDS:
+            with self.subTest(lxml=backend is not None):
+                with patch.object(article, "etree", backend):
+                    # The split lands inside the two-byte UTF-8 character.
+                    self.assertEqual(
+                        "one two \u00e9", extract_text_from_chunks([split[:-5], split[-5:]])
+                    )
+                    self.assertEqual("caf\u00e9", extract_text_from_chunks([latin]))
+                    with self.assertRaisesRegex(ArticleError, "No readable text"):
+                        extract_text_from_chunks([])
 
 
 if __name__ == "__main__":
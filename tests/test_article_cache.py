@@ -0,0 +1,101 @@
+"""Unit tests for the conditional-GET article cache."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from podcast_anything.article_cache import (
+    CachedArticle,
+    article_cache_key,
+    fetch_article_text,
+    normalize_url,
+)
+from podcast_anything.cache import LocalDiskCache
+
+_URL = "https://Example.com:443/post?utm_source=digest&b=2&a=1#comments"
+
+
+def _response(status_code: int, body: bytes = b"", **headers: str) -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "text/html; charset=utf-8", **headers}
+    response.iter_content.return_value = iter([body])
+    return response
+
+
+def _serve(mock_get: Mock, *responses: Mock) -> None:
+    mock_get.return_value.__enter__.side_effect = list(responses)
+
+
+class NormalizeUrlTests(unittest.TestCase):
+    def test_normalizes_case_ports_fragments_and_tracking_params(self) -> None:
+        self.assertEqual("https://example.com/post?a=1&b=2", normalize_url(_URL))
+        self.assertEqual("http://example.com:8080/", normalize_url("HTTP://example.com:8080"))
+        self.assertEqual(
+            article_cache_key(_URL, engine="bs4", max_bytes=100),
+            article_cache_key("https://example.com/post?a=1&b=2", engine="bs4", max_bytes=100),
+        )
+
+
+@patch("podcast_anything.article.requests.get")
+class FetchArticleTextTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.cache = LocalDiskCache(self._tempdir.name, max_age_sec=3600)
+
+    def tearDown(self) -> None:
+        self._tempdir.cleanup()
+
+    def _fetch(self) -> str:
+        return fetch_article_text(_URL, cache=self.cache, engine="bs4", job_id="job-1")
+
+    def test_reuses_cached_text_on_not_modified(self, mock_get: Mock) -> None:
+        not_modified = _response(304, ETag='"v1"')
+        _serve(
+            mock_get,
+            _response(200, b"<p>First version.</p>", ETag='"v1"', **{"Last-Modified": "Mon"}),
+            not_modified,
+        )
+
+        self.assertEqual("First version.", self._fetch())
+        self.assertEqual("First version.", self._fetch())
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual('"v1"', headers["If-None-Match"])
+        self.assertEqual("Mon", headers["If-Modified-Since"])
+        not_modified.iter_content.assert_not_called()
+
+    def test_replaces_entry_when_page_changed(self, mock_get: Mock) -> None:
+        _serve(
+            mock_get,
+            _response(200, b"<p>Old.</p>", ETag='"v1"'),
+            _response(200, b"<p>New.</p>", ETag='"v2"'),
+        )
+
+        self._fetch()
+        self.assertEqual("New.", self._fetch())
+
+        key = article_cache_key(_URL, engine="bs4", max_bytes=5 * 1024 * 1024)
+        entry = CachedArticle.from_bytes(self.cache.get(key) or b"")
+        self.assertEqual(("New.", '"v2"'), (entry.text, entry.etag))
+
+    def test_skips_pages_without_validators_and_unreadable_entries(self, mock_get: Mock) -> None:
+        _serve(mock_get, _response(200, b"<p>One.</p>"), _response(200, b"<p>Two.</p>"))
+        key = article_cache_key(_URL, engine="bs4", max_bytes=5 * 1024 * 1024)
+        self.cache.put(key, b"not json")
+
+        with self.assertLogs("podcast_anything.article_cache", level="WARNING") as logs:
+            self.assertEqual("One.", self._fetch())
+            self.assertEqual("Two.", self._fetch())
+
+        # The corrupt entry is a miss each time and is never overwritten by uncacheable pages.
+        self.assertEqual(2, len(logs.records))
+
+        self.assertNotIn("If-None-Match", mock_get.call_args.kwargs["headers"])
+        self.assertEqual(b"not json", self.cache.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""Unit tests for content-addressed cache backends."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from podcast_anything.cache import (
+    CacheError,
+    LocalDiskCache,
+    S3Cache,
+    TieredCache,
+    build_cache,
+    hash_key,
+)
+
+
+class HashKeyTests(unittest.TestCase):
+    def test_hash_key_is_stable_and_boundary_sensitive(self) -> None:
+        self.assertEqual(hash_key("polly", "Joanna", "hi"), hash_key("polly", "Joanna", "hi"))
+        self.assertNotEqual(hash_key("ab", "c"), hash_key("a", "bc"))
+
+
+class LocalDiskCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trips_entries(self) -> None:
+        cache = LocalDiskCache(self.root)
+        key = hash_key("entry")
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, b"audio")
+
+        self.assertEqual(b"audio", cache.get(key))
+
+    def test_expired_entries_are_misses(self) -> None:
+        cache = LocalDiskCache(self.root, max_age_sec=60)
+        key = hash_key("old")
+        cache.put(key, b"audio")
+        stale = time.time() - 120
+        os.utime(cache._path(key), (stale, stale))
+
+        self.assertIsNone(cache.get(key))
+        self.assertFalse(cache._path(key).exists())
+
+    def test_evicts_least_recently_used_entries_over_budget(self) -> None:
+        cache = LocalDiskCache(self.root, max_bytes=10)
+        keys = [hash_key(str(index)) for index in range(3)]
+        for offset, key in enumerate(keys):
+            cache.put(key, b"12345")
+            modified = time.time() - 100 + offset
+            os.utime(cache._path(key), (modified, modified))
+
+        evicted = cache.evict()
+
+        self.assertEqual(1, evicted)
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertEqual(b"12345", cache.get(keys[2]))
+
+    def test_evict_skips_entries_removed_during_the_sweep(self) -> None:
+        cache = LocalDiskCache(self.root, max_bytes=10)
+        keys = [hash_key(str(index)) for index in range(3)]
+        for key in keys:
+            cache.put(key, b"12345")
+        real_stat = Path.stat
+        failures: dict[Path, OSError] = {cache._path(keys[0]): FileNotFoundError("vanished")}
+
+        def racing_stat(path: Path, *args: object, **kwargs: object) -> os.stat_result:
+            if path in failures:
+                raise failures[path]
+            return real_stat(path, *args, **kwargs)
+
+        with patch.object(Path, "stat", racing_stat):
+            # The vanished entry is skipped; the other two fit the budget.
+            self.assertEqual(0, cache.evict())
+            failures[cache._path(keys[1])] = PermissionError("denied")
+            with self.assertRaisesRegex(CacheError, "Failed to evict cache entries"):
+                cache.evict()
+
+
+class S3CacheTests(unittest.TestCase):
+    @patch("podcast_anything.cache.s3.get_bytes_if_exists")
+    def test_get_respects_max_age(self, mock_get: Mock) -> None:
+        cache = S3Cache("bucket", "cache/tts", max_age_sec=60)
+        now = datetime.now(timezone.utc)
+
+        mock_get.return_value = (b"fresh", now)
+        self.assertEqual(b"fresh", cache.get("abc"))
+        mock_get.assert_called_with("bucket", "cache/tts/abc")
+
+        mock_get.return_value = (b"stale", now - timedelta(minutes=5))
+        self.assertIsNone(cache.get("abc"))
+
+        mock_get.return_value = None
+        self.assertIsNone(cache.get("abc"))
+
+    @patch("podcast_anything.cache.s3.delete_keys")
+    @patch("podcast_anything.cache.s3.list_objects")
+    def test_evict_deletes_expired_then_oldest(
+        self, mock_list: Mock, mock_delete: Mock
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        mock_list.return_value = [
+            {"Key": "cache/tts/expired", "Size": 1, "LastModified": now - timedelta(days=9)},
+            {"Key": "cache/tts/old", "Size": 6, "LastModified": now - timedelta(hours=2)},
+            {"Key": "cache/tts/new", "Size": 6, "LastModified": now},
+        ]
+        cache = S3Cache("bucket", "cache/tts/", max_age_sec=7 * 24 * 3600, max_bytes=10)
+
+        self.assertEqual(2, cache.evict())
+        mock_delete.assert_called_once_with("bucket", ["cache/tts/expired", "cache/tts/old"])
+
+    @patch("podcast_anything.cache.s3.put_bytes")
+    @patch("podcast_anything.cache.s3.delete_keys")
+    @patch("podcast_anything.cache.s3.list_objects")
+    @patch("podcast_anything.cache.s3.last_modified")
+    def test_evict_sweeps_at_most_once_per_interval(
+        self, mock_last_modified: Mock, mock_list: Mock, mock_delete: Mock, mock_put: Mock
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        cache = S3Cache("bucket", "cache/tts/", max_bytes=10, sweep_interval_sec=3600)
+
+        mock_last_modified.return_value = now - timedelta(minutes=5)
+        self.assertEqual(0, cache.evict())
+        mock_list.assert_not_called()
+        mock_put.assert_not_called()
+
+        mock_last_modified.return_value = now - timedelta(hours=2)
+        mock_list.return_value = [
+            {"Key": "cache/tts/_last-sweep", "Size": 0, "LastModified": now - timedelta(days=1)},
+            {"Key": "cache/tts/old", "Size": 6, "LastModified": now - timedelta(hours=2)},
+            {"Key": "cache/tts/new", "Size": 6, "LastModified": now},
+        ]
+        self.assertEqual(1, cache.evict())
+        mock_last_modified.assert_called_with("bucket", "cache/tts/_last-sweep")
+        mock_put.assert_called_once_with(
+            "bucket", "cache/tts/_last-sweep", b"", content_type="application/octet-stream"
+        )
+        mock_delete.assert_called_once_with("bucket", ["cache/tts/old"])
+
+
+class TieredCacheTests(unittest.TestCase):
+    def test_reads_through_tiers_and_backfills(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            first = LocalDiskCache(Path(root) / "first")
+            second = LocalDiskCache(Path(root) / "second")
+            tiered = TieredCache(first, second)
+            second.put("key", b"audio")
+
+            self.assertEqual(b"audio", tiered.get("key"))
+            self.assertEqual(b"audio", first.get("key"))
+
+            tiered.put("other", b"fresh")
+            self.assertEqual(b"fresh", second.get("other"))
+            self.assertIsNone(tiered.get("missing"))
+
+
+class BuildCacheTests(unittest.TestCase):
+    def test_selects_backend(self) -> None:
+        kwargs = {"bucket": "bucket", "prefix": "cache/tts/", "local_dir": "/tmp/cache"}
+
+        self.assertIsNone(build_cache("off", **kwargs))
+        self.assertIsInstance(build_cache("local", **kwargs), LocalDiskCache)
+        self.assertIsInstance(build_cache("S3", **kwargs), S3Cache)
+        with self.assertRaisesRegex(CacheError, "cache backend"):
+            build_cache("redis", **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
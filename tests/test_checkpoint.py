@@ -0,0 +1,99 @@
+"""Unit tests for per-job audio chunk checkpoints."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timezone
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+from podcast_anything.checkpoint import JobChunkCheckpoint
+from podcast_anything.tts import synthesize_speech
+
+
+class InMemoryObjects:
+    """Stand-in for the S3 helpers used by checkpoints."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+
+    def get_bytes_if_exists(self, bucket: str, key: str) -> tuple[bytes, datetime] | None:
+        data = self.objects.get(f"{bucket}/{key}")
+        return (data, datetime.now(timezone.utc)) if data is not None else None
+
+    def put_bytes(self, bucket: str, key: str, data: bytes, content_type: str) -> None:
+        self.objects[f"{bucket}/{key}"] = data
+
+    def list_objects(self, bucket: str, prefix: str) -> list[dict]:
+        return [
+            {"Key": name.split("/", 1)[1], "Size": len(data)}
+            for name, data in self.objects.items()
+            if name.startswith(f"{bucket}/{prefix}")
+        ]
+
+
+class JobChunkCheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = InMemoryObjects()
+        for name in ("get_bytes_if_exists", "put_bytes", "list_objects"):
+            patcher = patch(f"podcast_anything.checkpoint.s3.{name}", getattr(self.store, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_chunk_objects_mark_completion_without_a_shared_manifest(self) -> None:
+        self.store.objects["bucket/jobs/job-1/chunks/plan.json"] = b"{}"
+        checkpoint = JobChunkCheckpoint("bucket", "job-1")
+
+        self.assertIsNone(checkpoint.get("hash-a"))
+        checkpoint.put("hash-a", b"audio-a")
+        checkpoint.put("hash-b", b"audio-b")
+
+        # One object per chunk and nothing else is rewritten as chunks complete.
+        self.assertEqual(
+            {
+                "bucket/jobs/job-1/chunks/plan.json",
+                "bucket/jobs/job-1/chunks/hash-a.mp3",
+                "bucket/jobs/job-1/chunks/hash-b.mp3",
+            },
+            set(self.store.objects),
+        )
+        resumed = JobChunkCheckpoint("bucket", "job-1")
+        self.assertEqual(2, resumed.completed_count)
+        self.assertEqual(b"audio-a", resumed.get("hash-a"))
+        self.assertIsNone(resumed.get("hash-c"))
+
+    @patch("podcast_anything.tts.boto3.client")
+    def test_retry_only_synthesizes_missing_chunks(self, mock_boto_client: Mock) -> None:
+        text = "\n".join(f"c{index} " + "word " * 30 for index in range(3))
+        calls: list[str] = []
+
+        def flaky_synthesize(**kwargs: str) -> dict[str, BytesIO]:
+            marker = kwargs["Text"].split(" ", 1)[0]
+            calls.append(marker)
+            if marker == "c2" and calls.count("c2") == 1:
+                raise RuntimeError("throttled")
+            return {"AudioStream": BytesIO(marker.encode("ascii"))}
+
+        mock_boto_client.return_value.synthesize_speech.side_effect = flaky_synthesize
+
+        with self.assertRaisesRegex(RuntimeError, "throttled"):
+            synthesize_speech(
+                text,
+                voice_id="Joanna",
+                max_text_chars=154,
+                cache=JobChunkCheckpoint("bucket", "job-1"),
+            )
+        audio = synthesize_speech(
+            text,
+            voice_id="Joanna",
+            max_text_chars=154,
+            cache=JobChunkCheckpoint("bucket", "job-1"),
+        )
+
+        self.assertEqual(b"c0c1c2", audio)
+        self.assertEqual(["c0", "c1", "c2", "c2"], calls)
+        self.assertEqual(3, JobChunkCheckpoint("bucket", "job-1").completed_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,9 @@ class LoadSettingsTests(unittest.TestCase):
         self.assertEqual("Joanna", settings.polly_voice_id)
         self.assertEqual("Joanna", settings.polly_duo_voice_id)
         self.assertIsNone(settings.elevenlabs_api_key)
+        self.assertEqual(4, settings.tts_max_concurrency)
+        self.assertEqual("off", settings.tts_cache_backend)
+        self.assertFalse(settings.bedrock_prompt_cache)
 
     def test_rejects_unknown_tts_provider(self) -> None:
         with patch.dict(
@@ -76,6 +79,284 @@ class LoadSettingsTests(unittest.TestCase):
         self.assertEqual("eleven_multilingual_v2", settings.elevenlabs_model_id)
         self.assertEqual("mp3_44100_128", settings.elevenlabs_output_format)
 
+    def test_loads_tts_max_concurrency(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, {**base_env, "TTS_MAX_CONCURRENCY": "8"}, clear=True):
+            self.assertEqual(8, load_settings().tts_max_concurrency)
+
+        for invalid in ("0", "-2", "many"):
+            with self.subTest(value=invalid):
+                with patch.dict(
+                    os.environ, {**base_env, "TTS_MAX_CONCURRENCY": invalid}, clear=True
+                ):
+                    with self.assertRaisesRegex(ConfigError, "TTS_MAX_CONCURRENCY"):
+                        load_settings()
+
+    def test_loads_tts_cache_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(
+            os.environ,
+            {
+                **base_env,
+                "TTS_CACHE_BACKEND": "S3",
+                "TTS_CACHE_MAX_AGE_SEC": "3600",
+                "TTS_CACHE_MAX_BYTES": "1048576",
+            },
+            clear=True,
+        ):
+            settings = load_settings()
+
+        self.assertEqual("s3", settings.tts_cache_backend)
+        self.assertEqual(3600, settings.tts_cache_max_age_sec)
+        self.assertEqual(1048576, settings.tts_cache_max_bytes)
+
+        with patch.dict(os.environ, {**base_env, "TTS_CACHE_BACKEND": "redis"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "TTS_CACHE_BACKEND"):
+                load_settings()
+
+    def test_loads_script_cache_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            self.assertEqual("off", load_settings().script_cache_backend)
+
+        with patch.dict(
+            os.environ,
+            {
+                **base_env,
+                "SCRIPT_CACHE_BACKEND": "Local",
+                "SCRIPT_CACHE_DIR": "/tmp/scripts",
+                "SCRIPT_CACHE_MAX_AGE_SEC": "86400",
+                "SCRIPT_CACHE_MAX_BYTES": "2048",
+            },
+            clear=True,
+        ):
+            settings = load_settings()
+
+        self.assertEqual("local", settings.script_cache_backend)
+        self.assertEqual("/tmp/scripts", settings.script_cache_dir)
+        self.assertEqual(86400, settings.script_cache_max_age_sec)
+        self.assertEqual(2048, settings.script_cache_max_bytes)
+
+        with patch.dict(os.environ, {**base_env, "SCRIPT_CACHE_BACKEND": "redis"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "SCRIPT_CACHE_BACKEND"):
+                load_settings()
+
+
+    def test_loads_tts_rate_limit_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            defaults = load_settings()
+        self.assertEqual(4, defaults.tts_max_attempts)
+        self.assertIsNone(defaults.tts_requests_per_sec)
+        self.assertIsNone(defaults.tts_chars_per_sec)
+
+        with patch.dict(
+            os.environ,
+            {
+                **base_env,
+                "TTS_MAX_ATTEMPTS": "6",
+                "TTS_REQUESTS_PER_SEC": "7.5",
+                "TTS_CHARS_PER_SEC": "20000",
+            },
+            clear=True,
+        ):
+            settings = load_settings()
+        self.assertEqual(6, settings.tts_max_attempts)
+        self.assertEqual(7.5, settings.tts_requests_per_sec)
+        self.assertEqual(20000.0, settings.tts_chars_per_sec)
+
+        with patch.dict(os.environ, {**base_env, "TTS_REQUESTS_PER_SEC": "0"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "TTS_REQUESTS_PER_SEC"):
+                load_settings()
+
+    def test_loads_model_routes_sorted_by_input_limit(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-pro-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            defaults = load_settings()
+        self.assertEqual((), defaults.bedrock_model_routes)
+        self.assertEqual(8, defaults.script_target_minutes)
+
+        routes = "60000=us.amazon.nova-lite-v1:0, 8000=us.amazon.nova-micro-v1:0"
+        with patch.dict(
+            os.environ,
+            {**base_env, "BEDROCK_MODEL_ROUTES": routes, "SCRIPT_TARGET_MINUTES": "12"},
+            clear=True,
+        ):
+            settings = load_settings()
+        self.assertEqual(
+            ((8000, "us.amazon.nova-micro-v1:0"), (60000, "us.amazon.nova-lite-v1:0")),
+            settings.bedrock_model_routes,
+        )
+        self.assertEqual(12, settings.script_target_minutes)
+
+        for invalid in ("us.amazon.nova-micro-v1:0", "0=model", "8000="):
+            with patch.dict(os.environ, {**base_env, "BEDROCK_MODEL_ROUTES": invalid}, clear=True):
+                with self.assertRaisesRegex(ConfigError, "BEDROCK_MODEL_ROUTES"):
+                    load_settings()
+
+    def test_loads_script_generation_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            defaults = load_settings()
+        self.assertEqual("whole", defaults.script_generation)
+        self.assertEqual(4, defaults.script_segment_count)
+
+        with patch.dict(
+            os.environ,
+            {**base_env, "SCRIPT_GENERATION": " Outline ", "SCRIPT_SEGMENT_COUNT": "6"},
+            clear=True,
+        ):
+            settings = load_settings()
+        self.assertEqual("outline", settings.script_generation)
+        self.assertEqual(6, settings.script_segment_count)
+
+        with patch.dict(os.environ, {**base_env, "SCRIPT_GENERATION": "parallel"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "SCRIPT_GENERATION"):
+                load_settings()
+
+    def test_loads_article_cache_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            settings = load_settings()
+        self.assertEqual("off", settings.article_cache_backend)
+        self.assertEqual(7 * 24 * 3600, settings.article_cache_max_age_sec)
+        self.assertEqual(64 * 1024 * 1024, settings.article_cache_max_bytes)
+        self.assertEqual(3600, settings.cache_sweep_interval_sec)
+
+        with patch.dict(
+            os.environ,
+            {
+                **base_env,
+                "ARTICLE_CACHE_BACKEND": "LOCAL",
+                "ARTICLE_CACHE_DIR": "/tmp/articles",
+                "ARTICLE_CACHE_MAX_AGE_SEC": "3600",
+                "CACHE_SWEEP_INTERVAL_SEC": "60",
+            },
+            clear=True,
+        ):
+            settings = load_settings()
+        self.assertEqual("local", settings.article_cache_backend)
+        self.assertEqual("/tmp/articles", settings.article_cache_dir)
+        self.assertEqual(3600, settings.article_cache_max_age_sec)
+        self.assertEqual(60, settings.cache_sweep_interval_sec)
+
+        with patch.dict(os.environ, {**base_env, "ARTICLE_CACHE_BACKEND": "redis"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "ARTICLE_CACHE_BACKEND"):
+                load_settings()
+
+    def test_loads_optional_source_compression_budget(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            self.assertIsNone(load_settings().source_compression_tokens)
+        with patch.dict(os.environ, {**base_env, "SOURCE_COMPRESSION_TOKENS": "12000"}, clear=True):
+            self.assertEqual(12000, load_settings().source_compression_tokens)
+        with patch.dict(os.environ, {**base_env, "SOURCE_COMPRESSION_TOKENS": "0"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "SOURCE_COMPRESSION_TOKENS"):
+                load_settings()
+
+    def test_loads_article_extractor(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            self.assertEqual("auto", load_settings().article_extractor)
+        with patch.dict(os.environ, {**base_env, "ARTICLE_EXTRACTOR": "BS4"}, clear=True):
+            self.assertEqual("bs4", load_settings().article_extractor)
+        with patch.dict(os.environ, {**base_env, "ARTICLE_EXTRACTOR": "regex"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "ARTICLE_EXTRACTOR"):
+                load_settings()
+
+    def test_loads_article_max_bytes(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            self.assertEqual(5 * 1024 * 1024, load_settings().article_max_bytes)
+        with patch.dict(os.environ, {**base_env, "ARTICLE_MAX_BYTES": "1048576"}, clear=True):
+            self.assertEqual(1048576, load_settings().article_max_bytes)
+        with patch.dict(os.environ, {**base_env, "ARTICLE_MAX_BYTES": "0"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "ARTICLE_MAX_BYTES"):
+                load_settings()
+
+    def test_loads_fetch_concurrency_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            settings = load_settings()
+            self.assertEqual((8, 2), (settings.fetch_max_concurrency, settings.fetch_max_per_host))
+            self.assertEqual(60, settings.fetch_budget_sec)
+        env = {
+            **base_env,
+            "FETCH_MAX_CONCURRENCY": "4",
+            "FETCH_MAX_PER_HOST": "1",
+            "FETCH_BUDGET_SEC": "45",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            settings = load_settings()
+            self.assertEqual((4, 1), (settings.fetch_max_concurrency, settings.fetch_max_per_host))
+            self.assertEqual(45, settings.fetch_budget_sec)
+        with patch.dict(os.environ, {**base_env, "FETCH_MAX_PER_HOST": "0"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "FETCH_MAX_PER_HOST"):
+                load_settings()
+
+    def test_loads_rewrite_strategy_settings(self) -> None:
+        base_env = {
+            "MP_BUCKET": "bucket-name",
+            "BEDROCK_MODEL_ID": "us.amazon.nova-lite-v1:0",
+        }
+        with patch.dict(os.environ, base_env, clear=True):
+            defaults = load_settings()
+        self.assertEqual("direct", defaults.rewrite_strategy)
+        self.assertEqual(6000, defaults.rewrite_section_tokens)
+        self.assertEqual(4, defaults.rewrite_max_concurrency)
+
+        with patch.dict(
+            os.environ,
+            {
+                **base_env,
+                "REWRITE_STRATEGY": "Map_Reduce",
+                "REWRITE_SECTION_TOKENS": "3000",
+                "REWRITE_MAX_CONCURRENCY": "8",
+            },
+            clear=True,
+        ):
+            settings = load_settings()
+        self.assertEqual("map_reduce", settings.rewrite_strategy)
+        self.assertEqual(3000, settings.rewrite_section_tokens)
+        self.assertEqual(8, settings.rewrite_max_concurrency)
+
+        with patch.dict(os.environ, {**base_env, "REWRITE_STRATEGY": "outline"}, clear=True):
+            with self.assertRaisesRegex(ConfigError, "REWRITE_STRATEGY"):
+                load_settings()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,13 +14,13 @@ class PipelineEventTests(unittest.TestCase):
 
         with self.assertRaisesRegex(
             EventSchemaError,
-            "exactly one of source_url or source_file_base64",
+            "exactly one of source_url, source_file_base64, or sources",
         ):
             PipelineEvent.from_dict({"job_id": "job-1"}, stage="fetch")
 
         with self.assertRaisesRegex(
             EventSchemaError,
-            "exactly one of source_url or source_file_base64",
+            "exactly one of source_url, source_file_base64, or sources",
         ):
             PipelineEvent.from_dict(
                 {
@@ -91,6 +91,36 @@ class PipelineEventTests(unittest.TestCase):
         self.assertEqual("brief.pdf", event.source_file_name)
         self.assertEqual("aGVsbG8=", event.source_file_base64)
 
+    def test_validates_multi_source_fetch_events(self) -> None:
+        event = PipelineEvent.from_dict(
+            {
+                "job_id": "job-1",
+                "sources": [
+                    {"url": "https://example.com/a", "title": "A"},
+                    {"text": "Pasted notes."},
+                    {"file_name": "brief.pdf", "file_base64": "aGVsbG8="},
+                ],
+            },
+            stage="fetch",
+        )
+
+        self.assertEqual(["url", "text", "file"], [spec.kind for spec in event.sources or ()])
+        self.assertEqual(
+            {"url": "https://example.com/a", "title": "A"}, event.to_dict()["sources"][0]
+        )
+
+        invalid_cases = [
+            ({"sources": []}, "must not be empty"),
+            ({"sources": [{"title": "nothing"}]}, r"sources\[0\]' must include url"),
+            ({"sources": [{"file_base64": "aGVsbG8="}]}, "must include file_name"),
+            ({"sources": [{"text": "a"}], "source_url": "https://x.com"}, "exactly one of"),
+            ({"sources": [{"text": "a"}], "source_text": "b"}, "cannot also include source_text"),
+            ({"sources": [{"text": "a"}] * 21}, "at most 20 entries"),
+        ]
+        for payload, message in invalid_cases:
+            with self.subTest(message=message), self.assertRaisesRegex(EventSchemaError, message):
+                PipelineEvent.from_dict({"job_id": "job-1", **payload}, stage="fetch")
+
     def test_rejects_source_text_with_uploaded_document(self) -> None:
         with self.assertRaisesRegex(EventSchemaError, "cannot also include source_text"):
             PipelineEvent.from_dict(
@@ -137,6 +167,19 @@ class PipelineEventTests(unittest.TestCase):
             generate_event.require_generate_fields(),
         )
 
+        plan_event = PipelineEvent.from_dict(
+            {
+                "job_id": "job-4",
+                "audio_plan_s3_key": "jobs/job-4/chunks/plan.json",
+                "audio_chunk_count": 3,
+            }
+        )
+        self.assertEqual(
+            ("job-4", "jobs/job-4/chunks/plan.json"),
+            plan_event.require_audio_plan_fields(),
+        )
+        self.assertEqual(3, plan_event.to_dict()["audio_chunk_count"])
+
 
 if __name__ == "__main__":
     unittest.main()
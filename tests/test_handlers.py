@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
+import re
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch
+from dataclasses import replace
+from io import BytesIO
+from unittest.mock import ANY, Mock, patch
 
+from podcast_anything import script_pipeline
 from podcast_anything.config import Settings
+from podcast_anything.event_schema import EventSchemaError, PipelineEvent
 from podcast_anything.handlers import fetch_article, generate_audio, rewrite_script
+from podcast_anything.script_outline import ScriptOutlineError
+
+
+def _mp3_frames(count: int) -> bytes:
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples.
+    return (b"\xff\xfb\x90\x44" + bytes(413)) * count
 
 
 class FetchArticleHandlerTests(unittest.TestCase):
@@ -15,7 +29,9 @@ class FetchArticleHandlerTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "job_id"):
             fetch_article.handler({}, None)
 
-        with self.assertRaisesRegex(ValueError, "exactly one of source_url or source_file_base64"):
+        with self.assertRaisesRegex(
+            ValueError, "exactly one of source_url, source_file_base64, or sources"
+        ):
             fetch_article.handler(
                 {
                     "job_id": "job-1",
@@ -29,19 +45,14 @@ class FetchArticleHandlerTests(unittest.TestCase):
     @patch("podcast_anything.handlers.fetch_article.put_text")
     @patch("podcast_anything.handlers.fetch_article.youtube.is_youtube_url", return_value=False)
     @patch(
-        "podcast_anything.handlers.fetch_article.article.extract_text",
+        "podcast_anything.handlers.fetch_article.article_cache.fetch_article_text",
         return_value="clean article text",
     )
-    @patch(
-        "podcast_anything.handlers.fetch_article.article.fetch_html",
-        return_value="<html>...</html>",
-    )
     @patch("podcast_anything.handlers.fetch_article.load_settings")
     def test_fetches_extracts_and_stores_article(
         self,
         mock_settings: Mock,
-        _mock_fetch_html: Mock,
-        _mock_extract_text: Mock,
+        mock_fetch_article_text: Mock,
         _mock_is_youtube_url: Mock,
         mock_put_text: Mock,
     ) -> None:
@@ -59,23 +70,103 @@ class FetchArticleHandlerTests(unittest.TestCase):
         result = fetch_article.handler(event, None)
 
         expected_key = "jobs/job-123/source.txt"
+        mock_fetch_article_text.assert_called_once_with(
+            "https://example.com/post",
+            cache=None,
+            engine="auto",
+            max_bytes=5 * 1024 * 1024,
+            job_id="job-123",
+        )
         mock_put_text.assert_called_once_with("default-bucket", expected_key, "clean article text")
         self.assertEqual("default-bucket", result["bucket"])
         self.assertEqual("article", result["source_type"])
         self.assertEqual(expected_key, result["article_s3_key"])
         self.assertEqual(len("clean article text"), result["article_char_count"])
+        self.assertEqual(4, result["article_token_count"])
+
+    @patch("podcast_anything.handlers.fetch_article.put_text")
+    @patch("podcast_anything.handlers.fetch_article.youtube.is_youtube_url", return_value=False)
+    @patch(
+        "podcast_anything.handlers.fetch_article.article_cache.fetch_article_text",
+        return_value="streamed article text",
+    )
+    @patch("podcast_anything.handlers.fetch_article.load_settings")
+    def test_passes_article_cache_and_extractor_settings(
+        self,
+        mock_settings: Mock,
+        mock_fetch_article_text: Mock,
+        _mock_is_youtube_url: Mock,
+        _mock_put_text: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            article_extractor="stream",
+            article_max_bytes=1024,
+            article_cache_backend="s3",
+        )
+
+        fetch_article.handler({"job_id": "job-123", "source_url": "https://example.com/post"}, None)
+
+        kwargs = mock_fetch_article_text.call_args.kwargs
+        self.assertEqual("stream", kwargs["engine"])
+        self.assertEqual(1024, kwargs["max_bytes"])
+        self.assertEqual("default-bucket", kwargs["cache"].bucket)
+        self.assertEqual("cache/articles/", kwargs["cache"].prefix)
+
+    @patch("podcast_anything.handlers.fetch_article.put_json")
+    @patch("podcast_anything.handlers.fetch_article.put_text")
+    @patch("podcast_anything.multi_source.article_cache.fetch_article_text")
+    @patch("podcast_anything.handlers.fetch_article.load_settings")
+    def test_merges_multiple_sources_and_stores_provenance(
+        self,
+        mock_settings: Mock,
+        mock_fetch_article_text: Mock,
+        mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+        )
+        mock_fetch_article_text.return_value = "article body"
+        event = {
+            "job_id": "job-123",
+            "sources": [
+                {"url": "https://example.com/post", "title": "Post"},
+                {"text": "pasted notes"},
+            ],
+        }
+
+        result = fetch_article.handler(event, None)
+
+        mock_put_text.assert_called_once_with(
+            "default-bucket",
+            "jobs/job-123/source.txt",
+            "[Source 1 of 2: Post]\narticle body\n\n[Source 2 of 2: Provided text]\npasted notes",
+        )
+        sources_key, payload = mock_put_json.call_args.args[1:]
+        self.assertEqual("jobs/job-123/sources.json", sources_key)
+        self.assertEqual(["article", "text"], [s["source_type"] for s in payload["sources"]])
+        self.assertEqual("multi", result["source_type"])
+        self.assertEqual(sources_key, result["sources_s3_key"])
+        self.assertNotIn("sources", result)
 
     @patch("podcast_anything.handlers.fetch_article.put_text")
     @patch(
         "podcast_anything.handlers.fetch_article.document.extract_text_from_bytes",
         return_value=("uploaded document text", "pdf"),
     )
-    @patch("podcast_anything.handlers.fetch_article.article.fetch_html")
+    @patch("podcast_anything.handlers.fetch_article.article_cache.fetch_article_text")
     @patch("podcast_anything.handlers.fetch_article.load_settings")
     def test_extracts_and_stores_uploaded_document(
         self,
         mock_settings: Mock,
-        mock_fetch_html: Mock,
+        mock_fetch_article_text: Mock,
         mock_extract_document: Mock,
         mock_put_text: Mock,
     ) -> None:
@@ -95,7 +186,7 @@ class FetchArticleHandlerTests(unittest.TestCase):
         result = fetch_article.handler(event, None)
 
         mock_extract_document.assert_called_once_with(b"fake-pdf-bytes", "brief.pdf")
-        mock_fetch_html.assert_not_called()
+        mock_fetch_article_text.assert_not_called()
         mock_put_text.assert_called_once_with(
             "default-bucket",
             "jobs/job-doc-1/source.txt",
@@ -129,12 +220,12 @@ class FetchArticleHandlerTests(unittest.TestCase):
         mock_is_youtube_url.assert_called_once_with(event["source_url"])
 
     @patch("podcast_anything.handlers.fetch_article.put_text")
-    @patch("podcast_anything.handlers.fetch_article.article.fetch_html")
+    @patch("podcast_anything.handlers.fetch_article.article_cache.fetch_article_text")
     @patch("podcast_anything.handlers.fetch_article.load_settings")
     def test_uses_provided_source_text_and_skips_remote_fetch(
         self,
         mock_settings: Mock,
-        mock_fetch_html: Mock,
+        mock_fetch_article_text: Mock,
         mock_put_text: Mock,
     ) -> None:
         mock_settings.return_value = Settings(
@@ -151,7 +242,7 @@ class FetchArticleHandlerTests(unittest.TestCase):
 
         result = fetch_article.handler(event, None)
 
-        mock_fetch_html.assert_not_called()
+        mock_fetch_article_text.assert_not_called()
         mock_put_text.assert_called_once_with(
             "default-bucket",
             "jobs/job-yt-2/source.txt",
@@ -183,11 +274,14 @@ class RewriteScriptHandlerTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "job_id and article_s3_key"):
             rewrite_script.handler({"job_id": "job-123"}, None)
 
-    @patch("podcast_anything.handlers.rewrite_script.put_json")
-    @patch("podcast_anything.handlers.rewrite_script.put_text")
-    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="podcast script")
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
     @patch(
-        "podcast_anything.handlers.rewrite_script.build_podcast_prompt", return_value="prompt text"
+        "podcast_anything.handlers.rewrite_script.call_bedrock",
+        return_value="**Host A:** Welcome in.\nHOST_B: Glad to be here.",
+    )
+    @patch(
+        "podcast_anything.script_pipeline.build_podcast_prompt", return_value="prompt text"
     )
     @patch("podcast_anything.handlers.rewrite_script.get_text", return_value="article text")
     @patch("podcast_anything.handlers.rewrite_script.load_settings")
@@ -228,9 +322,15 @@ class RewriteScriptHandlerTests(unittest.TestCase):
             style="podcast",
             source_type="youtube",
             script_mode="duo",
+            target_minutes=8,
+        )
+        mock_call_bedrock.assert_called_once_with(
+            "us.amazon.nova-lite-v1:0", "prompt text", max_tokens=2438, cache_prompt=False
+        )
+        # Label variants are repaired locally before the script is stored.
+        mock_put_text.assert_called_once_with(
+            "default-bucket", script_key, "HOST_A: Welcome in.\nHOST_B: Glad to be here."
         )
-        mock_call_bedrock.assert_called_once_with("us.amazon.nova-lite-v1:0", "prompt text")
-        mock_put_text.assert_called_once_with("default-bucket", script_key, "podcast script")
 
         mock_put_json.assert_called_once()
         put_json_args = mock_put_json.call_args.args
@@ -244,6 +344,299 @@ class RewriteScriptHandlerTests(unittest.TestCase):
         self.assertEqual(script_key, result["script_s3_key"])
         self.assertEqual(metadata_key, result["script_metadata_s3_key"])
 
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="podcast script")
+    @patch(
+        "podcast_anything.script_pipeline.build_podcast_prompt", return_value="prompt text"
+    )
+    @patch(
+        "podcast_anything.script_pipeline.condense_source",
+        return_value="Section 1 notes:\n- fact",
+    )
+    @patch("podcast_anything.handlers.rewrite_script.get_text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_auto_strategy_condenses_long_sources_before_scripting(
+        self,
+        mock_settings: Mock,
+        mock_get_text: Mock,
+        mock_condense: Mock,
+        mock_build_prompt: Mock,
+        _mock_call_bedrock: Mock,
+        _mock_put_text: Mock,
+        _mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            rewrite_strategy="auto",
+            rewrite_section_tokens=10,
+            rewrite_max_concurrency=3,
+        )
+        event = {"job_id": "job-789", "article_s3_key": "jobs/job-789/source.txt"}
+
+        mock_get_text.return_value = "short"
+        rewrite_script.handler(event, None)
+        mock_condense.assert_not_called()
+        self.assertEqual("short", mock_build_prompt.call_args.kwargs["article_text"])
+
+        mock_get_text.return_value = "a much longer source text " * 4
+        rewrite_script.handler(event, None)
+        mock_condense.assert_called_once_with(
+            "a much longer source text " * 4,
+            bucket="default-bucket",
+            job_id="job-789",
+            model_id="us.amazon.nova-lite-v1:0",
+            max_section_tokens=10,
+            max_concurrency=3,
+            title=None,
+            cache_prompt=False,
+        )
+        self.assertEqual(
+            "Section 1 notes:\n- fact", mock_build_prompt.call_args.kwargs["article_text"]
+        )
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="podcast script")
+    @patch("podcast_anything.handlers.rewrite_script.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_routes_by_estimated_source_tokens_and_scales_max_tokens(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_call_bedrock: Mock,
+        _mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
+            polly_voice_id="Joanna",
+            bedrock_model_routes=((8000, "us.amazon.nova-micro-v1:0"),),
+            script_target_minutes=18,
+        )
+        event = {"job_id": "job-1", "article_s3_key": "jobs/job-1/source.txt"}
+
+        with self.assertLogs("podcast_anything.model_routing", level="INFO") as logs:
+            result = rewrite_script.handler({**event, "article_token_count": 5000}, None)
+            rewrite_script.handler({**event, "article_token_count": 90000}, None)
+
+        short_call, long_call = mock_call_bedrock.call_args_list
+        self.assertEqual("us.amazon.nova-micro-v1:0", short_call.args[0])
+        self.assertEqual("anthropic.claude-3-5-sonnet-20241022-v2:0", long_call.args[0])
+        self.assertEqual(4875, short_call.kwargs["max_tokens"])
+        self.assertIn("Aim for 16-20 minutes", short_call.args[1].system)
+        self.assertEqual(["up_to_8000", "default"], [record.route for record in logs.records])
+        self.assertEqual(5000, result["article_token_count"])
+        self.assertEqual(
+            "anthropic.claude-3-5-sonnet-20241022-v2:0",
+            mock_put_json.call_args.args[2]["model_id"],
+        )
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch(
+        "podcast_anything.handlers.rewrite_script.call_bedrock",
+        return_value="HOST_A: Hi.\nHOST_B: Hello.",
+    )
+    @patch("podcast_anything.handlers.rewrite_script.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_reuses_cached_script_for_same_source_style_mode_and_model(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_call_bedrock: Mock,
+        mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            script_cache_backend="local",
+            script_cache_dir=cache_dir.name,
+        )
+        mock_settings.return_value = settings
+        event = {"job_id": "job-1", "article_s3_key": "jobs/job-1/source.txt"}
+
+        rewrite_script.handler(event, None)
+        self.assertFalse(mock_put_json.call_args.args[2]["cache_hit"])
+
+        rewrite_script.handler({**event, "job_id": "job-2"}, None)
+        mock_call_bedrock.assert_called_once()
+        mock_put_text.assert_called_with(
+            "default-bucket", "jobs/job-2/script.txt", "HOST_A: Hi.\nHOST_B: Hello."
+        )
+        self.assertTrue(mock_put_json.call_args.args[2]["cache_hit"])
+
+        rewrite_script.handler({**event, "job_id": "job-3", "script_mode": "duo"}, None)
+        self.assertEqual(2, mock_call_bedrock.call_count)
+
+        mock_settings.return_value = replace(settings, bedrock_model_id="anthropic.claude-3-haiku")
+        rewrite_script.handler({**event, "job_id": "job-4"}, None)
+        self.assertEqual(3, mock_call_bedrock.call_count)
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="podcast script")
+    @patch("podcast_anything.handlers.rewrite_script.get_text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_compresses_source_and_records_stats_in_script_metadata(
+        self,
+        mock_settings: Mock,
+        mock_get_text: Mock,
+        mock_call_bedrock: Mock,
+        _mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            bedrock_model_routes=((60, "us.amazon.nova-micro-v1:0"),),
+            source_compression_tokens=60,
+        )
+        mock_get_text.return_value = "\n\n".join(
+            f"Topic {index} covers tide pools and sea stars. Subscribe for update {index}."
+            for index in range(12)
+        )
+        event = {
+            "job_id": "job-1",
+            "article_s3_key": "jobs/job-1/source.txt",
+            "article_token_count": 200,
+        }
+
+        result = rewrite_script.handler(event, None)
+
+        # The compressed source fits the small-input route.
+        self.assertEqual("us.amazon.nova-micro-v1:0", mock_call_bedrock.call_args.args[0])
+        metadata = mock_put_json.call_args.args[2]
+        compression = metadata["source_compression"]
+        self.assertLessEqual(compression["output_tokens"], 60)
+        self.assertLess(compression["ratio"], 1.0)
+        self.assertIsInstance(metadata["generation_ms"], int)
+        self.assertEqual(200, result["article_token_count"])
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="whole script")
+    @patch("podcast_anything.script_pipeline.write_outlined_script")
+    @patch("podcast_anything.handlers.rewrite_script.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_outline_generation_falls_back_to_one_call_on_bad_outline(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_write_outlined: Mock,
+        mock_call_bedrock: Mock,
+        mock_put_text: Mock,
+        _mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            script_generation="outline",
+            script_segment_count=3,
+            rewrite_max_concurrency=2,
+        )
+        mock_write_outlined.side_effect = ["part one\n\npart two", ScriptOutlineError("bad")]
+        event = {"job_id": "job-1", "article_s3_key": "jobs/job-1/source.txt", "title": "Tides"}
+
+        rewrite_script.handler(event, None)
+        with self.assertLogs(level="WARNING"):
+            rewrite_script.handler({**event, "job_id": "job-2"}, None)
+
+        kwargs = mock_write_outlined.call_args.kwargs
+        self.assertEqual(
+            (3, 2, "Tides"),
+            (kwargs["segment_count"], kwargs["max_concurrency"], kwargs["title"]),
+        )
+        mock_call_bedrock.assert_called_once()
+        self.assertEqual(
+            ["part one\n\npart two", "whole script"],
+            [call.args[2] for call in mock_put_text.call_args_list],
+        )
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.rewrite_script.call_bedrock", return_value="whole script")
+    @patch(
+        "podcast_anything.script_pipeline.write_outlined_script",
+        side_effect=ScriptOutlineError("bad"),
+    )
+    @patch("podcast_anything.handlers.rewrite_script.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.rewrite_script.load_settings")
+    def test_script_cache_key_follows_generation_settings_and_fallback_path(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_write_outlined: Mock,
+        mock_call_bedrock: Mock,
+        _mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Joanna",
+            script_cache_backend="local",
+            script_cache_dir=cache_dir.name,
+            script_generation="outline",
+        )
+        mock_settings.return_value = settings
+        event = {"job_id": "job-1", "article_s3_key": "jobs/job-1/source.txt"}
+
+        # A fallback script is stored under the whole-script key, not the outline key.
+        with self.assertLogs(level="WARNING"):
+            rewrite_script.handler(event, None)
+        with self.assertLogs(level="WARNING"):
+            rewrite_script.handler({**event, "job_id": "job-2"}, None)
+        self.assertEqual(2, mock_write_outlined.call_count)
+        self.assertEqual(2, mock_call_bedrock.call_count)
+        mock_settings.return_value = replace(settings, script_generation="whole")
+        rewrite_script.handler({**event, "job_id": "job-3"}, None)
+        self.assertEqual(2, mock_call_bedrock.call_count)
+        self.assertTrue(mock_put_json.call_args.args[2]["cache_hit"])
+
+        pipeline_event = PipelineEvent.from_dict(event)
+
+        def key(generation: str, input_tokens: int = 100, **changes: object) -> str:
+            return script_pipeline.script_cache_key(
+                pipeline_event,
+                replace(settings, **changes),
+                "model",
+                "article text",
+                input_tokens=input_tokens,
+                generation=generation,
+            )
+
+        self.assertNotEqual(key("outline"), key("outline", script_segment_count=6))
+        self.assertEqual(key("whole"), key("whole", script_segment_count=6))
+        self.assertNotEqual(key("whole"), key("whole", rewrite_strategy="map_reduce"))
+        self.assertNotEqual(
+            key("whole", rewrite_strategy="map_reduce"),
+            key("whole", rewrite_strategy="map_reduce", rewrite_section_tokens=3000),
+        )
+        # ``auto`` keeps a source that fits one section direct, so it shares that key.
+        self.assertEqual(key("whole"), key("whole", rewrite_strategy="auto"))
+        self.assertEqual(
+            key("whole", 9000, rewrite_strategy="map_reduce"),
+            key("whole", 9000, rewrite_strategy="auto"),
+        )
+
 
 class GenerateAudioHandlerTests(unittest.TestCase):
     def test_requires_job_id_and_script_s3_key(self) -> None:
@@ -252,7 +645,7 @@ class GenerateAudioHandlerTests(unittest.TestCase):
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
     @patch(
-        "podcast_anything.handlers.generate_audio.synthesize_speech", return_value=b"audio-bytes"
+        "podcast_anything.handlers.generate_audio.iter_speech_chunks", return_value=[b"audio-bytes"]
     )
     @patch(
         "podcast_anything.handlers.generate_audio.get_text", return_value="one two three four five"
@@ -289,6 +682,9 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             max_text_chars=1800,
             elevenlabs_api_key=None,
             elevenlabs_model_id="eleven_multilingual_v2",
+            max_concurrency=4,
+            cache=None,
+            rate_limiter=ANY,
         )
         mock_put_bytes.assert_called_once_with(
             "default-bucket",
@@ -302,7 +698,7 @@ class GenerateAudioHandlerTests(unittest.TestCase):
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
     @patch(
-        "podcast_anything.handlers.generate_audio.synthesize_speech", return_value=b"audio-bytes"
+        "podcast_anything.handlers.generate_audio.iter_speech_chunks", return_value=[b"audio-bytes"]
     )
     @patch("podcast_anything.handlers.generate_audio.get_text", return_value="script")
     @patch("podcast_anything.handlers.generate_audio.load_settings")
@@ -335,11 +731,14 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             max_text_chars=1800,
             elevenlabs_api_key=None,
             elevenlabs_model_id="eleven_multilingual_v2",
+            max_concurrency=4,
+            cache=None,
+            rate_limiter=ANY,
         )
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
     @patch(
-        "podcast_anything.handlers.generate_audio.synthesize_speech", return_value=b"audio-bytes"
+        "podcast_anything.handlers.generate_audio.iter_speech_chunks", return_value=[b"audio-bytes"]
     )
     @patch("podcast_anything.handlers.generate_audio.get_text", return_value="script")
     @patch("podcast_anything.handlers.generate_audio.load_settings")
@@ -375,10 +774,106 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             max_text_chars=1800,
             elevenlabs_api_key="test-elevenlabs-key",
             elevenlabs_model_id="eleven_multilingual_v2",
+            max_concurrency=4,
+            cache=None,
+            rate_limiter=ANY,
         )
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
-    @patch("podcast_anything.handlers.generate_audio.synthesize_speech")
+    @patch("podcast_anything.handlers.generate_audio.MultipartUpload")
+    @patch("podcast_anything.handlers.generate_audio.iter_speech_chunks")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="script")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_multipart_mode_streams_chunks_into_upload(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_iter_chunks: Mock,
+        mock_upload_cls: Mock,
+        mock_put_bytes: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            audio_upload_mode="multipart",
+        )
+        mock_iter_chunks.return_value = iter([b"chunk-1", b"chunk-2"])
+        upload = mock_upload_cls.return_value.__enter__.return_value
+        event = {"job_id": "job-106", "script_s3_key": "jobs/job-106/script.txt"}
+
+        result = generate_audio.handler(event, None)
+
+        mock_upload_cls.assert_called_once_with(
+            "default-bucket", "jobs/job-106/audio.mp3", content_type="audio/mpeg"
+        )
+        self.assertEqual(
+            [b"chunk-1", b"chunk-2"],
+            [call.args[0] for call in upload.write.call_args_list],
+        )
+        self.assertEqual("Amy", mock_iter_chunks.call_args.kwargs["voice_id"])
+        mock_put_bytes.assert_not_called()
+        self.assertEqual("jobs/job-106/audio.mp3", result["audio_s3_key"])
+
+    @patch("podcast_anything.handlers.generate_audio.update_calibration")
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.handlers.generate_audio.iter_speech_chunks")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="word " * 20)
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_measures_exact_duration_and_calibrates_voice_pace(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_synthesize: Mock,
+        _mock_put_bytes: Mock,
+        mock_update_calibration: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            voice_pace_calibration=True,
+        )
+        mock_synthesize.return_value = [_mp3_frames(300)]
+        mock_update_calibration.return_value = {"polly/Amy": 150.0}
+        event = {"job_id": "job-107", "script_s3_key": "jobs/job-107/script.txt"}
+
+        result = generate_audio.handler(event, None)
+
+        duration_sec = 300 * 1152 / 44100
+        self.assertEqual(round(duration_sec), result["audio_estimated_duration_sec"])
+        bucket, measured = mock_update_calibration.call_args.args
+        self.assertEqual("default-bucket", bucket)
+        self.assertAlmostEqual(20 / duration_sec * 60, measured["polly/Amy"])
+
+    @patch("podcast_anything.handlers.generate_audio.MultipartUpload")
+    @patch("podcast_anything.handlers.generate_audio.iter_speech_chunks")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="script")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_multipart_mode_measures_duration_while_streaming(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_iter_chunks: Mock,
+        _mock_upload_cls: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            audio_upload_mode="multipart",
+        )
+        mock_iter_chunks.return_value = iter([_mp3_frames(200), _mp3_frames(200)])
+        event = {"job_id": "job-108", "script_s3_key": "jobs/job-108/script.txt"}
+
+        result = generate_audio.handler(event, None)
+
+        self.assertEqual(round(400 * 1152 / 44100), result["audio_estimated_duration_sec"])
+
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.tts.boto3.client")
     @patch(
         "podcast_anything.handlers.generate_audio.get_text",
         return_value="HOST_A: hello there\nHOST_B: hi back",
@@ -388,7 +883,7 @@ class GenerateAudioHandlerTests(unittest.TestCase):
         self,
         mock_settings: Mock,
         _mock_get_text: Mock,
-        mock_synthesize: Mock,
+        mock_boto_client: Mock,
         mock_put_bytes: Mock,
     ) -> None:
         mock_settings.return_value = Settings(
@@ -398,7 +893,10 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             polly_voice_id="Amy",
             polly_duo_voice_id="Matthew",
         )
-        mock_synthesize.side_effect = [b"voice-a", b"voice-b"]
+        mock_polly = mock_boto_client.return_value
+        mock_polly.synthesize_speech.side_effect = lambda **kwargs: {
+            "AudioStream": BytesIO(f"[{kwargs['VoiceId']}]".encode())
+        }
         event = {
             "job_id": "job-103",
             "script_s3_key": "jobs/job-103/script.txt",
@@ -407,22 +905,18 @@ class GenerateAudioHandlerTests(unittest.TestCase):
 
         result = generate_audio.handler(event, None)
 
-        self.assertEqual(2, mock_synthesize.call_count)
-        first_call = mock_synthesize.call_args_list[0].kwargs
-        second_call = mock_synthesize.call_args_list[1].kwargs
-        self.assertEqual("Amy", first_call["voice_id"])
-        self.assertEqual("Matthew", second_call["voice_id"])
-        self.assertEqual("polly", first_call["provider"])
+        self.assertEqual(2, mock_polly.synthesize_speech.call_count)
+        self.assertEqual("polly", mock_boto_client.call_args.args[0])
         mock_put_bytes.assert_called_once_with(
             "default-bucket",
             "jobs/job-103/audio.mp3",
-            b"voice-avoice-b",
+            b"[Amy][Matthew]",
             content_type="audio/mpeg",
         )
         self.assertEqual("jobs/job-103/audio.mp3", result["audio_s3_key"])
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
-    @patch("podcast_anything.handlers.generate_audio.synthesize_speech")
+    @patch("podcast_anything.tts.boto3.client")
     @patch(
         "podcast_anything.handlers.generate_audio.get_text",
         return_value="HOST_A: hello there\nHOST_B: hi back",
@@ -432,8 +926,8 @@ class GenerateAudioHandlerTests(unittest.TestCase):
         self,
         mock_settings: Mock,
         _mock_get_text: Mock,
-        mock_synthesize: Mock,
-        _mock_put_bytes: Mock,
+        mock_boto_client: Mock,
+        mock_put_bytes: Mock,
     ) -> None:
         mock_settings.return_value = Settings(
             bucket="default-bucket",
@@ -442,7 +936,9 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             polly_voice_id="Amy",
             polly_duo_voice_id="Matthew",
         )
-        mock_synthesize.side_effect = [b"voice-a", b"voice-b"]
+        mock_boto_client.return_value.synthesize_speech.side_effect = lambda **kwargs: {
+            "AudioStream": BytesIO(f"[{kwargs['VoiceId']}]".encode())
+        }
         event = {
             "job_id": "job-104",
             "script_s3_key": "jobs/job-104/script.txt",
@@ -453,13 +949,143 @@ class GenerateAudioHandlerTests(unittest.TestCase):
 
         generate_audio.handler(event, None)
 
-        first_call = mock_synthesize.call_args_list[0].kwargs
-        second_call = mock_synthesize.call_args_list[1].kwargs
-        self.assertEqual("Joanna", first_call["voice_id"])
-        self.assertEqual("Ruth", second_call["voice_id"])
+        self.assertEqual(b"[Joanna][Ruth]", mock_put_bytes.call_args.args[2])
 
     @patch("podcast_anything.handlers.generate_audio.put_bytes")
-    @patch("podcast_anything.handlers.generate_audio.synthesize_speech")
+    @patch("podcast_anything.tts.boto3.client")
+    @patch("podcast_anything.handlers.generate_audio.get_text")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_duo_turns_share_one_pool_and_keep_turn_order(
+        self,
+        mock_settings: Mock,
+        mock_get_text: Mock,
+        mock_boto_client: Mock,
+        mock_put_bytes: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            polly_duo_voice_id="Matthew",
+            tts_max_concurrency=4,
+        )
+        speakers = ["HOST_A", "HOST_B"] * 4
+        mock_get_text.return_value = "\n".join(
+            f"{speaker}: turn{index} says hello" for index, speaker in enumerate(speakers)
+        )
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_synthesize(**kwargs: str) -> dict[str, BytesIO]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            marker = re.search(r"turn(\d+)", kwargs["Text"]).group(1)
+            # Earlier turns finish last so completion order differs from turn order.
+            time.sleep(0.005 * (8 - int(marker)))
+            with lock:
+                active -= 1
+            return {"AudioStream": BytesIO(f"[{marker}:{kwargs['VoiceId']}]".encode())}
+
+        mock_boto_client.return_value.synthesize_speech.side_effect = fake_synthesize
+        event = {
+            "job_id": "job-107",
+            "script_s3_key": "jobs/job-107/script.txt",
+            "script_mode": "duo",
+        }
+
+        generate_audio.handler(event, None)
+
+        expected = "".join(
+            f"[{index}:{'Amy' if speaker == 'HOST_A' else 'Matthew'}]"
+            for index, speaker in enumerate(speakers)
+        )
+        self.assertEqual(expected.encode(), mock_put_bytes.call_args.args[2])
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 4)
+
+    def test_duo_planner_coalesces_same_speaker_turns(self) -> None:
+        long_a1 = "Host A opens the episode with a longer remark."
+        long_a2 = "Host A keeps going with a second longer remark."
+        long_a3 = "Host A adds a third thought that is long enough."
+        turns = [
+            ("HOST_A", long_a1),
+            ("HOST_A", long_a2),
+            ("HOST_B", "Right."),
+            ("HOST_B", "Exactly!"),
+            ("HOST_A", long_a3),
+        ]
+
+        planned = generate_audio._plan_duo_requests(turns)
+
+        self.assertEqual(
+            [
+                ("HOST_A", f"{long_a1}\n{long_a2}", 0, 2, False),
+                ("HOST_B", "Right.", 2, 1, True),
+                ("HOST_B", "Exactly!", 3, 1, True),
+                ("HOST_A", long_a3, 4, 1, False),
+            ],
+            [
+                (r.speaker, r.text, r.first_turn, r.turn_count, r.interjection)
+                for r in planned
+            ],
+        )
+        capped = generate_audio._plan_duo_requests(turns[:2], max_text_chars=len(long_a1) + 5)
+        self.assertEqual(2, len(capped))
+
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.tts.boto3.client")
+    @patch("podcast_anything.handlers.generate_audio.get_text")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_duo_repeated_interjections_are_synthesized_once(
+        self,
+        mock_settings: Mock,
+        mock_get_text: Mock,
+        mock_boto_client: Mock,
+        mock_put_bytes: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            polly_duo_voice_id="Matthew",
+        )
+        mock_get_text.return_value = "\n".join(
+            [
+                "HOST_A: The first point is a long sentence about the topic.",
+                "HOST_A: And a second long sentence continues the same thought.",
+                "HOST_B: Right.",
+                "HOST_A: Then a third long sentence moves the story along.",
+                "HOST_B: Right.",
+                "HOST_B: Exactly!",
+            ]
+        )
+        mock_polly = mock_boto_client.return_value
+        def fake_synthesize(**kwargs: str) -> dict[str, BytesIO]:
+            spoken = re.sub(r"<[^>]+>", "", kwargs["Text"])
+            return {"AudioStream": BytesIO(f"[{kwargs['VoiceId']}:{spoken[:5]}]".encode())}
+
+        mock_polly.synthesize_speech.side_effect = fake_synthesize
+        event = {
+            "job_id": "job-108",
+            "script_s3_key": "jobs/job-108/script.txt",
+            "script_mode": "duo",
+        }
+
+        generate_audio.handler(event, None)
+
+        self.assertEqual(4, mock_polly.synthesize_speech.call_count)
+        self.assertEqual(
+            b"[Amy:The f][Matthew:Right][Amy:Then ][Matthew:Right][Matthew:Exact]",
+            mock_put_bytes.call_args.args[2],
+        )
+
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.handlers.generate_audio.iter_speech_chunks")
     @patch(
         "podcast_anything.handlers.generate_audio.get_text",
         return_value="No speaker labels here",
@@ -489,5 +1115,375 @@ class GenerateAudioHandlerTests(unittest.TestCase):
             generate_audio.handler(event, None)
 
 
+class GenerateAudioFanOutHandlerTests(unittest.TestCase):
+    def _settings(self, **overrides) -> Settings:
+        return Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            polly_duo_voice_id="Matthew",
+            **overrides,
+        )
+
+    @patch("podcast_anything.handlers.generate_audio.put_json")
+    @patch(
+        "podcast_anything.handlers.generate_audio.get_text",
+        return_value="HOST_A: hello there\nHOST_B: hi back",
+    )
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_plan_handler_writes_plan_and_returns_map_items(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = self._settings()
+        event = {
+            "job_id": "job-201",
+            "script_s3_key": "jobs/job-201/script.txt",
+            "script_mode": "duo",
+        }
+
+        result = generate_audio.plan_handler(event, None)
+
+        bucket, plan_key, plan = mock_put_json.call_args.args
+        self.assertEqual("default-bucket", bucket)
+        self.assertEqual("jobs/job-201/chunks/plan.json", plan_key)
+        self.assertEqual(["HOST_A", "HOST_B"], [chunk["speaker"] for chunk in plan["chunks"]])
+        self.assertEqual(["Amy", "Matthew"], [chunk["voice_id"] for chunk in plan["chunks"]])
+        self.assertTrue(plan["chunks"][0]["s3_key"].startswith("jobs/job-201/chunks/"))
+        self.assertEqual(plan_key, result["audio_plan_s3_key"])
+        self.assertEqual(2, result["audio_chunk_count"])
+        self.assertEqual([{"chunk_index": 0}, {"chunk_index": 1}], result["audio_chunk_items"])
+
+    @patch("podcast_anything.handlers.generate_audio.put_json")
+    @patch(
+        "podcast_anything.handlers.generate_audio.load_calibration",
+        return_value={"polly/Amy": 60.0},
+    )
+    @patch(
+        "podcast_anything.handlers.generate_audio.get_text",
+        return_value="HOST_A: one two three four five\nHOST_B: six seven eight nine ten",
+    )
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_plan_handler_estimates_chunk_duration_from_calibrated_pace(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        _mock_load_calibration: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = self._settings(voice_pace_calibration=True)
+        event = {
+            "job_id": "job-206",
+            "script_s3_key": "jobs/job-206/script.txt",
+            "script_mode": "duo",
+        }
+
+        result = generate_audio.plan_handler(event, None)
+
+        plan = mock_put_json.call_args.args[2]
+        # Amy is calibrated at 60 wpm; Matthew falls back to the 150 wpm default.
+        self.assertEqual([5, 2], [chunk["estimated_duration_sec"] for chunk in plan["chunks"]])
+        self.assertEqual(7, result["audio_estimated_duration_sec"])
+
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.handlers.generate_audio.synthesize_speech", return_value=b"audio")
+    @patch("podcast_anything.handlers.generate_audio.object_exists", return_value=False)
+    @patch("podcast_anything.handlers.generate_audio.get_json")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_chunk_handler_synthesizes_planned_chunk(
+        self,
+        mock_settings: Mock,
+        mock_get_json: Mock,
+        _mock_exists: Mock,
+        mock_synthesize: Mock,
+        mock_put_bytes: Mock,
+    ) -> None:
+        mock_settings.return_value = self._settings()
+        mock_get_json.return_value = {
+            "chunks": [
+                {"index": 0, "speaker": None, "voice_id": "Amy", "text": "one", "s3_key": "k0"},
+                {"index": 1, "speaker": None, "voice_id": "Amy", "text": "two", "s3_key": "k1"},
+            ]
+        }
+        event = {
+            "job_id": "job-202",
+            "bucket": "default-bucket",
+            "audio_plan_s3_key": "jobs/job-202/chunks/plan.json",
+            "chunk_index": 1,
+        }
+
+        result = generate_audio.chunk_handler(event, None)
+
+        self.assertEqual("two", mock_synthesize.call_args.args[0])
+        self.assertEqual("Amy", mock_synthesize.call_args.kwargs["voice_id"])
+        mock_put_bytes.assert_called_once_with(
+            "default-bucket", "k1", b"audio", content_type="audio/mpeg"
+        )
+        self.assertFalse(result["skipped"])
+
+    @patch("podcast_anything.handlers.generate_audio.synthesize_speech")
+    @patch("podcast_anything.handlers.generate_audio.object_exists", return_value=True)
+    @patch("podcast_anything.handlers.generate_audio.get_json")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_chunk_handler_skips_existing_chunk(
+        self,
+        mock_settings: Mock,
+        mock_get_json: Mock,
+        _mock_exists: Mock,
+        mock_synthesize: Mock,
+    ) -> None:
+        mock_settings.return_value = self._settings()
+        mock_get_json.return_value = {
+            "chunks": [{"index": 0, "speaker": None, "voice_id": "Amy", "text": "x", "s3_key": "k"}]
+        }
+        event = {
+            "job_id": "job-203",
+            "audio_plan_s3_key": "jobs/job-203/chunks/plan.json",
+            "chunk_index": 0,
+        }
+
+        result = generate_audio.chunk_handler(event, None)
+
+        mock_synthesize.assert_not_called()
+        self.assertTrue(result["skipped"])
+
+    def test_chunk_handler_requires_chunk_index(self) -> None:
+        event = {"job_id": "job-204", "audio_plan_s3_key": "jobs/job-204/chunks/plan.json"}
+
+        with self.assertRaisesRegex(EventSchemaError, "chunk_index"):
+            generate_audio.chunk_handler(event, None)
+
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.handlers.generate_audio.get_bytes")
+    @patch("podcast_anything.handlers.generate_audio.get_json")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_assemble_handler_concatenates_chunks_in_plan_order(
+        self,
+        mock_settings: Mock,
+        mock_get_json: Mock,
+        mock_get_bytes: Mock,
+        mock_put_bytes: Mock,
+    ) -> None:
+        mock_settings.return_value = self._settings()
+        mock_get_json.return_value = {
+            "chunks": [
+                {"index": 0, "voice_id": "Amy", "text": "one two", "s3_key": "k0"},
+                {"index": 1, "voice_id": "Amy", "text": "three", "s3_key": "k1"},
+            ]
+        }
+        mock_get_bytes.side_effect = lambda _bucket, key: {"k0": b"A", "k1": b"B"}[key]
+        event = {
+            "job_id": "job-205",
+            "audio_plan_s3_key": "jobs/job-205/chunks/plan.json",
+            "audio_chunk_count": 2,
+            "audio_chunk_items": [{"chunk_index": 0}, {"chunk_index": 1}],
+        }
+
+        result = generate_audio.assemble_handler(event, None)
+
+        mock_put_bytes.assert_called_once_with(
+            "default-bucket", "jobs/job-205/audio.mp3", b"AB", content_type="audio/mpeg"
+        )
+        self.assertEqual("jobs/job-205/audio.mp3", result["audio_s3_key"])
+        self.assertNotIn("audio_chunk_items", result)
+
+
+class GenerateAudioStreamingHandlerTests(unittest.TestCase):
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.tts.boto3.client")
+    @patch("podcast_anything.handlers.generate_audio.stream_bedrock")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_synthesizes_turns_while_script_streams_then_stores_script(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_stream_bedrock: Mock,
+        mock_boto_client: Mock,
+        mock_put_bytes: Mock,
+        mock_put_text: Mock,
+        mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            polly_duo_voice_id="Matthew",
+        )
+        first_request = threading.Event()
+        overlap: list[bool] = []
+
+        def deltas():
+            # Label variants and headings are repaired line by line as they stream.
+            yield "## Intro\n**Host A:** hello "
+            yield "there\nHost B - hi back, and glad to be on the show again today\n"
+            # Hold the rest of the script until the first turn is already being voiced.
+            overlap.append(first_request.wait(timeout=5))
+            yield "HOST_B: and here is a second thought from the same host\nHOST_A: bye"
+
+        spoken: list[str] = []
+
+        def synthesize(**kwargs):
+            first_request.set()
+            spoken.append(re.sub(r"<[^>]+>", "", kwargs["Text"]))
+            return {"AudioStream": BytesIO(f"[{kwargs['VoiceId']}]".encode())}
+
+        mock_stream_bedrock.return_value = deltas()
+        mock_boto_client.return_value.synthesize_speech.side_effect = synthesize
+        event = {
+            "job_id": "job-301",
+            "article_s3_key": "jobs/job-301/source.txt",
+            "script_mode": "duo",
+        }
+
+        result = generate_audio.streaming_handler(event, None)
+
+        self.assertEqual([True], overlap)
+        # Consecutive turns by one host are coalesced into one request, as in GenerateAudio.
+        self.assertEqual(3, len(spoken))
+        self.assertIn("glad to be on the show again today", spoken[1])
+        self.assertIn("a second thought from the same host", spoken[1])
+        mock_put_bytes.assert_called_once_with(
+            "default-bucket",
+            "jobs/job-301/audio.mp3",
+            b"[Amy][Matthew][Amy]",
+            content_type="audio/mpeg",
+        )
+        mock_put_text.assert_called_once_with(
+            "default-bucket",
+            "jobs/job-301/script.txt",
+            "HOST_A: hello there\nHOST_B: hi back, and glad to be on the show again today\n"
+            "HOST_B: and here is a second thought from the same host\nHOST_A: bye",
+        )
+        self.assertEqual("jobs/job-301/script.json", mock_put_json.call_args.args[1])
+        # script.json and the output carry the same fields as the rewrite step's.
+        self.assertIsInstance(mock_put_json.call_args.args[2]["generation_ms"], int)
+        self.assertEqual(3, result["article_token_count"])
+        self.assertEqual("jobs/job-301/script.txt", result["script_s3_key"])
+        self.assertEqual("jobs/job-301/audio.mp3", result["audio_s3_key"])
+
+    @patch("podcast_anything.handlers.generate_audio.update_calibration")
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.tts.boto3.client")
+    @patch("podcast_anything.handlers.generate_audio.stream_bedrock")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_streamed_audio_calibrates_voice_pace(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_stream_bedrock: Mock,
+        mock_boto_client: Mock,
+        _mock_put_bytes: Mock,
+        _mock_put_text: Mock,
+        _mock_put_json: Mock,
+        mock_update_calibration: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            voice_pace_calibration=True,
+        )
+        mock_stream_bedrock.return_value = iter(["word " * 10, "word " * 10 + "end."])
+        mock_boto_client.return_value.synthesize_speech.side_effect = lambda **_kwargs: {
+            "AudioStream": BytesIO(_mp3_frames(300))
+        }
+        mock_update_calibration.return_value = {"polly/Amy": 150.0}
+        event = {"job_id": "job-303", "article_s3_key": "jobs/job-303/source.txt"}
+
+        result = generate_audio.streaming_handler(event, None)
+
+        request_count = mock_boto_client.return_value.synthesize_speech.call_count
+        duration_sec = request_count * 300 * 1152 / 44100
+        self.assertEqual(round(duration_sec), result["audio_estimated_duration_sec"])
+        _, measured = mock_update_calibration.call_args.args
+        self.assertAlmostEqual(21 / duration_sec * 60, measured["polly/Amy"])
+
+    @patch("podcast_anything.script_pipeline.put_json")
+    @patch("podcast_anything.script_pipeline.put_text")
+    @patch("podcast_anything.handlers.generate_audio.put_bytes")
+    @patch("podcast_anything.tts.boto3.client")
+    @patch("podcast_anything.handlers.generate_audio.stream_bedrock")
+    @patch("podcast_anything.handlers.generate_audio.get_text", return_value="article text")
+    @patch("podcast_anything.handlers.generate_audio.load_settings")
+    def test_retry_with_checkpoints_replays_the_streamed_script(
+        self,
+        mock_settings: Mock,
+        _mock_get_text: Mock,
+        mock_stream_bedrock: Mock,
+        mock_boto_client: Mock,
+        mock_put_bytes: Mock,
+        mock_put_text: Mock,
+        _mock_put_json: Mock,
+    ) -> None:
+        mock_settings.return_value = Settings(
+            bucket="default-bucket",
+            region="us-east-1",
+            bedrock_model_id="us.amazon.nova-lite-v1:0",
+            polly_voice_id="Amy",
+            polly_duo_voice_id="Matthew",
+            audio_checkpoints=True,
+        )
+        objects: dict[str, bytes] = {}
+
+        def list_objects(_bucket: str, prefix: str) -> list[dict]:
+            return [
+                {"Key": key, "Size": len(data)}
+                for key, data in objects.items()
+                if key.startswith(prefix)
+            ]
+
+        for name, stub in {
+            "list_objects": list_objects,
+            "get_bytes_if_exists": lambda _bucket, key: (
+                (objects[key], None) if key in objects else None
+            ),
+            "put_bytes": lambda _bucket, key, data, content_type: objects.__setitem__(key, data),
+        }.items():
+            patcher = patch(f"podcast_anything.checkpoint.s3.{name}", stub)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        voiced: list[str] = []
+
+        def synthesize(**kwargs):
+            voiced.append(kwargs["VoiceId"])
+            if voiced == ["Amy", "Matthew"]:
+                raise RuntimeError("tts failed")
+            return {"AudioStream": BytesIO(f"[{kwargs['VoiceId']}]".encode())}
+
+        mock_stream_bedrock.return_value = iter(["HOST_A: hello there\n", "HOST_B: hi back"])
+        mock_boto_client.return_value.synthesize_speech.side_effect = synthesize
+        event = {
+            "job_id": "job-302",
+            "article_s3_key": "jobs/job-302/source.txt",
+            "script_mode": "duo",
+        }
+
+        with self.assertRaisesRegex(RuntimeError, "tts failed"):
+            generate_audio.streaming_handler(event, None)
+        result = generate_audio.streaming_handler(event, None)
+
+        # The retry neither calls Bedrock again nor re-voices the completed first turn.
+        mock_stream_bedrock.assert_called_once()
+        self.assertEqual(["Amy", "Matthew", "Matthew"], voiced)
+        mock_put_bytes.assert_called_once_with(
+            "default-bucket", "jobs/job-302/audio.mp3", b"[Amy][Matthew]", content_type="audio/mpeg"
+        )
+        mock_put_text.assert_called_once_with(
+            "default-bucket", "jobs/job-302/script.txt", "HOST_A: hello there\nHOST_B: hi back"
+        )
+        self.assertEqual("jobs/job-302/audio.mp3", result["audio_s3_key"])
+
+
 if __name__ == "__main__":
     unittest.main()
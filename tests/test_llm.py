@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import json
 import unittest
+from io import BytesIO
+from typing import Iterator
 from unittest.mock import Mock, patch
 
-from podcast_anything.llm import LLMError, build_podcast_prompt, call_bedrock
+from podcast_anything.llm import (
+    LLMError,
+    Prompt,
+    ScriptStream,
+    build_podcast_prompt,
+    call_bedrock,
+    estimate_tokens,
+    iter_script_segments,
+    stream_bedrock,
+)
+
+
+def _stream_response(*payloads: dict) -> dict:
+    return {"body": [{"chunk": {"bytes": json.dumps(payload).encode()}} for payload in payloads]}
 
 
 class CallBedrockRoutingTests(unittest.TestCase):
@@ -25,6 +41,7 @@ class CallBedrockRoutingTests(unittest.TestCase):
                     "prompt",
                     max_tokens=1400,
                     temperature=0.5,
+                    cache_prompt=False,
                 )
 
     @patch("podcast_anything.llm.call_bedrock_nova", return_value="nova-text")
@@ -50,6 +67,174 @@ class CallBedrockRoutingTests(unittest.TestCase):
             call_bedrock("meta.llama3-8b-instruct-v1:0", "prompt")
 
 
+class PromptCachingTests(unittest.TestCase):
+    @patch("podcast_anything.llm.boto3.client")
+    def test_leaves_a_per_job_source_unmarked_and_logs_cache_tokens(
+        self, mock_client: Mock
+    ) -> None:
+        response_body = {
+            "content": [{"type": "text", "text": "script"}],
+            "usage": {
+                "input_tokens": 40,
+                "output_tokens": 900,
+                "cache_read_input_tokens": 1200,
+                "cache_creation_input_tokens": 0,
+            },
+        }
+        mock_client.return_value.invoke_model.return_value = {
+            "body": BytesIO(json.dumps(response_body).encode())
+        }
+        # The instructions alone are below the cacheable minimum, and the source after them
+        # is read by this call only, so nothing is marked.
+        prompt = build_podcast_prompt(article_text="source text " * 600, script_mode="single")
+
+        with self.assertLogs("podcast_anything.llm", level="INFO") as logs:
+            result = call_bedrock(
+                "anthropic.claude-3-5-haiku-20241022-v1:0", prompt, cache_prompt=True
+            )
+
+        self.assertEqual("script", result)
+        body = json.loads(mock_client.return_value.invoke_model.call_args.kwargs["body"])
+        self.assertEqual([{"type": "text", "text": prompt.system}], body["system"])
+        self.assertEqual(
+            [{"type": "text", "text": prompt.content}], body["messages"][0]["content"]
+        )
+        self.assertEqual(1200, logs.records[0].cache_read_tokens)
+        self.assertEqual(0, logs.records[0].cache_write_tokens)
+
+    @patch("podcast_anything.llm.boto3.client")
+    def test_marks_a_long_shared_system_block_and_skips_short_prompts(
+        self, mock_client: Mock
+    ) -> None:
+        mock_client.return_value.invoke_model.side_effect = lambda **_kwargs: {
+            "body": BytesIO(json.dumps({"content": [{"text": "part"}]}).encode())
+        }
+        shared = Prompt(system="outline and source " * 600, content="Write part 2.")
+        short = build_podcast_prompt(article_text="source text")
+
+        call_bedrock("anthropic.claude-3-5-haiku-20241022-v1:0", shared, cache_prompt=True)
+        call_bedrock("anthropic.claude-3-5-haiku-20241022-v1:0", short, cache_prompt=True)
+
+        calls = mock_client.return_value.invoke_model.call_args_list
+        shared_body = json.loads(calls[0].kwargs["body"])
+        short_body = json.loads(calls[1].kwargs["body"])
+        self.assertEqual({"type": "ephemeral"}, shared_body["system"][0]["cache_control"])
+        self.assertNotIn("cache_control", shared_body["messages"][0]["content"][0])
+        self.assertNotIn("cache_control", json.dumps(short_body))
+
+    @patch("podcast_anything.llm.boto3.client")
+    def test_plain_prompts_and_nova_bodies_carry_no_cache_markers(self, mock_client: Mock) -> None:
+        mock_client.return_value.invoke_model.side_effect = [
+            {"body": BytesIO(json.dumps({"content": [{"text": "a"}]}).encode())},
+            {
+                "body": BytesIO(
+                    json.dumps({"output": {"message": {"content": [{"text": "b"}]}}}).encode()
+                )
+            },
+        ]
+        prompt = build_podcast_prompt(article_text="source text")
+
+        call_bedrock("anthropic.claude-3-haiku-20240307-v1:0", "prompt")
+        call_bedrock("us.amazon.nova-lite-v1:0", prompt, cache_prompt=True)
+
+        calls = mock_client.return_value.invoke_model.call_args_list
+        anthropic_body = json.loads(calls[0].kwargs["body"])
+        nova_body = json.loads(calls[1].kwargs["body"])
+        self.assertNotIn("system", anthropic_body)
+        self.assertEqual([{"text": prompt.system}], nova_body["system"])
+        self.assertNotIn("cache", json.dumps(nova_body))
+
+
+class StreamBedrockTests(unittest.TestCase):
+    @patch("podcast_anything.llm.boto3.client")
+    def test_yields_anthropic_text_deltas(self, mock_client: Mock) -> None:
+        mock_client.return_value.invoke_model_with_response_stream.return_value = (
+            _stream_response(
+                {"type": "message_start"},
+                {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hel"}},
+                {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "lo."}},
+                {"type": "message_stop"},
+            )
+        )
+
+        deltas = list(stream_bedrock("anthropic.claude-3-haiku-20240307-v1:0", "prompt"))
+
+        self.assertEqual(["Hel", "lo."], deltas)
+
+    @patch("podcast_anything.llm.boto3.client")
+    def test_yields_nova_text_deltas(self, mock_client: Mock) -> None:
+        mock_client.return_value.invoke_model_with_response_stream.return_value = (
+            _stream_response(
+                {"messageStart": {"role": "assistant"}},
+                {"contentBlockDelta": {"delta": {"text": "Hi"}, "contentBlockIndex": 0}},
+                {"messageStop": {"stopReason": "end_turn"}},
+            )
+        )
+
+        self.assertEqual(["Hi"], list(stream_bedrock("us.amazon.nova-lite-v1:0", "prompt")))
+
+    @patch("podcast_anything.llm.boto3.client")
+    def test_raises_on_mid_stream_error_event(self, mock_client: Mock) -> None:
+        mock_client.return_value.invoke_model_with_response_stream.return_value = {
+            "body": [{"modelStreamErrorException": {"message": "boom"}}]
+        }
+
+        with self.assertRaisesRegex(LLMError, "modelStreamErrorException"):
+            list(stream_bedrock("us.amazon.nova-lite-v1:0", "prompt"))
+
+
+class ScriptSegmentTests(unittest.TestCase):
+    def test_duo_mode_emits_each_line_once_complete(self) -> None:
+        deltas = ["HOST_A: Hel", "lo there.\nHOST_", "B: Hi!\n", "HOST_A: Bye."]
+
+        segments = list(iter_script_segments(deltas, script_mode="duo"))
+
+        self.assertEqual(["HOST_A: Hello there.", "HOST_B: Hi!", "HOST_A: Bye."], segments)
+
+    def test_single_mode_cuts_at_first_sentence_end_after_min_chars(self) -> None:
+        deltas = ["Pi is 3.", "14 and more. ", "Second sentence. ", "Tail"]
+
+        segments = list(iter_script_segments(deltas, script_mode="single", min_chars=10))
+
+        self.assertEqual(["Pi is 3.14 and more.", "Second sentence.", "Tail"], segments)
+
+    def test_script_stream_yields_segments_and_keeps_full_text(self) -> None:
+        script = ScriptStream(iter(["HOST_A: one\n", "HOST_B: two"]), script_mode="duo")
+
+        self.assertEqual(["HOST_A: one", "HOST_B: two"], list(script))
+        self.assertEqual("HOST_A: one\nHOST_B: two", script.text)
+
+    def test_script_stream_reports_the_full_script_when_the_stream_ends(self) -> None:
+        completed: list[str] = []
+        script = ScriptStream(
+            iter(["HOST_A: one\n", "HOST_B: two"]), script_mode="duo", on_complete=completed.append
+        )
+
+        self.assertEqual(["HOST_A: one", "HOST_B: two"], list(script))
+        self.assertEqual(["HOST_A: one\nHOST_B: two"], completed)
+
+    def test_script_stream_reraises_stream_errors(self) -> None:
+        def failing() -> Iterator[str]:
+            yield "HOST_A: partial\n"
+            raise LLMError("stream broke")
+
+        script = ScriptStream(failing(), script_mode="duo")
+
+        with self.assertRaisesRegex(LLMError, "stream broke"):
+            list(script)
+
+
+class EstimateTokensTests(unittest.TestCase):
+    def test_counts_words_punctuation_and_long_words(self) -> None:
+        self.assertEqual(0, estimate_tokens(""))
+        self.assertEqual(4, estimate_tokens("Hello, world!"))
+        # Words longer than six characters count one token per started six characters.
+        self.assertEqual(4, estimate_tokens("internationalization"))
+
+    def test_counts_non_ascii_text_per_character(self) -> None:
+        self.assertEqual(8, estimate_tokens("東京は日本の首都"))
+
+
 class BuildPodcastPromptTests(unittest.TestCase):
     def test_builds_duo_script_prompt_with_host_labels(self) -> None:
         prompt = build_podcast_prompt(
@@ -60,10 +245,22 @@ class BuildPodcastPromptTests(unittest.TestCase):
             script_mode="duo",
         )
 
-        self.assertIn("two-host podcast dialogue", prompt)
-        self.assertIn("HOST_A:", prompt)
-        self.assertIn("HOST_B:", prompt)
-        self.assertIn("Script Mode: duo", prompt)
+        self.assertIn("two-host podcast dialogue", prompt.system)
+        self.assertIn("HOST_A:", prompt.system)
+        self.assertIn("HOST_B:", prompt.system)
+        self.assertIn("Script Mode: duo", prompt.content)
+        self.assertNotIn("source text", prompt.system)
+        self.assertTrue(str(prompt).endswith("source text"))
+
+    def test_instructions_do_not_vary_with_job_inputs(self) -> None:
+        first = build_podcast_prompt(article_text="one", title="A", style="news")
+        second = build_podcast_prompt(article_text="two", title="B", source_type="youtube")
+
+        self.assertEqual(first.system, second.system)
+        self.assertNotEqual(first.content, second.content)
+        self.assertIn("Aim for 6-10 minutes", first.system)
+        longer = build_podcast_prompt(article_text="one", target_minutes=20)
+        self.assertIn("Aim for 18-22 minutes", longer.system)
 
     def test_rejects_unknown_script_mode(self) -> None:
         with self.assertRaisesRegex(LLMError, "script_mode"):
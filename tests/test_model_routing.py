@@ -0,0 +1,78 @@
+"""Unit tests for rewrite model routing and output budgets."""
+
+from __future__ import annotations
+
+import unittest
+
+from podcast_anything.model_routing import (
+    ModelRoute,
+    log_route_latency,
+    output_token_limit,
+    script_max_tokens,
+    select_route,
+)
+
+_ROUTES = ((60000, "us.amazon.nova-lite-v1:0"), (8000, "us.amazon.nova-micro-v1:0"))
+
+
+class SelectRouteTests(unittest.TestCase):
+    def test_picks_smallest_route_covering_the_input(self) -> None:
+        self.assertEqual(
+            ModelRoute("us.amazon.nova-micro-v1:0", 8000), select_route(_ROUTES, "big", 8000)
+        )
+        self.assertEqual(
+            ModelRoute("us.amazon.nova-lite-v1:0", 60000), select_route(_ROUTES, "big", 8001)
+        )
+
+    def test_falls_back_to_default_model_above_every_limit(self) -> None:
+        route = select_route(_ROUTES, "anthropic.claude-3-5-sonnet", 200000)
+
+        self.assertEqual("anthropic.claude-3-5-sonnet", route.model_id)
+        self.assertEqual("default", route.name)
+        self.assertEqual("default", select_route((), "model", 10).name)
+
+
+class ScriptMaxTokensTests(unittest.TestCase):
+    def test_scales_with_target_episode_length(self) -> None:
+        # 8 minutes asks for 6-10 minutes: 10 min * 150 wpm * 1.3 tokens/word * 1.25 headroom.
+        self.assertEqual(2438, script_max_tokens(8))
+        self.assertGreater(script_max_tokens(20), 2 * script_max_tokens(8))
+        self.assertLess(script_max_tokens(8, wpm=120), script_max_tokens(8))
+
+    def test_clamps_to_the_routed_model_output_limit(self) -> None:
+        self.assertEqual(4096, output_token_limit("anthropic.claude-3-haiku-20240307-v1:0"))
+        self.assertEqual(8192, output_token_limit("us.anthropic.claude-3-5-haiku-20241022-v1:0"))
+        self.assertEqual(5000, output_token_limit("us.amazon.nova-lite-v1:0"))
+        self.assertEqual(4096, output_token_limit("unknown.model"))
+
+        self.assertEqual(2438, script_max_tokens(8, model_id="us.amazon.nova-micro-v1:0"))
+        with self.assertLogs("podcast_anything.model_routing", level="WARNING") as logs:
+            clamped = script_max_tokens(30, model_id="us.amazon.nova-micro-v1:0")
+        self.assertEqual(5000, clamped)
+        self.assertEqual(5000, logs.records[0].output_token_limit)
+        self.assertEqual(
+            script_max_tokens(30),
+            script_max_tokens(30, model_id="anthropic.claude-3-7-sonnet-20250219-v1:0"),
+        )
+
+
+class LogRouteLatencyTests(unittest.TestCase):
+    def test_logs_route_and_per_token_latency(self) -> None:
+        with self.assertLogs("podcast_anything.model_routing", level="INFO") as logs:
+            log_route_latency(
+                ModelRoute("micro", 8000),
+                job_id="job-1",
+                input_tokens=1200,
+                max_tokens=2438,
+                elapsed_ms=900,
+                output_text="one two three",
+            )
+
+        record = logs.records[0]
+        self.assertEqual("up_to_8000", record.route)
+        self.assertEqual(3, record.output_tokens_estimate)
+        self.assertEqual(300.0, record.ms_per_output_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
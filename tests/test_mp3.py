@@ -0,0 +1,138 @@
+"""Unit tests for frame-level MP3 stitching."""
+
+from __future__ import annotations
+
+import unittest
+from dataclasses import replace
+
+from podcast_anything.mp3 import (
+    Mp3Assembler,
+    assemble_mp3,
+    audio_duration_sec,
+    audio_runs,
+    iter_audio_frames,
+    parse_frame_header,
+    scan_audio,
+    stitch_mp3,
+)
+
+# MPEG-1 Layer III, no CRC, 44.1 kHz, joint stereo; bitrate index in bits 12-15.
+_HEADER_BASE = 0xFFFB0044
+
+
+def _frame(bitrate_index: int = 9, fill: int = 0x11) -> bytes:
+    raw = (_HEADER_BASE | (bitrate_index << 12)).to_bytes(4, "big")
+    header = parse_frame_header(raw)
+    assert header is not None
+    return raw + bytes([fill]) * (header.frame_length - 4)
+
+
+def _xing_frame() -> bytes:
+    frame = bytearray(_frame(fill=0))
+    frame[36:40] = b"Info"
+    return bytes(frame)
+
+
+def _id3v2(payload: bytes = b"\xff\xfb\x90\x44 fake sync in tag") -> bytes:
+    size = len(payload)
+    syncsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + syncsafe + payload
+
+
+def _id3v1() -> bytes:
+    return b"TAG" + bytes(125)
+
+
+def _chunk(frame_count: int, fill: int) -> bytes:
+    return _id3v2() + _xing_frame() + _frame(fill=fill) * frame_count + _id3v1()
+
+
+class ParseFrameHeaderTests(unittest.TestCase):
+    def test_decodes_mpeg1_layer3_frame_length(self) -> None:
+        header = parse_frame_header(_frame())
+
+        self.assertIsNotNone(header)
+        self.assertEqual(128, header.bitrate_kbps)
+        self.assertEqual(44100, header.sample_rate)
+        self.assertEqual(417, header.frame_length)
+
+    def test_rejects_non_layer3_bytes(self) -> None:
+        self.assertIsNone(parse_frame_header(b"\xff\xfd\x90\x44"))
+        self.assertIsNone(parse_frame_header(b"RIFF"))
+
+
+class IterAudioFramesTests(unittest.TestCase):
+    def test_skips_tags_vbr_frames_and_garbage(self) -> None:
+        data = _chunk(3, fill=0x22)
+        garbage = b"\x00\xff\x00\xffjunk"
+
+        frames = list(iter_audio_frames(garbage + data))
+
+        self.assertEqual(3, len(frames))
+        first_audio = len(garbage) + len(_id3v2()) + len(_xing_frame())
+        self.assertEqual(first_audio, frames[0][0])
+
+    def test_audio_runs_are_zero_copy_slices(self) -> None:
+        data = _chunk(2, fill=0x33)
+
+        runs = audio_runs(data)
+
+        self.assertEqual(1, len(runs))
+        self.assertIsInstance(runs[0], memoryview)
+        self.assertIs(data, runs[0].obj)
+        self.assertEqual(_frame(fill=0x33) * 2, bytes(runs[0]))
+
+
+class StitchMp3Tests(unittest.TestCase):
+    def test_writes_one_info_header_and_drops_interior_metadata(self) -> None:
+        stitched = stitch_mp3([_chunk(2, fill=0x44), _chunk(3, fill=0x55)])
+
+        self.assertEqual(1, stitched.count(b"Info"))
+        self.assertNotIn(b"ID3", stitched)
+        self.assertNotIn(b"TAG", stitched)
+        header = parse_frame_header(stitched)
+        self.assertEqual(b"Info", stitched[36:40])
+        self.assertEqual(5, int.from_bytes(stitched[44:48], "big"))
+        self.assertEqual(len(stitched), int.from_bytes(stitched[48:52], "big"))
+        toc = stitched[52:152]
+        self.assertEqual(list(toc), sorted(toc))
+        audio = stitched[header.frame_length :]
+        self.assertEqual(_frame(fill=0x44) * 2 + _frame(fill=0x55) * 3, audio)
+
+    def test_marks_mixed_bitrates_as_xing(self) -> None:
+        stitched = stitch_mp3([_frame(bitrate_index=9), _frame(bitrate_index=11)])
+
+        self.assertEqual(b"Xing", stitched[36:40])
+
+    def test_reports_exact_duration(self) -> None:
+        assembler = Mp3Assembler()
+        assembler.add(_chunk(4, fill=0x66))
+
+        self.assertEqual(4, assembler.frame_count)
+        self.assertAlmostEqual(4 * 1152 / 44100, assembler.duration_sec)
+
+    def test_assembles_prescanned_chunks_without_rescanning(self) -> None:
+        # A rescan of ``data`` would find no frames; only the recorded scan has them.
+        first = replace(scan_audio(_id3v2() + _chunk(2, fill=0x44)), data=b"")
+
+        parts, duration_sec = assemble_mp3([first, _chunk(3, fill=0x55)])
+
+        self.assertAlmostEqual(2 * 1152 / 44100, first.duration_sec)
+        self.assertAlmostEqual(5 * 1152 / 44100, duration_sec)
+        self.assertEqual(stitch_mp3([_chunk(2, fill=0x44), _chunk(3, fill=0x55)]), b"".join(parts))
+        self.assertEqual(([b"pcm"], None), assemble_mp3([scan_audio(b"pcm")]))
+
+    def test_measures_duration_of_stitched_stream(self) -> None:
+        stitched = stitch_mp3([_chunk(2, fill=0x44), _chunk(3, fill=0x55)])
+
+        # The Info header frame carries no audio and is not counted.
+        self.assertAlmostEqual(5 * 1152 / 44100, audio_duration_sec(stitched))
+        self.assertIsNone(audio_duration_sec(b"not audio"))
+
+    def test_falls_back_to_concatenation_for_non_mp3_audio(self) -> None:
+        self.assertEqual(b"chunk-1chunk-2", stitch_mp3([b"chunk-1", b"chunk-2"]))
+        self.assertEqual(b"", stitch_mp3([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
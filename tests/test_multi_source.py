@@ -0,0 +1,166 @@
+"""Unit tests for concurrent multi-source fetching and merging."""
+
+from __future__ import annotations
+
+import base64
+import threading
+import time
+import unittest
+from dataclasses import replace
+from unittest.mock import Mock, patch
+
+from podcast_anything.article import ArticleError, build_session
+from podcast_anything.config import Settings
+from podcast_anything.event_schema import SourceSpec
+from podcast_anything.multi_source import SourceFetchError, fetch_sources, merge_sources
+
+_SETTINGS = Settings(
+    bucket="bucket",
+    region="us-east-1",
+    bedrock_model_id="amazon.nova-lite-v1:0",
+    polly_voice_id="Joanna",
+)
+
+
+@patch("podcast_anything.multi_source.article_cache.fetch_article_text")
+class FetchSourcesTests(unittest.TestCase):
+    def test_reads_sources_concurrently_and_keeps_input_order(self, mock_fetch: Mock) -> None:
+        delays = {"https://a.example/1": 0.2, "https://b.example/2": 0.05}
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(url: str, **_kwargs: object) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(delays[url])
+            with lock:
+                active -= 1
+            return f"text from {url}"
+
+        mock_fetch.side_effect = fetch
+        specs = (
+            SourceSpec(url="https://a.example/1", title="Slow post"),
+            SourceSpec(url="https://b.example/2"),
+            SourceSpec(text="  Pasted notes.  "),
+            SourceSpec(file_name="notes.txt", file_base64=base64.b64encode(b"File.").decode()),
+        )
+
+        started = time.perf_counter()
+        results = fetch_sources(specs, settings=_SETTINGS, bucket="bucket", job_id="job-1")
+        elapsed = time.perf_counter() - started
+
+        # Wall time tracks the slowest source rather than the sum of all of them.
+        self.assertEqual(2, peak)
+        self.assertLess(elapsed, 0.24)
+        self.assertEqual(
+            ["article", "article", "text", "txt"], [result.source_type for result in results]
+        )
+        self.assertEqual("Pasted notes.", results[2].text)
+        self.assertIsNotNone(mock_fetch.call_args.kwargs["session"])
+
+    def test_caps_concurrent_reads(self, mock_fetch: Mock) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fetch(url: str, **_kwargs: object) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return url
+
+        mock_fetch.side_effect = fetch
+        specs = tuple(SourceSpec(url=f"https://example.com/{index}") for index in range(6))
+
+        fetch_sources(
+            specs,
+            settings=replace(_SETTINGS, fetch_max_concurrency=2),
+            bucket="bucket",
+            job_id="job-1",
+        )
+
+        self.assertEqual(2, peak)
+
+    def test_skips_sources_not_read_within_the_fetch_budget(self, mock_fetch: Mock) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch(url: str, **_kwargs: object) -> str:
+            if url.endswith("/slow"):
+                release.wait(timeout=5)
+            return url
+
+        mock_fetch.side_effect = fetch
+        specs = (SourceSpec(url="https://example.com/slow"), SourceSpec(url="https://example.com/ok"))
+
+        started = time.perf_counter()
+        with self.assertLogs("podcast_anything.multi_source", level="WARNING"):
+            results = fetch_sources(
+                specs, settings=replace(_SETTINGS, fetch_budget_sec=1), bucket="bucket", job_id="j"
+            )
+
+        self.assertLess(time.perf_counter() - started, 3)
+        self.assertEqual("Not read within the 1s fetch budget", results[0].error)
+        self.assertEqual("", results[0].text)
+        self.assertEqual(("https://example.com/ok", None), (results[1].text, results[1].error))
+
+    def test_skips_failed_sources_and_raises_when_none_are_readable(
+        self, mock_fetch: Mock
+    ) -> None:
+        mock_fetch.side_effect = ArticleError("HTTP 404")
+        specs = (SourceSpec(url="https://example.com/gone"), SourceSpec(text="Kept."))
+
+        with self.assertLogs("podcast_anything.multi_source", level="WARNING"):
+            results = fetch_sources(specs, settings=_SETTINGS, bucket="bucket", job_id="job-1")
+
+        self.assertEqual("HTTP 404", results[0].error)
+        with self.assertLogs("podcast_anything.multi_source", level="WARNING"):
+            with self.assertRaisesRegex(SourceFetchError, r"\[0\] HTTP 404"):
+                fetch_sources(specs[:1], settings=_SETTINGS, bucket="bucket", job_id="job-1")
+
+
+class MergeSourcesTests(unittest.TestCase):
+    @patch("podcast_anything.multi_source.article_cache.fetch_article_text")
+    def test_marks_sections_and_records_provenance(self, mock_fetch: Mock) -> None:
+        mock_fetch.side_effect = [ArticleError("timed out")]
+        specs = (
+            SourceSpec(text="First body.", title="Notes"),
+            SourceSpec(url="https://example.com/slow"),
+            SourceSpec(url="https://youtu.be/abc123", text="Transcript body."),
+        )
+        with self.assertLogs("podcast_anything.multi_source", level="WARNING"):
+            results = fetch_sources(specs, settings=_SETTINGS, bucket="bucket", job_id="job-1")
+
+        merged, provenance = merge_sources(results)
+
+        self.assertEqual(
+            "[Source 1 of 2: Notes]\nFirst body.\n\n"
+            "[Source 2 of 2: https://youtu.be/abc123]\nTranscript body.",
+            merged,
+        )
+        self.assertEqual([1, None, 2], [record["section"] for record in provenance])
+        self.assertEqual(["text", "url", "url"], [record["kind"] for record in provenance])
+        self.assertEqual("youtube", provenance[2]["source_type"])
+        self.assertEqual("timed out", provenance[1]["error"])
+        self.assertEqual(len("First body."), provenance[0]["char_count"])
+
+
+class BuildSessionTests(unittest.TestCase):
+    def test_bounds_pooled_connections_per_host(self) -> None:
+        session = build_session(3)
+        self.addCleanup(session.close)
+
+        adapter = session.get_adapter("https://example.com/post")
+        self.assertEqual(3, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Unit tests for provider rate limiting and throttle retries."""
+
+from __future__ import annotations
+
+import random
+import unittest
+
+from podcast_anything.rate_limit import (
+    AdaptiveConcurrency,
+    ProviderLimiter,
+    ThrottledError,
+    TokenBucket,
+    TransientError,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_waits_for_refill_once_burst_is_spent(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(0.0, bucket.acquire(10))
+        waited = bucket.acquire(5)
+
+        self.assertAlmostEqual(0.5, waited)
+        self.assertAlmostEqual(0.5, clock.now)
+
+    def test_caps_oversized_requests_at_capacity(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(100, capacity=100, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(0.0, bucket.acquire(5000))
+
+
+class AdaptiveConcurrencyTests(unittest.TestCase):
+    def test_halves_once_per_throttle_burst_and_grows_additively(self) -> None:
+        limiter = AdaptiveConcurrency(8)
+        tickets = [limiter.acquire()[0] for _ in range(4)]
+
+        for ticket in tickets:
+            limiter.release(ticket, throttled=True)
+        self.assertEqual(4, limiter.limit)
+
+        for _ in range(4):
+            ticket, _ = limiter.acquire()
+            limiter.release(ticket, throttled=False)
+        self.assertEqual(5, limiter.limit)
+
+    def test_never_drops_below_minimum(self) -> None:
+        limiter = AdaptiveConcurrency(2, minimum=1)
+        for _ in range(5):
+            ticket, _ = limiter.acquire()
+            limiter.release(ticket, throttled=True)
+
+        self.assertEqual(1, limiter.limit)
+
+
+class ProviderLimiterTests(unittest.TestCase):
+    def _limiter(self, clock: FakeClock, **kwargs) -> ProviderLimiter:
+        return ProviderLimiter(
+            max_concurrency=4,
+            clock=clock,
+            sleep=clock.sleep,
+            rng=random.Random(0),
+            **kwargs,
+        )
+
+    def test_retries_throttles_with_backoff_and_reports_time(self) -> None:
+        clock = FakeClock()
+        limiter = self._limiter(clock, max_attempts=3)
+        outcomes = [ThrottledError("slow down"), ThrottledError("slow down"), "ok"]
+
+        def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual("ok", limiter.call(call))
+        stats = limiter.stats()
+        self.assertEqual(2, stats["throttle_count"])
+        self.assertAlmostEqual(sum(clock.sleeps), stats["throttled_sec"])
+        self.assertLessEqual(clock.sleeps[0], 0.5)
+        self.assertLessEqual(clock.sleeps[1], 1.0)
+        self.assertEqual(2, limiter.concurrency.limit)
+
+    def test_honours_retry_after(self) -> None:
+        clock = FakeClock()
+        limiter = self._limiter(clock)
+        outcomes = [ThrottledError("429", retry_after_sec=3.0), "ok"]
+
+        def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        limiter.call(call)
+
+        self.assertEqual([3.0], clock.sleeps)
+
+    def test_raises_after_max_attempts(self) -> None:
+        clock = FakeClock()
+        limiter = self._limiter(clock, max_attempts=2)
+
+        def call() -> str:
+            raise ThrottledError("slow down")
+
+        with self.assertRaises(ThrottledError):
+            limiter.call(call)
+        self.assertEqual(2, limiter.stats()["throttle_count"])
+        self.assertEqual(1, len(clock.sleeps))
+
+    def test_retries_transient_errors_without_shrinking_concurrency(self) -> None:
+        clock = FakeClock()
+        limiter = self._limiter(clock, max_attempts=3)
+        outcomes = [TransientError("503"), "ok"]
+
+        def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual("ok", limiter.call(call))
+        self.assertEqual(1, limiter.stats()["transient_error_count"])
+        self.assertEqual(0, limiter.stats()["throttle_count"])
+        self.assertEqual(1, len(clock.sleeps))
+        self.assertEqual(4, limiter.concurrency.limit)
+
+    def test_applies_request_and_character_budgets(self) -> None:
+        clock = FakeClock()
+        limiter = self._limiter(clock, requests_per_sec=2, chars_per_sec=1000)
+
+        for _ in range(3):
+            limiter.call(lambda: "ok", chars=600)
+
+        self.assertGreater(limiter.stats()["rate_wait_sec"], 0)
+        self.assertAlmostEqual(clock.now, limiter.stats()["rate_wait_sec"])
+
+
+if __name__ == "__main__":
+    unittest.main()
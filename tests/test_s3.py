@@ -0,0 +1,91 @@
+"""Unit tests for S3 helper utilities."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from podcast_anything.s3 import MultipartUpload
+
+
+class FakeS3Client:
+    """In-memory stand-in for the multipart subset of the S3 client API."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.part_sizes: list[int] = []
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, ContentType: str) -> dict:
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict:
+        self.uploads[UploadId][PartNumber] = Body
+        self.part_sizes.append(len(Body))
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> dict:
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[f"{Bucket}/{Key}"] = b"".join(parts[number] for number in numbers)
+        return {}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> dict:
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+        return {}
+
+
+class MultipartUploadTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fake = FakeS3Client()
+        patcher = patch("podcast_anything.s3._client", return_value=self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_streams_parts_in_order_and_completes(self) -> None:
+        part_size = MultipartUpload.MIN_PART_SIZE
+        chunks = [bytes([index]) * (2 * 1024 * 1024) for index in range(6)]
+
+        with MultipartUpload("bucket", "jobs/j/audio.mp3", "audio/mpeg", part_size) as upload:
+            for chunk in chunks:
+                upload.write(chunk)
+                # Never more than one part plus the incoming chunk is buffered.
+                self.assertLess(len(upload._buffer), part_size)
+
+        self.assertEqual(b"".join(chunks), self.fake.objects["bucket/jobs/j/audio.mp3"])
+        self.assertEqual([part_size, part_size, 2 * 1024 * 1024], self.fake.part_sizes)
+        self.assertEqual(3, upload.part_count)
+        self.assertEqual(12 * 1024 * 1024, upload.bytes_written)
+
+    def test_small_payload_uploads_single_part(self) -> None:
+        with MultipartUpload("bucket", "small.mp3", "audio/mpeg") as upload:
+            upload.write(b"tiny")
+
+        self.assertEqual(b"tiny", self.fake.objects["bucket/small.mp3"])
+        self.assertEqual(1, upload.part_count)
+
+    def test_aborts_when_producer_fails(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, "synthesis failed"):
+            with MultipartUpload("bucket", "broken.mp3", "audio/mpeg") as upload:
+                upload.write(b"partial")
+                raise RuntimeError("synthesis failed")
+
+        self.assertEqual(["upload-1"], self.fake.aborted)
+        self.assertNotIn("bucket/broken.mp3", self.fake.objects)
+
+    def test_rejects_parts_below_s3_minimum(self) -> None:
+        with self.assertRaisesRegex(ValueError, "part_size"):
+            MultipartUpload("bucket", "key", "audio/mpeg", part_size=1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for outline-first script generation."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from podcast_anything.script_outline import (
+    ScriptOutlineError,
+    parse_outline,
+    part_word_budgets,
+    write_outlined_script,
+)
+
+_OUTLINE = {
+    "intro": "Why tide pools matter.",
+    "segments": [
+        {"title": "Zones", "points": ["splash zone", "low zone"]},
+        {"title": "Residents", "points": ["anemones"]},
+    ],
+    "outro": "Visit responsibly.",
+}
+
+
+class ParseOutlineTests(unittest.TestCase):
+    def test_parses_json_inside_code_fence(self) -> None:
+        outline = parse_outline(f"Here it is:\n```json\n{json.dumps(_OUTLINE)}\n```")
+
+        self.assertEqual("Why tide pools matter.", outline.intro)
+        self.assertEqual(("splash zone", "low zone"), outline.segments[0].points)
+        self.assertEqual(4, len(outline.part_briefs()))
+        self.assertIn("Segment 2: Residents\n- anemones", outline.to_text())
+
+    def test_rejects_outline_without_segments(self) -> None:
+        with self.assertRaises(ScriptOutlineError):
+            parse_outline("no json here")
+        with self.assertRaises(ScriptOutlineError):
+            parse_outline(json.dumps({"intro": "Hi.", "segments": [], "outro": "Bye."}))
+
+    def test_splits_word_budget_across_parts(self) -> None:
+        budgets = part_word_budgets(4, 8)
+
+        self.assertEqual(6, len(budgets))
+        self.assertEqual(90, budgets[0])
+        self.assertEqual(budgets[0], budgets[-1])
+        self.assertAlmostEqual(8 * 150, sum(budgets), delta=4)
+
+
+class WriteOutlinedScriptTests(unittest.TestCase):
+    @patch("podcast_anything.script_outline.s3.put_json")
+    @patch("podcast_anything.script_outline.call_bedrock")
+    def test_warms_the_cache_with_one_part_then_writes_the_rest_in_parallel(
+        self, mock_call_bedrock: Mock, mock_put_json: Mock
+    ) -> None:
+        in_flight = 0
+        peak = 0
+        events: list[tuple[str, int]] = []
+        lock = threading.Lock()
+
+        def fake_call(model_id: str, prompt, **kwargs) -> str:
+            nonlocal in_flight, peak
+            if prompt.content.startswith("Style:"):
+                return json.dumps(_OUTLINE)
+            part = int(prompt.content.split()[2])
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                events.append(("start", part))
+            # Later parts finish first, so the join order must not follow completion order.
+            time.sleep(0.01 * (5 - part))
+            with lock:
+                in_flight -= 1
+                events.append(("end", part))
+            return f" Part {part} text. "
+
+        mock_call_bedrock.side_effect = fake_call
+
+        script = write_outlined_script(
+            "Source about tide pools.",
+            bucket="bucket",
+            job_id="job-1",
+            model_id="model",
+            segment_count=2,
+            max_concurrency=4,
+            script_mode="duo",
+            cache_prompt=True,
+        )
+
+        self.assertEqual(
+            "Part 1 text.\n\nPart 2 text.\n\nPart 3 text.\n\nPart 4 text.", script
+        )
+        # Part 1 writes the cached prefix before the remaining three run together.
+        self.assertEqual([("start", 1), ("end", 1)], events[:2])
+        self.assertEqual(3, peak)
+        self.assertEqual(5, mock_call_bedrock.call_count)
+        part_prompts = [
+            call.args[1]
+            for call in mock_call_bedrock.call_args_list
+            if call.args[1].content.startswith("Write part")
+        ]
+        # All parts share one system prefix holding the outline and the source.
+        self.assertEqual(1, len({prompt.system for prompt in part_prompts}))
+        self.assertIn("Segment 1: Zones", part_prompts[0].system)
+        self.assertIn("Source about tide pools.", part_prompts[0].system)
+        # Only the part calls, which share the prefix, mark it for caching.
+        self.assertEqual(
+            [False, True, True, True, True],
+            [call.kwargs["cache_prompt"] for call in mock_call_bedrock.call_args_list],
+        )
+        mock_put_json.assert_called_once_with(
+            "bucket", "jobs/job-1/rewrite/outline.json", _OUTLINE
+        )
+
+        # Without prompt caching there is nothing to warm, so every part starts at once.
+        events.clear()
+        peak = 0
+        write_outlined_script(
+            "Source about tide pools.",
+            bucket="bucket",
+            job_id="job-2",
+            model_id="model",
+            segment_count=2,
+            max_concurrency=4,
+        )
+        self.assertEqual(4, peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unit tests for local duo script repair."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import Mock, patch
+
+from podcast_anything.llm import LLMError
+from podcast_anything.script_repair import (
+    DuoLineNormalizer,
+    ScriptRepairError,
+    normalize_duo_script,
+    repair_duo_script,
+)
+
+
+class NormalizeDuoScriptTests(unittest.TestCase):
+    def test_repairs_label_variants_and_strips_markdown(self) -> None:
+        script = "\n".join(
+            [
+                "```",
+                "# Episode 12: Tide Pools",
+                "**HOST_A**: Welcome to the show.",
+                "[upbeat music]",
+                "- **Host B:** Thanks, great to be here.",
+                "Speaker 1 - It's *really* about the zones.",
+                "",
+                "host_b: Let's dig in.",
+                "```",
+            ]
+        )
+
+        repaired, repaired_lines = normalize_duo_script(script)
+
+        self.assertEqual(
+            "HOST_A: Welcome to the show.\n"
+            "HOST_B: Thanks, great to be here.\n"
+            "HOST_A: It's really about the zones.\n"
+            "\n"
+            "HOST_B: Let's dig in.",
+            repaired,
+        )
+        self.assertEqual(8, repaired_lines)
+
+    def test_maps_speaker_names_in_order_of_appearance(self) -> None:
+        script = "Maya: Hi, I'm Maya.\nDr. Lee: And I'm Lee.\nNote: not a speaker.\nMaya: Onward."
+
+        repaired, _ = normalize_duo_script(script)
+
+        self.assertEqual(
+            "HOST_A: Hi, I'm Maya.\nHOST_B: And I'm Lee.\nNote: not a speaker.\nHOST_A: Onward.",
+            repaired,
+        )
+
+    def test_ignores_name_like_lines_once_host_labels_are_used(self) -> None:
+        normalizer = DuoLineNormalizer()
+
+        self.assertEqual("HOST_A: First point.", normalizer.normalize("HOST_A: First point."))
+        self.assertEqual("Fun fact: it works.", normalizer.normalize("Fun fact: it works."))
+        self.assertIsNone(normalizer.normalize("## Segment 2"))
+
+
+class RepairDuoScriptTests(unittest.TestCase):
+    @patch("podcast_anything.script_repair.call_bedrock")
+    def test_skips_bedrock_when_local_repair_succeeds(self, mock_call_bedrock: Mock) -> None:
+        repaired = repair_duo_script(
+            "Host A: Hi.\nHost B: Hello.", model_id="model", job_id="job-1"
+        )
+
+        self.assertEqual("HOST_A: Hi.\nHOST_B: Hello.", repaired)
+        mock_call_bedrock.assert_not_called()
+
+    @patch("podcast_anything.script_repair.call_bedrock")
+    def test_falls_back_to_bedrock_relabeling(self, mock_call_bedrock: Mock) -> None:
+        mock_call_bedrock.return_value = "HOST_A: Hi there.\nHOST_B: Hello."
+
+        repaired = repair_duo_script("Hi there.\nHello.", model_id="micro", job_id="job-1")
+
+        self.assertEqual("HOST_A: Hi there.\nHOST_B: Hello.", repaired)
+        self.assertEqual("micro", mock_call_bedrock.call_args.args[0])
+        self.assertEqual("Hi there.\nHello.", mock_call_bedrock.call_args.args[1].content)
+
+    @patch("podcast_anything.script_repair.call_bedrock", side_effect=LLMError("no text"))
+    def test_raises_when_no_labels_survive_repair(self, _mock_call_bedrock: Mock) -> None:
+        with self.assertLogs("podcast_anything.script_repair", level="WARNING"):
+            with self.assertRaises(ScriptRepairError):
+                repair_duo_script("Just prose.", model_id="model", job_id="job-1")
+
+        # A one-host script is still voiceable, so it is kept when Bedrock cannot help.
+        with self.assertLogs("podcast_anything.script_repair", level="WARNING"):
+            repaired = repair_duo_script("HOST_A: Solo.", model_id="model", job_id="job-1")
+        self.assertEqual("HOST_A: Solo.", repaired)
+
+
+if __name__ == "__main__":
+    unittest.main()
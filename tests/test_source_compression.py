@@ -0,0 +1,81 @@
+"""Unit tests for extractive source compression."""
+
+from __future__ import annotations
+
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+from podcast_anything import source_compression
+from podcast_anything.source_compression import compress_source, split_sentences
+
+_SOURCE = "\n\n".join(
+    [
+        "Tide pools form where the ocean meets rocky shores. Tide pools hold anemones, "
+        "crabs, and sea stars. Subscribe to our newsletter for more.",
+        "Anemones in tide pools sting small fish. Sea stars in tide pools eat mussels and "
+        "snails. Click here to share this article.",
+        "Tide pools form where the ocean meets rocky shores. Visitors should never remove "
+        "sea stars or crabs from tide pools.",
+    ]
+)
+
+
+class SplitSentencesTests(unittest.TestCase):
+    def test_tracks_paragraphs_and_cuts_unpunctuated_text(self) -> None:
+        sentences = split_sentences("First one. Second one!\n\nThird (aside).")
+        transcript = split_sentences(" ".join(["word"] * 100))
+
+        self.assertEqual(
+            [(0, "First one."), (0, "Second one!"), (1, "Third (aside).")], sentences
+        )
+        self.assertEqual([40, 40, 20], [len(piece.split()) for _, piece in transcript])
+
+
+class CompressSourceTests(unittest.TestCase):
+    def test_keeps_central_sentences_in_order_within_budget(self) -> None:
+        for numpy_module, method in [(None, "centroid"), (source_compression.np, "textrank")]:
+            with self.subTest(method=method), patch.object(source_compression, "np", numpy_module):
+                compressed, stats = compress_source(_SOURCE, 40)
+
+                self.assertEqual(method, stats.method)
+                self.assertLessEqual(stats.output_tokens, 40)
+                self.assertLess(stats.ratio, 0.5)
+                # Boilerplate and the repeated opening sentence are dropped; order is kept.
+                self.assertEqual(
+                    "Tide pools form where the ocean meets rocky shores. Tide pools hold "
+                    "anemones, crabs, and sea stars.\n\n"
+                    "Visitors should never remove sea stars or crabs from tide pools.",
+                    compressed,
+                )
+
+    def test_textrank_memory_stays_linear_for_long_sources(self) -> None:
+        # 6,000 sentences: a dense sentence-similarity matrix alone would be over 130 MiB.
+        sentences = [
+            f"Topic{index % 97} notes mention item{index % 389} and detail{index % 1013} here."
+            for index in range(6000)
+        ]
+        source = "\n\n".join(" ".join(sentences[start : start + 5]) for start in range(0, 6000, 5))
+
+        tracemalloc.start()
+        try:
+            compressed, stats = compress_source(source, 2000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(("textrank", 6000), (stats.method, stats.sentence_count))
+        self.assertLessEqual(stats.output_tokens, 2000)
+        self.assertTrue(compressed)
+        self.assertLess(peak, 48 * 1024 * 1024)
+
+    def test_returns_text_within_budget_unchanged(self) -> None:
+        compressed, stats = compress_source(_SOURCE, 10_000)
+
+        self.assertEqual(_SOURCE, compressed)
+        self.assertEqual("none", stats.method)
+        self.assertEqual(1.0, stats.ratio)
+
+
+if __name__ == "__main__":
+    unittest.main()
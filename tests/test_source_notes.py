@@ -0,0 +1,104 @@
+"""Unit tests for map-reduce condensation of long sources."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from podcast_anything.llm import estimate_tokens
+from podcast_anything.source_notes import condense_source, split_source_sections
+
+
+class SplitSourceSectionsTests(unittest.TestCase):
+    def test_keeps_short_sources_whole(self) -> None:
+        self.assertEqual(["One paragraph."], split_source_sections("  One paragraph.\n", 100))
+        self.assertEqual([], split_source_sections("   ", 100))
+
+    def test_splits_at_paragraphs_within_token_budget(self) -> None:
+        paragraphs = [f"Paragraph {index} has a few words in it." for index in range(30)]
+        text = "\n\n".join(paragraphs)
+
+        sections = split_source_sections(text, 100)
+
+        self.assertGreater(len(sections), 1)
+        self.assertTrue(all(estimate_tokens(section) <= 100 for section in sections))
+        self.assertEqual(" ".join(text.split()), " ".join(" ".join(sections).split()))
+        self.assertTrue(all(section.endswith(".") for section in sections))
+
+
+class CondenseSourceTests(unittest.TestCase):
+    @patch("podcast_anything.source_notes.s3.put_text")
+    @patch("podcast_anything.source_notes.s3.get_bytes_if_exists")
+    @patch("podcast_anything.source_notes.call_bedrock")
+    def test_condenses_sections_in_parallel_and_reuses_stored_notes(
+        self, mock_call_bedrock: Mock, mock_get: Mock, mock_put_text: Mock
+    ) -> None:
+        text = "\n\n".join(
+            f"Part {index} body sentence here. " + "More detail follows here. " * 5
+            for index in range(6)
+        )
+        sections = split_source_sections(text, 40)
+        self.assertGreater(len(sections), 2)
+        stored = {}
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_get(bucket: str, key: str):
+            if key in stored:
+                return stored[key].encode(), datetime.now(timezone.utc)
+            return None
+
+        def fake_put(bucket: str, key: str, body: str) -> None:
+            stored[key] = body
+
+        def fake_call(model_id: str, prompt: str, **kwargs) -> str:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return f"notes for {prompt.content.split('Section ')[-1].split('/')[0]}"
+
+        mock_get.side_effect = fake_get
+        mock_put_text.side_effect = fake_put
+        mock_call_bedrock.side_effect = fake_call
+
+        notes = condense_source(
+            text,
+            bucket="bucket",
+            job_id="job-1",
+            model_id="model",
+            max_section_tokens=40,
+            max_concurrency=2,
+        )
+
+        self.assertEqual(len(sections), mock_call_bedrock.call_count)
+        self.assertEqual(2, peak)
+        self.assertTrue(all(key.startswith("jobs/job-1/rewrite/notes/") for key in stored))
+        expected = "\n\n".join(
+            f"Section {index} notes:\nnotes for {index}" for index in range(1, len(sections) + 1)
+        )
+        self.assertEqual(expected, notes)
+
+        mock_call_bedrock.reset_mock()
+        again = condense_source(
+            text,
+            bucket="bucket",
+            job_id="job-1",
+            model_id="model",
+            max_section_tokens=40,
+            max_concurrency=2,
+        )
+
+        mock_call_bedrock.assert_not_called()
+        self.assertEqual(notes, again)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,82 @@
 
 from __future__ import annotations
 
+import random
+import tempfile
+import threading
+import time
 import unittest
 from io import BytesIO
 from unittest.mock import Mock, patch
 
 import requests
+from botocore.exceptions import ClientError, EndpointConnectionError
 
-from podcast_anything.tts import TTSError, synthesize_speech
+from podcast_anything import tts
+from podcast_anything.cache import CacheError, LocalDiskCache
+from podcast_anything.rate_limit import ProviderLimiter
+from podcast_anything.tts import (
+    TTSError,
+    iter_speech_chunks,
+    split_text_for_tts,
+    synthesize_speech,
+)
+
+
+class SplitTextForTtsTests(unittest.TestCase):
+    def test_balances_chunk_sizes_instead_of_leaving_a_short_tail(self) -> None:
+        text = "This sentence has a handful of words. " * 70
+
+        chunks = split_text_for_tts(text, max_text_chars=2500)
+
+        self.assertEqual(2, len(chunks))
+        self.assertLess(abs(len(chunks[0]) - len(chunks[1])), 200)
+        for chunk in chunks:
+            self.assertTrue(chunk.endswith("."))
+
+    def test_never_uses_more_chunks_than_greedy_filling(self) -> None:
+        rng = random.Random(3)
+        words = "a host explains how sound travels through cables and air".split()
+        sentences = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(4, 30))).capitalize()
+            + rng.choice([".", ".", "?", ";", ","])
+            for _ in range(2000)
+        ]
+        text = " ".join(sentences)
+
+        greedy_count = 0
+        remaining = text
+        while remaining:
+            split_at = len(remaining) if len(remaining) <= 300 else remaining.rfind(" ", 0, 301)
+            greedy_count += 1
+            remaining = remaining[split_at:].lstrip()
+
+        chunks = split_text_for_tts(text, max_text_chars=300)
+
+        self.assertLessEqual(len(chunks), greedy_count)
+        self.assertTrue(all(len(chunk) <= 300 for chunk in chunks))
+
+    def test_prefers_line_and_sentence_boundaries_over_spaces(self) -> None:
+        first = "word " * 25 + "end of the first paragraph."
+        second = "Another line follows, with a comma " + "word " * 20 + "done."
+        text = f"{first}\n{second}"
+
+        chunks = split_text_for_tts(text, max_text_chars=200)
+
+        self.assertEqual([first, second], chunks)
+
+    def test_never_exceeds_limit_and_preserves_words(self) -> None:
+        text = " ".join(f"w{i}" + ("." if i % 17 == 0 else "") for i in range(5000))
+
+        chunks = split_text_for_tts(text, max_text_chars=300)
+
+        self.assertTrue(all(len(chunk) <= 300 for chunk in chunks))
+        self.assertEqual(text.split(), " ".join(chunks).split())
+
+    def test_hard_splits_unbroken_text_evenly(self) -> None:
+        chunks = split_text_for_tts("x" * 450, max_text_chars=200)
+
+        self.assertEqual([150, 150, 150], [len(chunk) for chunk in chunks])
 
 
 class SynthesizeSpeechTests(unittest.TestCase):
@@ -43,6 +112,91 @@ class SynthesizeSpeechTests(unittest.TestCase):
             self.assertLessEqual(len(call.kwargs["Text"]), 2000)
             self.assertEqual("text", call.kwargs["TextType"])
 
+    @patch("podcast_anything.tts.boto3.client")
+    def test_concurrent_chunks_are_reassembled_in_order(self, mock_boto_client: Mock) -> None:
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_synthesize(**kwargs: str) -> dict[str, BytesIO]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            marker = kwargs["Text"].split(" ", 1)[0]
+            # Earlier chunks finish last so completion order differs from input order.
+            time.sleep(0.02 * (6 - int(marker[1:])))
+            with lock:
+                active -= 1
+            return {"AudioStream": BytesIO(marker.encode("ascii"))}
+
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.side_effect = fake_synthesize
+        mock_boto_client.return_value = mock_polly
+        text = "\n".join(f"c{index} " + "word " * 30 for index in range(6))
+
+        audio = synthesize_speech(text, voice_id="Joanna", max_text_chars=154, max_concurrency=3)
+
+        self.assertEqual(b"c0c1c2c3c4c5", audio)
+        self.assertEqual(6, mock_polly.synthesize_speech.call_count)
+        self.assertLessEqual(peak, 3)
+        self.assertGreater(peak, 1)
+
+    @patch("podcast_anything.tts.boto3.client")
+    def test_cache_hits_skip_provider_requests(self, mock_boto_client: Mock) -> None:
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.side_effect = lambda **_: {"AudioStream": BytesIO(b"fresh")}
+        mock_boto_client.return_value = mock_polly
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = LocalDiskCache(cache_dir)
+
+            first = synthesize_speech("cached text", voice_id="Joanna", cache=cache)
+            with self.assertLogs("podcast_anything.tts", level="INFO") as logs:
+                second = synthesize_speech("cached text", voice_id="Joanna", cache=cache)
+            synthesize_speech("cached text", voice_id="Matthew", cache=cache)
+
+        self.assertEqual(b"fresh", first)
+        self.assertEqual(b"fresh", second)
+        # The second call is served from cache; a different voice is a distinct key.
+        self.assertEqual(2, mock_polly.synthesize_speech.call_count)
+        completed = next(r for r in logs.records if r.getMessage() == "Completed Polly synthesis")
+        self.assertEqual(1, completed.cache_hits)
+        self.assertEqual(0, completed.cache_misses)
+
+    @patch("podcast_anything.tts.boto3.client")
+    def test_cache_failures_fall_back_to_provider(self, mock_boto_client: Mock) -> None:
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.return_value = {"AudioStream": BytesIO(b"audio")}
+        mock_boto_client.return_value = mock_polly
+        cache = Mock()
+        cache.get.side_effect = CacheError("read failed")
+        cache.put.side_effect = CacheError("write failed")
+
+        audio = synthesize_speech("text", voice_id="Joanna", cache=cache)
+
+        self.assertEqual(b"audio", audio)
+        mock_polly.synthesize_speech.assert_called_once()
+
+    @patch("podcast_anything.tts.boto3.client")
+    def test_iter_speech_chunks_yields_audio_per_chunk(self, mock_boto_client: Mock) -> None:
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.side_effect = [
+            {"AudioStream": BytesIO(b"part-1")},
+            {"AudioStream": BytesIO(b"part-2")},
+        ]
+        mock_boto_client.return_value = mock_polly
+
+        chunks = iter_speech_chunks("Sentence. " * 30, voice_id="Joanna", max_text_chars=200)
+
+        self.assertEqual(b"part-1", next(chunks))
+        self.assertEqual(1, mock_polly.synthesize_speech.call_count)
+        self.assertEqual([b"part-2"], list(chunks))
+
+    def test_rejects_non_positive_max_concurrency(self) -> None:
+        with self.assertRaisesRegex(TTSError, "max_concurrency"):
+            with patch("podcast_anything.tts.boto3.client"):
+                synthesize_speech("hello", voice_id="Joanna", max_concurrency=0)
+
     @patch("podcast_anything.tts.boto3.client")
     def test_raises_when_audio_stream_missing(self, mock_boto_client: Mock) -> None:
         mock_polly = Mock()
@@ -52,6 +206,60 @@ class SynthesizeSpeechTests(unittest.TestCase):
         with self.assertRaisesRegex(TTSError, "AudioStream"):
             synthesize_speech("short text", voice_id="Joanna", max_text_chars=500)
 
+    @patch("podcast_anything.tts.boto3.client")
+    def test_polly_throttles_are_retried_through_rate_limiter(
+        self, mock_boto_client: Mock
+    ) -> None:
+        throttle = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "SynthesizeSpeech",
+        )
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.side_effect = [
+            throttle,
+            {"AudioStream": BytesIO(b"audio-after-retry")},
+        ]
+        mock_boto_client.return_value = mock_polly
+        sleeps: list[float] = []
+        limiter = ProviderLimiter(max_concurrency=2, sleep=sleeps.append)
+
+        audio = synthesize_speech(
+            "short text", voice_id="Joanna", max_text_chars=500, rate_limiter=limiter
+        )
+
+        self.assertEqual(b"audio-after-retry", audio)
+        self.assertEqual(2, mock_polly.synthesize_speech.call_count)
+        self.assertEqual(1, len(sleeps))
+        self.assertEqual(1, limiter.stats()["throttle_count"])
+
+    @patch("podcast_anything.tts.boto3.client")
+    def test_polly_server_and_connection_errors_are_retried(
+        self, mock_boto_client: Mock
+    ) -> None:
+        server_error = ClientError(
+            {
+                "Error": {"Code": "ServiceFailure", "Message": "Internal error"},
+                "ResponseMetadata": {"HTTPStatusCode": 500},
+            },
+            "SynthesizeSpeech",
+        )
+        mock_polly = Mock()
+        mock_polly.synthesize_speech.side_effect = [
+            server_error,
+            EndpointConnectionError(endpoint_url="https://polly.us-east-1.amazonaws.com"),
+            {"AudioStream": BytesIO(b"audio-after-retry")},
+        ]
+        mock_boto_client.return_value = mock_polly
+        limiter = ProviderLimiter(max_concurrency=2, sleep=lambda _delay: None)
+
+        audio = synthesize_speech(
+            "short text", voice_id="Joanna", max_text_chars=500, rate_limiter=limiter
+        )
+
+        self.assertEqual(b"audio-after-retry", audio)
+        self.assertEqual(2, limiter.stats()["transient_error_count"])
+        self.assertEqual(0, limiter.stats()["throttle_count"])
+
     def test_raises_when_text_is_empty(self) -> None:
         with self.assertRaisesRegex(TTSError, "empty"):
             synthesize_speech("   ", voice_id="Joanna")
@@ -83,10 +291,11 @@ class SynthesizeSpeechTests(unittest.TestCase):
         with self.assertRaisesRegex(TTSError, "Unsupported TTS provider"):
             synthesize_speech("hello", voice_id="Joanna", provider="unknown")
 
-    @patch("podcast_anything.tts.requests.post")
-    def test_elevenlabs_mode_calls_http_api(self, mock_post: Mock) -> None:
-        response = Mock(status_code=200, content=b"chunk", text="")
-        mock_post.return_value = response
+    @patch("podcast_anything.tts._elevenlabs_session")
+    def test_elevenlabs_mode_calls_http_api(self, mock_session_factory: Mock) -> None:
+        mock_session = Mock()
+        mock_session.post.return_value = Mock(status_code=200, content=b"chunk", text="")
+        mock_session_factory.return_value = mock_session
         text = "Sentence one. " * 20
 
         audio = synthesize_speech(
@@ -99,6 +308,7 @@ class SynthesizeSpeechTests(unittest.TestCase):
             elevenlabs_model_id="eleven_multilingual_v2",
         )
 
+        mock_post = mock_session.post
         self.assertGreater(mock_post.call_count, 1)
         self.assertEqual(b"chunk" * mock_post.call_count, audio)
         call_kwargs = mock_post.call_args.kwargs
@@ -106,9 +316,55 @@ class SynthesizeSpeechTests(unittest.TestCase):
         self.assertEqual("test-key", call_kwargs["headers"]["xi-api-key"])
         self.assertEqual("eleven_multilingual_v2", call_kwargs["json"]["model_id"])
 
-    @patch("podcast_anything.tts.requests.post")
-    def test_elevenlabs_wraps_request_exceptions(self, mock_post: Mock) -> None:
-        mock_post.side_effect = requests.RequestException("network issue")
+    @patch("podcast_anything.tts._elevenlabs_session")
+    def test_elevenlabs_dispatches_chunks_concurrently(self, mock_session_factory: Mock) -> None:
+        def fake_post(endpoint: str, **kwargs: object) -> Mock:
+            marker = kwargs["json"]["text"].split(" ", 1)[0]  # type: ignore[index]
+            time.sleep(0.02 * (4 - int(marker[1:])))
+            return Mock(status_code=200, content=marker.encode("ascii"), text="")
+
+        mock_session = Mock()
+        mock_session.post.side_effect = fake_post
+        mock_session_factory.return_value = mock_session
+        text = "\n".join(f"c{index} " + "word " * 30 for index in range(4))
+
+        audio = synthesize_speech(
+            text,
+            voice_id="voice-id",
+            provider="elevenlabs",
+            max_text_chars=154,
+            elevenlabs_api_key="test-key",
+            max_concurrency=4,
+        )
+
+        self.assertEqual(b"c0c1c2c3", audio)
+        mock_session_factory.assert_called_once_with(4)
+
+    def test_elevenlabs_session_is_reused_and_pool_grows(self) -> None:
+        with patch("podcast_anything.tts._elevenlabs_shared_session", None), patch(
+            "podcast_anything.tts._elevenlabs_pool_size", 0
+        ):
+            first = tts._elevenlabs_session(2)
+            url = "https://api.elevenlabs.io/v1/text-to-speech/voice"
+            first_adapter = first.get_adapter(url)
+            with patch.object(first_adapter, "close", wraps=first_adapter.close) as mock_close:
+                second = tts._elevenlabs_session(6)
+                tts._elevenlabs_session(4)
+            adapter = second.get_adapter(url)
+
+        self.assertIs(first, second)
+        self.assertEqual(6, adapter._pool_maxsize)
+        # The replaced adapter's pool is closed once; a smaller request keeps the pool as is.
+        mock_close.assert_called_once_with()
+        self.assertEqual(
+            1, sum(prefix.startswith("https://api.elevenlabs") for prefix in second.adapters)
+        )
+
+    @patch("podcast_anything.tts._elevenlabs_session")
+    def test_elevenlabs_wraps_request_exceptions(self, mock_session_factory: Mock) -> None:
+        mock_session_factory.return_value.post.side_effect = requests.RequestException(
+            "network issue"
+        )
 
         with self.assertRaisesRegex(TTSError, "network issue"):
             synthesize_speech(
@@ -118,6 +374,44 @@ class SynthesizeSpeechTests(unittest.TestCase):
                 elevenlabs_api_key="test-key",
             )
 
+    @patch("podcast_anything.tts._elevenlabs_session")
+    def test_elevenlabs_429_raises_tts_error_after_retries(
+        self, mock_session_factory: Mock
+    ) -> None:
+        throttled = Mock(status_code=429, text="too_many_concurrent_requests")
+        throttled.headers = {"Retry-After": "2"}
+        mock_session_factory.return_value.post.return_value = throttled
+        sleeps: list[float] = []
+        limiter = ProviderLimiter(max_concurrency=1, max_attempts=3, sleep=sleeps.append)
+
+        with self.assertRaisesRegex(TTSError, "throttled chunk 0 after 3 attempts"):
+            synthesize_speech(
+                "hello world",
+                voice_id="voice-id",
+                provider="elevenlabs",
+                elevenlabs_api_key="test-key",
+                rate_limiter=limiter,
+            )
+        self.assertEqual([2.0, 2.0], sleeps)
+
+    @patch("podcast_anything.tts._elevenlabs_session")
+    def test_elevenlabs_server_errors_are_retried(self, mock_session_factory: Mock) -> None:
+        unavailable = Mock(status_code=503, text="busy")
+        ok = Mock(status_code=200, content=b"audio")
+        mock_session_factory.return_value.post.side_effect = [unavailable, ok]
+        limiter = ProviderLimiter(max_concurrency=1, sleep=lambda _delay: None)
+
+        audio = synthesize_speech(
+            "hello world",
+            voice_id="voice-id",
+            provider="elevenlabs",
+            elevenlabs_api_key="test-key",
+            rate_limiter=limiter,
+        )
+
+        self.assertEqual(b"audio", audio)
+        self.assertEqual(1, limiter.stats()["transient_error_count"])
+
     def test_elevenlabs_requires_api_key(self) -> None:
         with self.assertRaisesRegex(TTSError, "API key is required"):
             synthesize_speech(
@@ -0,0 +1,52 @@
+"""Unit tests for per-voice speaking rate calibration."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from podcast_anything.voice_pace import (
+    CALIBRATION_KEY,
+    VoicePaceMeter,
+    estimate_duration_sec,
+    update_calibration,
+)
+
+
+class VoicePaceMeterTests(unittest.TestCase):
+    def test_reports_words_per_minute_per_voice(self) -> None:
+        meter = VoicePaceMeter()
+        meter.record("polly/Amy", 25, 10.0)
+        meter.record("polly/Amy", 25, 10.0)
+        meter.record("polly/Matthew", 2, 1.0)
+
+        # Matthew's one-second sample is too short to measure pace reliably.
+        self.assertEqual({"polly/Amy": 150.0}, meter.measured_wpm())
+
+    def test_estimates_duration_from_wpm(self) -> None:
+        self.assertEqual(2, estimate_duration_sec("one two three four five"))
+        self.assertEqual(5, estimate_duration_sec("one two three four five", wpm=60))
+
+
+class UpdateCalibrationTests(unittest.TestCase):
+    @patch("podcast_anything.voice_pace.s3.put_json")
+    @patch("podcast_anything.voice_pace.s3.get_bytes_if_exists")
+    def test_blends_measurement_into_stored_average(
+        self, mock_get: Mock, mock_put_json: Mock
+    ) -> None:
+        stored = {"voices": {"polly/Amy": {"wpm": 140.0}}}
+        mock_get.return_value = (json.dumps(stored).encode(), datetime.now(timezone.utc))
+
+        calibration = update_calibration("bucket", {"polly/Amy": 160.0, "polly/Joey": 170.0})
+
+        self.assertAlmostEqual(146.0, calibration["polly/Amy"])
+        self.assertEqual(170.0, calibration["polly/Joey"])
+        bucket, key, payload = mock_put_json.call_args.args
+        self.assertEqual(("bucket", CALIBRATION_KEY), (bucket, key))
+        self.assertEqual({"wpm": 146.0}, payload["voices"]["polly/Amy"])
+
+
+if __name__ == "__main__":
+    unittest.main()